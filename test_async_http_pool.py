@@ -0,0 +1,159 @@
+"""
+표준 라이브러리 keep-alive 연결 풀(AsyncHttpConnectionPool) 테스트
+응답 파싱(Content-Length, chunked), 연결 재사용, 끊긴 연결 재시도 규칙과
+모의 서버를 이용한 비동기 REST 발행을 확인합니다.
+
+    python -m pytest test_async_http_pool.py
+"""
+
+import asyncio
+import tempfile
+
+from wordpress_auto_login import AsyncHttpConnectionPool, AsyncWordPressRestPublisher
+from wordpress_mock_server import MockWordPressServer
+from test_publish_flow import APP_PASSWORD, close_app, make_app, write_file
+
+
+async def read_request(reader):
+    """요청 줄과 헤더, 본문을 읽어 요청 줄을 반환합니다. 연결이 닫혔으면 None입니다."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    length = 0
+    while True:
+        line = (await reader.readline()).strip()
+        if not line:
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    if length:
+        await reader.readexactly(length)
+    return request_line.decode('latin-1').split(' ')[0]
+
+
+def run_with_server(handler, scenario):
+    """handler로 응답하는 서버를 띄우고 scenario(pool, url)의 결과와 서버 연결 수를 반환합니다."""
+    async def main():
+        connections = []
+
+        async def handle(reader, writer):
+            connections.append(writer)
+            try:
+                await handler(reader, writer, len(connections))
+            except ConnectionError:
+                pass
+            finally:
+                writer.close()
+
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        pool = AsyncHttpConnectionPool(url, size=1)
+        try:
+            result = await scenario(pool, url)
+        finally:
+            await pool.close()
+            server.close()
+            await server.wait_closed()
+        return result, len(connections)
+    return asyncio.run(main())
+
+
+async def ok_responses(reader, writer, connection_no):
+    """Content-Length 응답과 chunked 응답을 번갈아 보내며 연결을 유지합니다."""
+    count = 0
+    while await read_request(reader):
+        count += 1
+        if count % 2:
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhello")
+        else:
+            writer.write(b"HTTP/1.1 201 Created\r\nTransfer-Encoding: chunked\r\n\r\n"
+                         b"3;ext=1\r\nabc\r\n4\r\ndefg\r\n0\r\nX-Trailer: 1\r\n\r\n")
+        await writer.drain()
+
+
+def test_parses_length_and_chunked_responses_on_one_connection():
+    """Content-Length와 chunked(확장, trailer 포함) 응답을 읽고 같은 연결을 계속 씁니다."""
+    async def scenario(pool, url):
+        return [await pool.request("GET", url + "/a", {}) for _ in range(4)], pool.opened
+
+    (responses, opened), connections = run_with_server(ok_responses, scenario)
+    assert responses == [(200, 'OK', b'hello'), (201, 'Created', b'abcdefg')] * 2
+    assert opened == 1 and connections == 1
+
+
+async def close_second_request(reader, writer, connection_no):
+    """첫 요청에만 응답하고, 같은 연결의 두 번째 요청은 응답 없이 닫습니다. (쉬는 연결을 닫은 서버)"""
+    handled = 0
+    while await read_request(reader):
+        handled += 1
+        if handled == 2:
+            return
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+        await writer.drain()
+
+
+def test_get_on_stale_connection_is_retried_once():
+    """다시 쓴 연결이 빈 응답으로 끊기면 GET은 새 연결로 다시 보냅니다."""
+    async def scenario(pool, url):
+        return [await pool.request("GET", url + "/a", {}) for _ in range(2)]
+
+    responses, connections = run_with_server(close_second_request, scenario)
+    assert responses == [(200, 'OK', b'ok')] * 2
+    assert connections == 2
+
+
+def test_post_sent_on_stale_connection_is_not_resent():
+    """요청을 보낸 뒤 끊긴 POST는 중복 발행을 막기 위해 다시 보내지 않고 오류로 알립니다."""
+    async def scenario(pool, url):
+        await pool.request("POST", url + "/a", {}, b"{}")
+        try:
+            await pool.request("POST", url + "/a", {}, b"{}")
+        except ConnectionError:
+            return pool.opened
+        return None
+
+    opened, connections = run_with_server(close_second_request, scenario)
+    assert opened == 1 and connections == 1
+
+
+def test_async_publish_records_every_post():
+    """비동기 REST 발행이 모든 글을 발행하고, 발행 기록 덕분에 다시 실행하면 보낼 글이 없습니다."""
+    with tempfile.TemporaryDirectory() as directory, MockWordPressServer() as server:
+        write_file(directory, "posts.jsonl",
+                   "".join(f'{{"title": "글 {i}", "content": "본문 {i}"}}\n' for i in range(20)))
+        app = make_app(server, directory)
+        publisher = AsyncWordPressRestPublisher(server.url, "admin", APP_PASSWORD, concurrency=3)
+
+        results = asyncio.run(app._publish_entries_async(app.get_pending_post_entries(), publisher))
+        assert len(results) == 20 and all(results)
+        assert sorted(post["title"] for post in server.state.posts.values()) == sorted(f"글 {i}" for i in range(20))
+        assert len(app.get_pending_post_entries()) == 0
+        close_app(app)
+
+
+def test_async_publish_respects_publish_concurrency():
+    """연결이 더 많아도 동시에 보내는 발행 요청은 사이트별 동시 발행 수(publish_concurrency)를 넘지 않습니다."""
+    with tempfile.TemporaryDirectory() as directory, MockWordPressServer(api_latency=0.02) as server:
+        write_file(directory, "posts.jsonl",
+                   "".join(f'{{"title": "글 {i}", "content": "본문 {i}"}}\n' for i in range(12)))
+        app = make_app(server, directory)
+        app.publish_rate_per_minute = 0
+        app.publish_concurrency = 2
+        publisher = AsyncWordPressRestPublisher(server.url, "admin", APP_PASSWORD, concurrency=6)
+        original = publisher.create_post_async
+        in_flight = [0, 0]  # 현재, 최대
+
+        async def create_post_async(*args, **kwargs):
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                in_flight[0] -= 1
+
+        publisher.create_post_async = create_post_async
+        results = asyncio.run(app._publish_entries_async(app.get_pending_post_entries(), publisher))
+        assert len(results) == 12 and all(results)
+        assert in_flight[1] == 2
+        close_app(app)
@@ -0,0 +1,66 @@
+"""
+본문 이미지 업로드(MediaUploader) 테스트
+로컬 이미지 판별, 모의 서버 업로드 후 src 치환, 발행 기록을 통한 재사용을 확인합니다.
+
+    python -m pytest test_media_upload.py
+"""
+
+import os
+import tempfile
+
+from wordpress_auto_login import MediaUploader, PublishLedger, RunLog, WordPressAutoLogin, WordPressRestPublisher
+from wordpress_mock_server import MockWordPressServer
+
+APP_PASSWORD = "abcd efgh ijkl mnop qrst uvwx"
+
+
+def test_only_real_local_paths_are_local():
+    """상대 경로·file:·드라이브 경로만 로컬이고, 사이트 기준 경로와 ?·#로 시작하는 값은 그대로 둡니다."""
+    for src in ("images/a.png", "./a.png", "../a.png", "a b.png", "file:///C:/img/a.png", "C:\\img\\a.png"):
+        assert MediaUploader.is_local_source(src), src
+    for src in ("/wp-content/uploads/2024/01/a.png", "?attachment_id=3", "#top", "//cdn.example.com/a.png",
+                "https://example.com/a.png", "data:image/png;base64,AAAA", ""):
+        assert not MediaUploader.is_local_source(src), src
+
+
+def test_localize_uploads_once_and_rewrites_only_local_sources():
+    """로컬 이미지만 올려 주소를 바꾸고, 같은 내용의 이미지는 다음 글에서 발행 기록으로 재사용합니다."""
+    with tempfile.TemporaryDirectory() as directory, MockWordPressServer() as server:
+        with open(os.path.join(directory, "a.png"), 'wb') as f:
+            f.write(b"png-bytes")
+        ledger = PublishLedger(os.path.join(directory, "ledger.sqlite3"))
+        publisher = WordPressRestPublisher(server.url, "admin", APP_PASSWORD)
+        uploader = MediaUploader(publisher, ledger, "site", log=lambda message: None)
+        content = ('<img src="a.png"><img src="/wp-content/uploads/old.png">'
+                   '<img src="?attachment_id=3"><img src="#x">')
+
+        localized, uploaded, reused = uploader.localize(content, directory)
+        assert (uploaded, reused) == (1, 0)
+        assert 'src="a.png"' not in localized
+        assert f'src="{server.url}/wp-content/uploads/mock/' in localized
+        for src in ("/wp-content/uploads/old.png", "?attachment_id=3", "#x"):
+            assert f'src="{src}"' in localized
+
+        again, uploaded, reused = uploader.localize('<img src="./a.png">', directory)
+        assert (uploaded, reused) == (0, 1)
+        assert server.stats()["media"] == 1
+        ledger.close()
+
+
+def test_root_relative_image_does_not_fail_publish():
+    """사이트 기준 경로 이미지만 있는 글은 업로드 없이 그대로 발행됩니다."""
+    with tempfile.TemporaryDirectory() as directory, MockWordPressServer() as server:
+        with open(os.path.join(directory, "post.txt"), 'w', encoding='utf-8') as f:
+            f.write('제목\n\n<img src="/wp-content/uploads/2024/01/a.png">\n')
+        app = WordPressAutoLogin.headless(server.url, "admin", "password", directory, app_password=APP_PASSWORD,
+                                          run_log=RunLog(os.path.join(directory, "run.jsonl")))
+        app.ledger = PublishLedger(os.path.join(directory, "ledger.sqlite3"))
+        publisher = WordPressRestPublisher(server.url, "admin", APP_PASSWORD)
+
+        results = app.publish_entries_via_rest(app.get_pending_post_entries(), publisher)
+        assert len(results) == 1 and results[0]
+        post = server.state.posts[int(results[0])]
+        assert post["content"] == '<img src="/wp-content/uploads/2024/01/a.png">'
+        assert server.stats()["media"] == 0
+        app.ledger.close()
+        app.run_log.close()
@@ -0,0 +1,95 @@
+"""
+글 파일 파서(iter_post_file) 테스트
+기존 3줄 형식, front matter 묶음 파일, JSON Lines를 읽는 결과와 발행 기록 해시 호환성을 확인합니다.
+
+    python -m pytest test_post_parser.py
+"""
+
+import hashlib
+import os
+import tempfile
+from datetime import datetime, timezone
+
+from wordpress_auto_login import file_content_hash, iter_post_file
+
+
+def read_posts(name, text):
+    """임시 파일에 text를 쓰고 (글 목록, 로그 목록, 파일 해시)를 반환합니다."""
+    logs = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, name)
+        with open(path, 'wb') as f:
+            f.write(text.encode('utf-8'))
+        posts = list(iter_post_file(path, log=logs.append))
+        return posts, logs, file_content_hash(path)
+
+
+def test_legacy_file_keeps_whole_file_hash():
+    """기존 형식은 예전과 같은 제목/본문을 읽고, 해시가 파일 전체 해시와 같아 이전 발행 기록과 맞습니다."""
+    posts, logs, file_hash = read_posts("post.txt", "제목\n\n<p>본문</p>\n둘째 줄\n")
+    assert posts == [(file_hash, "제목", "<p>본문</p>\n둘째 줄", {"line": 1})]
+    assert logs == []
+
+
+def test_legacy_file_without_title_or_body_is_skipped():
+    """제목이나 본문이 비어 있는 기존 형식 파일은 빈 글로 발행하지 않고 건너뜁니다."""
+    for text in ("제목\n\n\n", "\n\n본문\n", "제목\n"):
+        posts, logs, _ = read_posts("post.txt", text)
+        assert posts == []
+        assert len(logs) == 1
+
+
+def test_single_front_matter_post_hashes_like_file():
+    """글이 하나뿐인 front matter 파일도 해시가 파일 전체 해시와 같습니다."""
+    text = "---\ntitle: 하나\nslug: one\n---\n본문\n"
+    posts, _, file_hash = read_posts("post.md", text)
+    assert [(post[0], post[1], post[2]) for post in posts] == [(file_hash, "하나", "본문")]
+    assert posts[0][3] == {"slug": "one", "line": 1}
+
+
+def test_bundle_splits_posts_and_reads_settings():
+    """묶음 파일은 머리말마다 글을 나누고, 글 해시는 그 글의 원본 바이트 해시입니다."""
+    first = ("---\ntitle: \"첫 글: 소개\"\nstatus: draft\ncategories: [뉴스, 공지]\n"
+             "tags:\n  - 파이썬\n  - wordpress\ndate: 2030-01-02T09:00:00+09:00\n---\n첫 본문\n")
+    second = "---\ntitle: 둘째\n---\n둘째 본문\n"
+    posts, logs, _ = read_posts("bundle.md", first + second)
+    assert logs == []
+    assert [post[1] for post in posts] == ["첫 글: 소개", "둘째"]
+    assert posts[0][0] == hashlib.sha256(first.encode('utf-8')).hexdigest()
+    assert posts[1][0] == hashlib.sha256(second.encode('utf-8')).hexdigest()
+    assert posts[0][3] == {
+        "status": "draft",
+        "categories": ["뉴스", "공지"],
+        "tags": ["파이썬", "wordpress"],
+        "date": datetime(2030, 1, 2, 0, 0, tzinfo=timezone.utc),
+        "line": 1,
+    }
+    assert posts[1][3] == {"line": 11}
+
+
+def test_rule_inside_body_is_not_a_header():
+    """본문 안의 구분선 사이에 "항목: 값" 줄이 있어도 title이 없으면 새 글로 자르지 않습니다."""
+    text = ("---\ntitle: 하나\n---\n첫 본문\n---\nIntro: here\n---\n이어지는 본문\n"
+            "---\ntitle: 둘\n---\n둘째 본문\n")
+    posts, logs, _ = read_posts("bundle.md", text)
+    assert logs == []
+    assert [(post[1], post[2]) for post in posts] == [
+        ("하나", "첫 본문\n---\nIntro: here\n---\n이어지는 본문"),
+        ("둘", "둘째 본문"),
+    ]
+
+
+def test_invalid_post_in_bundle_is_skipped_with_line_number():
+    """설정 값이 잘못된 글만 줄 번호와 함께 알리고 나머지 글은 읽습니다."""
+    text = "---\ntitle: 나쁜 글\nstatus: weird\n---\n본문\n---\ntitle: 좋은 글\n---\n본문\n"
+    posts, logs, _ = read_posts("bundle.md", text)
+    assert [post[1] for post in posts] == ["좋은 글"]
+    assert len(logs) == 1 and "1번째 줄" in logs[0]
+
+
+def test_jsonl_reads_one_post_per_line():
+    """JSON Lines는 줄마다 글 하나이며, 잘못된 줄은 건너뜁니다."""
+    good = '{"title": "a", "content": "b", "tags": ["x"]}'
+    posts, logs, _ = read_posts("posts.jsonl", good + "\nnot json\n\n" + '{"title": "", "content": "c"}\n')
+    assert posts == [(hashlib.sha256(good.encode('utf-8')).hexdigest(), "a", "b", {"tags": ["x"], "line": 1})]
+    assert len(logs) == 2
@@ -0,0 +1,158 @@
+"""
+발행 흐름 테스트
+모의 WordPress 서버로 REST 발행 결과가 발행 기록과 로그에 남는지 확인합니다.
+
+    python -m pytest test_publish_flow.py
+"""
+
+import json
+import os
+import tempfile
+
+import pytest
+
+from wordpress_auto_login import (LOG_MAX_LINES, PublishLedger, RunLog, WordPressAutoLogin, WordPressRestPublisher,
+                                  load_sites_config)
+from wordpress_mock_server import MockWordPressServer
+
+APP_PASSWORD = "abcd efgh ijkl mnop qrst uvwx"
+
+
+def make_app(server, directory, **kwargs):
+    """임시 폴더에 발행 기록과 실행 기록을 두는 headless 인스턴스를 만듭니다."""
+    app = WordPressAutoLogin.headless(server.url, "admin", "password", directory, app_password=APP_PASSWORD,
+                                      run_log=RunLog(os.path.join(directory, "run.jsonl")), **kwargs)
+    app.ledger = PublishLedger(os.path.join(directory, "ledger.sqlite3"))
+    return app
+
+
+def close_app(app):
+    app.ledger.close()
+    app.run_log.close()
+
+
+def drain_log(app):
+    lines = []
+    while not app.log_queue.empty():
+        lines.append(app.log_queue.get())
+    return lines
+
+
+def write_file(directory, name, text):
+    with open(os.path.join(directory, name), 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_failed_publish_is_logged_with_file_and_line():
+    """발행에 실패하면 실패 이유가 파일 이름·줄 번호와 함께 로그 패널에도 남습니다."""
+    with tempfile.TemporaryDirectory() as directory, MockWordPressServer() as server:
+        write_file(directory, "bundle.md", "---\ntitle: 좋은 글\n---\n본문\n---\ntitle: 나쁜 글\n---\n본문\n")
+        app = make_app(server, directory)
+        publisher = WordPressRestPublisher(server.url, "admin", APP_PASSWORD)
+        original = publisher.create_post
+
+        def create_post(title, content, **kwargs):
+            if title == "나쁜 글":
+                raise RuntimeError("서버 오류")
+            return original(title, content, **kwargs)
+
+        publisher.create_post = create_post
+        results = app.publish_entries_via_rest(app.get_pending_post_entries(), publisher)
+        assert results[0] and results[1] is None
+        errors = [line for line in drain_log(app) if "❌" in line]
+        assert len(errors) == 1
+        assert "bundle.md 5번째 줄" in errors[0] and "나쁜 글" in errors[0] and "서버 오류" in errors[0]
+        close_app(app)
+
+
+def run_rest_publish(disabled, password, app_password):
+    """모의 서버에서 perform_rest_publish를 한 번 실행하고 (브라우저 전환 횟수, 로그, 서버 글 수)를 반환합니다."""
+    with tempfile.TemporaryDirectory() as directory, MockWordPressServer(disabled=disabled) as server:
+        write_file(directory, "post.txt", "제목\n\n본문\n")
+        app = make_app(server, directory)
+        app.password_var.set(password)
+        app.app_password_var.set(app_password)
+        fallbacks = []
+        app.perform_login = lambda: fallbacks.append(True)
+        app.perform_rest_publish()
+        posts = len(server.state.posts)
+        close_app(app)
+        return len(fallbacks), drain_log(app), posts
+
+
+def test_rest_publish_with_app_password():
+    """앱 비밀번호로 REST 발행하면 브라우저로 전환하지 않고 글이 올라갑니다."""
+    fallbacks, lines, posts = run_rest_publish(None, "password", APP_PASSWORD)
+    assert (fallbacks, posts) == (0, 1)
+    assert any("REST API 발행 완료" in line for line in lines)
+
+
+def test_login_password_is_rejected_by_rest():
+    """REST API에 로그인 비밀번호를 보내면 실제 WordPress처럼 인증 실패로 알리고 브라우저로 전환하지 않습니다."""
+    fallbacks, lines, posts = run_rest_publish(None, "password", "")
+    assert (fallbacks, posts) == (0, 0)
+    assert any("REST API 인증 실패" in line for line in lines)
+
+
+def test_disabled_rest_falls_back_to_browser():
+    """REST API나 앱 비밀번호가 꺼진 사이트는 로그인 비밀번호가 있으면 브라우저 방식으로 전환합니다."""
+    for disabled, code in (("rest", "rest_disabled"), ("application_passwords", "application_passwords_disabled")):
+        fallbacks, lines, posts = run_rest_publish(disabled, "password", APP_PASSWORD)
+        assert (fallbacks, posts) == (1, 0), disabled
+        assert any("브라우저 방식으로 전환" in line and code in line for line in lines), lines
+
+
+def test_disabled_rest_without_login_password_asks_for_it():
+    """로그인 비밀번호가 없으면 브라우저로 전환하지 않고 비밀번호 입력을 안내합니다."""
+    fallbacks, lines, posts = run_rest_publish("rest", "", APP_PASSWORD)
+    assert (fallbacks, posts) == (0, 0)
+    assert any("비밀번호를 입력해주세요" in line for line in lines)
+
+
+def test_headless_log_queue_keeps_only_recent_lines():
+    """GUI 없이 실행하면 아무도 비우지 않는 로그 큐가 최근 LOG_MAX_LINES줄만 남기고, 전체 로그는 실행 기록에 남습니다."""
+    with tempfile.TemporaryDirectory() as directory, MockWordPressServer() as server:
+        app = make_app(server, directory)
+        for i in range(LOG_MAX_LINES + 10):
+            app.log_message(f"메시지 {i}")
+        lines = drain_log(app)
+        assert len(lines) == LOG_MAX_LINES
+        assert lines[0].endswith("메시지 10\n") and lines[-1].endswith(f"메시지 {LOG_MAX_LINES + 9}\n")
+        close_app(app)
+        with open(os.path.join(directory, "run.jsonl"), encoding='utf-8') as f:
+            assert sum(1 for _ in f) == LOG_MAX_LINES + 10
+
+
+def test_site_config_uses_app_password_for_rest(monkeypatch):
+    """sites.json의 app_password는 REST 발행에, password는 브라우저 로그인에 따로 쓰입니다."""
+    with tempfile.TemporaryDirectory() as directory, MockWordPressServer() as server:
+        content_dir = os.path.join(directory, "posts")
+        os.makedirs(content_dir)
+        write_file(content_dir, "post.txt", "제목\n\n본문\n")
+        monkeypatch.setenv("TEST_APP_PASSWORD", APP_PASSWORD)
+        write_file(directory, "sites.json", json.dumps({"sites": [{
+            "domain": server.url, "username": "admin", "password": "password",
+            "app_password": "env:TEST_APP_PASSWORD", "content_dir": content_dir, "backend": "rest",
+        }]}))
+        site = load_sites_config(os.path.join(directory, "sites.json"))[0]
+        app = make_app(server, directory)
+
+        worker = app.clone_for_site(site)
+        assert worker.password_var.get() == "password" and worker.app_password_var.get() == APP_PASSWORD
+        stats = app.publish_site(site)
+        assert (stats["succeeded"], stats["failed"], stats["error"]) == (1, 0, None)
+        close_app(app)
+
+
+def test_site_config_password_rules():
+    """비밀번호가 하나도 없거나, selenium 방식에 로그인 비밀번호가 없으면 설정 오류입니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sites.json")
+        site = {"domain": "https://blog.example.com", "username": "admin", "content_dir": directory}
+        for extra, backend in (({}, "rest"), ({"app_password": "secret"}, "selenium")):
+            write_file(directory, "sites.json", json.dumps([dict(site, backend=backend, **extra)]))
+            with pytest.raises(ValueError):
+                load_sites_config(path)
+        write_file(directory, "sites.json", json.dumps([dict(site, password="secret")]))
+        loaded = load_sites_config(path)[0]
+        assert (loaded["password"], loaded["app_password"]) == ("secret", "")
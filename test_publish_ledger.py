@@ -0,0 +1,52 @@
+"""
+발행 기록(PublishLedger) 테스트
+내용 해시별 중복 발행 방지, 실패·중단된 글의 재시도, 내용이 바뀐 글의 재발행을 확인합니다.
+
+    python -m pytest test_publish_ledger.py
+"""
+
+import os
+import tempfile
+
+from wordpress_auto_login import PublishLedger, WordPressRestPublisher
+from wordpress_mock_server import MockWordPressServer
+from test_publish_flow import APP_PASSWORD, close_app, make_app, write_file
+
+
+def test_only_published_posts_count_as_published():
+    """발행 중(중단)이거나 실패한 글은 발행된 것으로 보지 않고, 사이트마다 따로 기록합니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        ledger = PublishLedger(os.path.join(directory, "ledger.sqlite3"))
+        ledger.record_start("hash-a", "site-1", "a.txt")
+        assert ledger.get_published_post_id("hash-a", "site-1") is None
+
+        ledger.record_result("hash-a", "site-1", None, "서버 오류")
+        assert ledger.get_published_post_id("hash-a", "site-1") is None
+
+        ledger.record_start("hash-a", "site-1", "a.txt")
+        ledger.record_result("hash-a", "site-1", 42)
+        assert ledger.get_published_post_id("hash-a", "site-1") == "42"
+        assert ledger.get_published_post_id("hash-a", "site-2") is None
+        ledger.close()
+
+
+def test_rerun_skips_published_and_republishes_changed_content():
+    """다시 실행하면 발행한 글은 건너뛰고, 내용이 바뀐 글만 새 해시로 다시 발행합니다."""
+    with tempfile.TemporaryDirectory() as directory, MockWordPressServer() as server:
+        write_file(directory, "a.txt", "첫 글\n\n본문\n")
+        write_file(directory, "b.txt", "둘째 글\n\n본문\n")
+        app = make_app(server, directory)
+        publisher = WordPressRestPublisher(server.url, "admin", APP_PASSWORD)
+
+        assert all(app.publish_entries_via_rest(app.get_pending_post_entries(), publisher))
+        assert len(app.get_pending_post_entries()) == 0
+
+        write_file(directory, "b.txt", "둘째 글\n\n고친 본문\n")
+        pending = app.get_pending_post_entries()
+        assert (len(pending), pending.skipped) == (1, 1)
+        assert [entry[2] for entry in pending] == ["둘째 글"]
+
+        assert all(app.publish_entries_via_rest(pending, publisher))
+        assert len(app.get_pending_post_entries()) == 0
+        assert len(server.state.posts) == 3
+        close_app(app)
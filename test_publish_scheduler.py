@@ -0,0 +1,90 @@
+"""
+발행 속도 제한기(PublishScheduler) 테스트
+토큰 버킷 계산, 동시 실행 제한, 예약 발행 시각 나누기와 사이트별 인스턴스 공유를 확인합니다.
+
+    python -m pytest test_publish_scheduler.py
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from wordpress_auto_login import PublishScheduler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic을 손으로 움직이는 시계로 바꿉니다."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_token_bucket_allows_burst_then_paces(clock):
+    """처음에는 burst개까지 바로 보내고, 그다음은 분당 발행 수에 맞춰 토큰이 찰 때까지 기다립니다."""
+    scheduler = PublishScheduler(rate_per_minute=60, burst=3, max_concurrent=0)
+    assert [scheduler._take_token() for _ in range(3)] == [0, 0, 0]
+    assert scheduler._take_token() == pytest.approx(1.0)
+    clock[0] += 0.5
+    assert scheduler._take_token() == pytest.approx(0.5)
+    clock[0] += 0.5
+    assert scheduler._take_token() == 0
+    # 오래 쉬어도 토큰은 burst개까지만 쌓입니다.
+    clock[0] += 600
+    assert [scheduler._take_token() for _ in range(3)] == [0, 0, 0]
+    assert scheduler._take_token() > 0
+
+
+def test_unlimited_rate_never_waits():
+    """분당 발행 수가 0이면 토큰을 기다리지 않습니다."""
+    scheduler = PublishScheduler(rate_per_minute=0, burst=1, max_concurrent=0)
+    assert [scheduler.acquire() for _ in range(100)] == [0.0] * 100
+    assert asyncio.run(scheduler.acquire_async(100)) == 0.0
+
+
+def test_slot_limits_concurrent_publishes():
+    """slot()은 max_concurrent개까지만 동시에 들어가게 합니다."""
+    scheduler = PublishScheduler(rate_per_minute=0, burst=1, max_concurrent=2)
+    in_flight = [0, 0]  # 현재, 최대
+    lock = threading.Lock()
+
+    def publish():
+        with scheduler.slot():
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+
+    threads = [threading.Thread(target=publish) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert in_flight[1] == 2
+
+
+def test_plan_window_spreads_dates_evenly():
+    """count개 글을 시간 범위에 고르게 나누고, 곧 올 시각(첫 글)은 바로 발행합니다."""
+    scheduler = PublishScheduler(rate_per_minute=0)
+    start = datetime.now(timezone.utc)
+    dates = scheduler.plan_window(4, 60, start=start)
+    assert dates == [start + timedelta(minutes=15) * index for index in range(4)]
+    assert [scheduler.next_publish_date() for _ in range(5)] == [None] + dates[1:] + [None]
+
+    assert scheduler.plan_window(4, 0) == []
+    assert scheduler.next_publish_date() is None
+
+
+def test_for_site_shares_instance_until_settings_change():
+    """같은 사이트·설정이면 인스턴스를 함께 쓰고, 설정이 바뀌면 새로 만듭니다."""
+    site = "scheduler-test.example.com"
+    first = PublishScheduler.for_site(site, 30, 5, 2)
+    assert PublishScheduler.for_site(site, 30, 5, 2) is first
+    assert PublishScheduler.for_site("other-" + site, 30, 5, 2) is not first
+    changed = PublishScheduler.for_site(site, 60, 5, 2)
+    assert changed is not first and changed.settings() == (60, 5, 2)
@@ -0,0 +1,62 @@
+"""
+선택자 기억(SelectorMemory) 테스트
+단계(tier) 안에서만 정렬하는지, 실행이 끝날 때 한 번에 저장하는지, 저장할 때 다른 인스턴스의 기록과 합치는지 확인합니다.
+
+    python -m pytest test_selector_memory.py
+"""
+
+import json
+import os
+import tempfile
+import threading
+
+from wordpress_auto_login import SelectorMemory
+
+
+def test_fallback_tier_is_never_promoted():
+    """범용 대체 선택자는 많이 맞아도 구체적인 선택자 앞으로 오지 않고, 같은 tier 안에서만 순서가 바뀝니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        memory = SelectorMemory(os.path.join(directory, "selectors.json"), "6.4")
+        for _ in range(5):
+            memory.record("add_block", ".components-button.has-icon", 3, 0.01)
+        memory.record("add_block", ".b", 1, 0.01)
+        assert memory.order("add_block", [".a", ".b"], [".components-button.has-icon"]) == [
+            ".b", ".a", ".components-button.has-icon"]
+
+
+def test_record_is_saved_only_on_flush():
+    """기록은 메모리에만 쌓이고 flush 때 파일에 저장됩니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "selectors.json")
+        memory = SelectorMemory(path, "6.4")
+        memory.record("title", ".t", 0, 0.02)
+        assert not os.path.exists(path)
+        memory.flush()
+        with open(path, encoding='utf-8') as f:
+            assert json.load(f)["6.4"]["title"]["hits"] == {".t": 1}
+        assert memory.summary() == ["title: 첫 시도 적중 100% (1회), 평균 찾기 0.020초"]
+
+
+def test_flush_merges_with_other_versions_and_instances():
+    """같은 파일을 쓰는 다른 버전·다른 인스턴스(다른 프로세스)의 기록을 덮어쓰지 않고 더합니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "selectors.json")
+        old = SelectorMemory.for_path(path, "6.3")
+        new = SelectorMemory.for_path(path, "6.4")
+        other_process = SelectorMemory(path, "6.4")
+
+        threads = [threading.Thread(target=memory.record, args=("title", ".t", 0, 0.01))
+                   for memory in (old, new) * 10]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        other_process.record("title", ".u", 1, 0.01)
+        other_process.flush()
+        SelectorMemory.flush_all()
+
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        assert data["6.3"]["title"]["attempts"] == 10
+        assert data["6.4"]["title"]["attempts"] == 11
+        assert data["6.4"]["title"]["hits"] == {".t": 10, ".u": 1}
@@ -0,0 +1,120 @@
+"""
+WebDriver 풀(WebDriverPool) 테스트
+브라우저 대신 가짜 driver로 꺼내기·돌려주기, 응답 없는 driver 교체, 오래 쓴 driver 교체,
+모든 슬롯을 잃었을 때와 시간 초과 때의 오류를 확인합니다.
+
+    python -m pytest test_webdriver_pool.py
+"""
+
+import queue
+import threading
+
+import pytest
+
+from wordpress_auto_login import WebDriverPool
+
+
+class FakeDriver:
+    """execute_script("return 1;")에 healthy이면 1로 답하는 가짜 driver입니다."""
+
+    def __init__(self, slot, healthy=True):
+        self.slot = slot
+        self.healthy = healthy
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError("응답 없음")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(size=2, max_uses=25, fail_slots=()):
+    """가짜 driver를 띄우는 풀과 띄운 driver 목록을 반환합니다. fail_slots의 슬롯은 처음 띄울 때 실패합니다."""
+    created = []
+    failed = set()
+    lock = threading.Lock()
+
+    def create_driver(slot):
+        with lock:
+            if slot in fail_slots and slot not in failed:
+                failed.add(slot)
+                raise RuntimeError("시작 실패")
+            driver = FakeDriver(slot)
+            created.append(driver)
+            return driver
+
+    return WebDriverPool(create_driver, size=size, max_uses=max_uses, log=lambda message: None), created
+
+
+def test_checkout_and_checkin_reuse_drivers():
+    """꺼낸 driver를 돌려주면 다음 checkout에서 다시 씁니다. 빈 driver가 없으면 timeout 뒤 queue.Empty입니다."""
+    pool, created = make_pool(size=2)
+    assert pool.start() == 2
+    first, second = pool.checkout(), pool.checkout()
+    assert {first, second} == set(created)
+    with pytest.raises(queue.Empty):
+        pool.checkout(timeout=0.05)
+    pool.checkin(first)
+    assert pool.checkout(timeout=1) is first
+    pool.close()
+    assert all(driver.quit_called for driver in created)
+
+
+def test_unhealthy_and_worn_out_drivers_are_replaced():
+    """응답 없는 driver는 꺼낼 때, max_uses번 쓴 driver는 돌려줄 때 같은 슬롯에 새로 띄웁니다."""
+    pool, created = make_pool(size=1, max_uses=2)
+    pool.start()
+    driver = pool.checkout()
+    driver.healthy = False
+    pool.checkin(driver)
+    replaced = pool.checkout()
+    assert replaced is not driver and driver.quit_called and replaced.slot == driver.slot
+
+    pool.checkin(replaced)
+    assert pool.checkout() is replaced
+    pool.checkin(replaced)  # 두 번째 사용 -> 교체
+    worn_out_replacement = pool.checkout()
+    assert worn_out_replacement is not replaced and replaced.quit_called
+    assert len(created) == 3
+    pool.close()
+
+
+def test_start_skips_failed_slots():
+    """시작에 실패한 슬롯은 빼고 준비된 브라우저 수만 반환합니다."""
+    pool, created = make_pool(size=3, fail_slots=(1,))
+    assert pool.start() == 2
+    assert sorted(driver.slot for driver in created) == [0, 2]
+    pool.close()
+
+
+def test_checkout_fails_when_last_slot_is_lost():
+    """다른 작업자가 마지막 브라우저 교체에 실패해 슬롯이 없어지면 기다리던 checkout도 RuntimeError로 끝납니다."""
+    launches = [0]
+
+    def create_driver(slot):
+        launches[0] += 1
+        if launches[0] > 1:
+            raise RuntimeError("다시 띄우기 실패")
+        return FakeDriver(slot)
+
+    pool = WebDriverPool(create_driver, size=1, log=lambda message: None)
+    pool.start()
+    driver = pool.checkout()
+    errors = []
+
+    def wait_for_driver():
+        try:
+            pool.checkout(timeout=5)
+        except RuntimeError as e:
+            errors.append(e)
+
+    waiter = threading.Thread(target=wait_for_driver)
+    waiter.start()
+    pool.checkin(driver, healthy=False)
+    waiter.join(5)
+    assert not waiter.is_alive() and len(errors) == 1
+    with pytest.raises(RuntimeError):
+        pool.checkout(timeout=0.05)
@@ -7,11 +7,35 @@ WordPress 자동 로그인 GUI 프로그램
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import sys
 import threading
+import asyncio
+import queue
+import copy
 import time
 import os
+import re
 import glob
-from urllib.parse import urlparse, urljoin
+import hashlib
+import html
+import itertools
+import contextlib
+import sqlite3
+import subprocess
+import json
+import base64
+import io
+import ssl
+import logging
+import logging.handlers
+import mimetypes
+import urllib.request
+import urllib.error
+import xmlrpc.client
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse, urljoin, urlencode, quote, unquote
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     from selenium import webdriver
@@ -28,18 +52,2130 @@ try:
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+
+# 발행 방식 (GUI 표시 이름 -> 내부 키)
+PUBLISH_MODES = {
+    "브라우저 (Selenium)": "selenium",
+    "REST API": "rest",
+    "REST API 일괄 (비동기)": "rest_async",
+    "XML-RPC (일괄)": "xmlrpc",
+    "브라우저 병렬 (Selenium 풀)": "selenium_pool",
+    "브라우저 일괄 (한 세션)": "selenium_batch",
+    "폴더 감시 (자동 발행)": "watch",
+    "여러 사이트 (설정 파일)": "multisite",
+}
+
+# 병렬 발행 시 미리 띄워 둘 브라우저 수
+DEFAULT_POOL_SIZE = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+# 병렬 발행 풀에서 빈 브라우저를 기다리며 남은 슬롯을 다시 확인하는 간격(초)
+POOL_CHECKOUT_POLL_INTERVAL = 1.0
+
+# 비동기 REST 발행에서 사이트 하나에 동시에 보낼 요청 수 (= 유지할 keep-alive 연결 수)
+DEFAULT_ASYNC_CONCURRENCY = 8
+
+# keep-alive 연결을 이 시간(초)보다 오래 쉬었으면 서버가 닫았을 수 있으므로 새로 연결합니다.
+ASYNC_IDLE_CONNECTION_TIMEOUT = 4.0
+
+# 응답을 받기 전에 연결이 끊겼을 때 다시 보내도 되는 요청 (POST는 서버가 이미 글을 만들었을 수 있어 제외)
+ASYNC_RETRY_SAFE_METHODS = ("GET", "HEAD")
+
+# REST API가 없다고 판단하는 HTTP 상태 코드 (이 경우 Selenium으로 전환)
+REST_FALLBACK_STATUS_CODES = (404,)
+
+# 401/403 응답 중 REST API나 애플리케이션 비밀번호가 꺼져 있음을 뜻하는 WordPress 오류 코드
+# (이 경우만 Selenium으로 전환하고, 그 밖의 401/403은 인증 오류로 알립니다)
+REST_DISABLED_ERROR_CODES = (
+    "rest_disabled", "rest_cannot_access", "rest_login_required",
+    "application_passwords_disabled", "application_passwords_disabled_for_user",
+)
+
+# 사이트별 브라우저 프로필과 로그인 쿠키를 저장하는 폴더
+SESSION_BASE_DIR = os.path.join(os.path.expanduser("~"), ".wordpress_auto_login")
+
+# 발행 기록(내용 해시 -> 사이트별 글 ID/상태/시간) SQLite 파일
+PUBLISH_LEDGER_FILE = os.path.join(SESSION_BASE_DIR, "publish_ledger.sqlite3")
+
+# 발행 속도 제한 기본값 (사이트별): 분당 발행 수(0이면 제한 없음), 한 번에 몰아서 허용할 수,
+# 동시에 발행할 최대 글 수(0이면 제한 없음), 예약 발행으로 나눠 보낼 시간 범위(분, 0이면 바로 발행)
+DEFAULT_PUBLISH_RATE_PER_MINUTE = 0
+DEFAULT_PUBLISH_BURST = 3
+DEFAULT_PUBLISH_CONCURRENCY = 0
+DEFAULT_PUBLISH_WINDOW_MINUTES = 0
+
+# 본문의 로컬 이미지를 미디어 라이브러리에 동시에 올릴 작업자 수
+MEDIA_UPLOAD_WORKERS = 4
+
+# 본문에서 <img src="..."> 값을 찾는 정규식 (그룹: 앞부분, 따옴표, src 값)
+IMG_SRC_PATTERN = re.compile(r'''(<img\b[^>]*?\bsrc\s*=\s*)(["'])(.*?)\2''', re.IGNORECASE | re.DOTALL)
+
+# 글 파일 형식: txt(기존 3줄 형식 또는 front matter), md(front matter), jsonl(한 줄에 글 하나)
+POST_FILE_PATTERNS = ("*.txt", "*.md", "*.jsonl")
+
+# front matter 구분선과 머리말에 쓸 수 있는 항목, 파일에서 지정할 수 있는 글 상태
+FRONT_MATTER_DELIMITER = "---"
+FRONT_MATTER_KEYS = ("title", "slug", "status", "categories", "tags", "date")
+POST_STATUSES = ("publish", "draft", "pending", "private", "future")
+
+# 실행 기록(JSON lines) 파일과 크기 기준 순환 설정 (10MB x 5개 보관)
+RUN_LOG_FILE = os.path.join(SESSION_BASE_DIR, "logs", "run.jsonl")
+RUN_LOG_MAX_BYTES = 10 * 1024 * 1024
+RUN_LOG_BACKUP_COUNT = 5
+
+# 여러 사이트 발행 설정 파일 (WORDPRESS_SITES_FILE 환경 변수로 바꿀 수 있음)과 사이트별 발행 방식
+SITES_CONFIG_FILE = os.path.join(SESSION_BASE_DIR, "sites.json")
+SITE_BACKENDS = ("rest", "rest_async", "xmlrpc", "selenium")
+
+# 설치된 Chrome 주 버전별로 확인한 ChromeDriver 경로를 기록하는 파일
+CHROMEDRIVER_CACHE_FILE = os.path.join(SESSION_BASE_DIR, "chromedriver_cache.json")
+
+# 발행 전용(publisher) 브라우저에서 DevTools로 차단할 리소스
+# 블록 에디터 동작에 필요 없는 이미지, 웹폰트, 대시보드 위젯, 외부 추적 스크립트입니다.
+PUBLISHER_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*", "*gravatar.com*",
+    "*/wp-admin/js/dashboard*", "*/wp-admin/css/dashboard*",
+    "*admin-ajax.php?action=dashboard-widgets*",
+    "*google-analytics.com*", "*googletagmanager.com*",
+]
+
+# 로그 패널 갱신 주기(ms)와 화면에 남길 최대 줄 수
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_MAX_LINES = 2000
+
+# 조건 대기 기본값 (초): 고정 sleep 대신 이 간격으로 조건을 확인합니다.
+WAIT_POLL_INTERVAL = 0.1
+
+# 블록 에디터의 wp.data 스토어가 준비되었는지 확인하는 스크립트
+EDITOR_READY_SCRIPT = """
+    try {
+        return !!(window.wp && wp.data && wp.blocks
+            && wp.data.select('core/block-editor')
+            && wp.data.select('core/editor')
+            && wp.blocks.getBlockType('core/html'));
+    } catch (e) { return false; }
+"""
+
+# 에디터 스토어의 현재 제목을 반환하는 스크립트 (스토어가 없으면 null)
+EDITOR_TITLE_SCRIPT = """
+    try { return wp.data.select('core/editor').getEditedPostAttribute('title'); }
+    catch (e) { return null; }
+"""
+
+# wp.data 스토어로 제목과 core/html 블록을 한 번에 넣고 결과 블록 목록을 반환하는 스크립트
+# arguments[0]: 제목, arguments[1]: HTML 본문
+INJECT_POST_SCRIPT = """
+    var title = arguments[0], content = arguments[1];
+    try {
+        if (!(window.wp && wp.data && wp.blocks)) {
+            return {ok: false, error: 'wp.data를 사용할 수 없습니다.'};
+        }
+        var editor = wp.data.dispatch('core/editor');
+        var blockEditor = wp.data.dispatch('core/block-editor');
+        var blocks = wp.data.select('core/block-editor').getBlocks();
+        var previousTitle = wp.data.select('core/editor').getEditedPostAttribute('title') || '';
+
+        editor.editPost({title: title});
+        var block = wp.blocks.createBlock('core/html', {content: content});
+
+        // 새 글의 빈 기본 단락은 HTML 블록으로 바꾸고, 그 외에는 끝에 추가합니다.
+        var replaced = blocks.length === 1 && wp.blocks.isUnmodifiedDefaultBlock
+                && wp.blocks.isUnmodifiedDefaultBlock(blocks[0]);
+        if (replaced) {
+            blockEditor.replaceBlock(blocks[0].clientId, block);
+        } else {
+            blockEditor.insertBlocks(block);
+        }
+
+        return {
+            ok: true,
+            clientId: block.clientId,
+            replaced: replaced,
+            previousTitle: previousTitle,
+            title: wp.data.select('core/editor').getEditedPostAttribute('title'),
+            blocks: wp.data.select('core/block-editor').getBlocks().map(function (b) {
+                return {
+                    name: b.name,
+                    clientId: b.clientId,
+                    length: (b.attributes.content || '').length
+                };
+            })
+        };
+    } catch (e) {
+        return {ok: false, error: String(e)};
+    }
+"""
+
+# textarea 값을 React가 알아차리도록 원래 value setter로 한 번에 넣고 input/change 이벤트를 보내는 스크립트
+# (el.value = ... 로 넣으면 React가 관리하는 값이 바뀌지 않아 블록 속성에 반영되지 않음)
+# arguments[0]: textarea, arguments[1]: 넣을 값
+SET_TEXTAREA_VALUE_SCRIPT = """
+    var el = arguments[0];
+    var setter = Object.getOwnPropertyDescriptor(window.HTMLTextAreaElement.prototype, 'value').set;
+    el.focus();
+    setter.call(el, arguments[1]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+"""
+
+# 요소 값 전체의 [UTF-16 길이, FNV-1a 32비트 해시]를 반환하는 스크립트 (text_digest와 같은 계산)
+# 큰 본문을 다시 받아오지 않고 브라우저 안에서 전체 내용을 확인합니다.
+TEXT_DIGEST_SCRIPT = """
+    var value = arguments[0].value || '';
+    var hash = 0x811c9dc5;
+    for (var i = 0; i < value.length; i++) {
+        hash = Math.imul(hash ^ value.charCodeAt(i), 0x01000193);
+    }
+    return [value.length, hash >>> 0];
+"""
+
+# 글 상태를 바꾸고 저장을 요청하는 스크립트
+# arguments[0]: 글 상태, arguments[1]: 예약 발행 시각(UTC ISO 문자열, 없으면 null),
+# arguments[2]: 함께 바꿀 글 속성 (slug, categories, tags ID 목록 등, 없으면 null)
+SAVE_POST_SCRIPT = """
+    var edits = Object.assign({}, arguments[2] || {}, {status: arguments[0]});
+    if (arguments[1]) { edits.date = arguments[1]; }
+    wp.data.dispatch('core/editor').editPost(edits);
+    wp.data.dispatch('core/editor').savePost();
+    return true;
+"""
+
+# 저장이 끝났으면 글 ID를, 아직이면 null을 반환하는 스크립트 (arguments[0]: 글 상태)
+POST_SAVED_SCRIPT = """
+    var editor = wp.data.select('core/editor');
+    if (editor.isSavingPost() || editor.isEditedPostDirty()) { return null; }
+    var status = editor.getCurrentPostAttribute('status');
+    // 발행 시각이 미래이면 WordPress가 'publish'를 'future'(예약)로 바꿉니다.
+    if (status !== arguments[0] && !(arguments[0] === 'publish' && status === 'future')) { return null; }
+    return editor.getCurrentPostId();
+"""
+
+# 분류 이름 목록을 ID 목록으로 바꾸는 비동기 스크립트 (없는 이름은 새로 만듦, 로그인 쿠키와 nonce를 쓰는 wp.apiFetch 사용)
+# arguments[0]: 분류 REST 경로(categories/tags), arguments[1]: 이름 목록 -> {ids: [...]} 또는 {error: 메시지}
+TERM_IDS_SCRIPT = """
+    var taxonomy = arguments[0], names = arguments[1], done = arguments[arguments.length - 1];
+    var decoder = document.createElement('textarea');
+    function decode(text) { decoder.innerHTML = text || ''; return decoder.value.toLowerCase(); }
+    Promise.all(names.map(function (name) {
+        var path = '/wp/v2/' + taxonomy;
+        return wp.apiFetch({path: path + '?per_page=100&search=' + encodeURIComponent(name)}).then(function (terms) {
+            var found = terms.filter(function (term) { return decode(term.name) === name.toLowerCase(); })[0];
+            return found ? found.id : wp.apiFetch({path: path, method: 'POST', data: {name: name}}).then(function (term) {
+                return term.id;
+            });
+        });
+    })).then(function (ids) { done({ids: ids}); }, function (error) { done({error: error.message || String(error)}); });
+"""
+
+# INJECT_POST_SCRIPT가 넣은 HTML 블록을 지우고 제목을 되돌리는 스크립트 (기존 방식으로 다시 입력하기 전)
+# arguments[0]: 넣은 블록 clientId, arguments[1]: 원래 제목, arguments[2]: 기본 단락을 바꿨는지 여부
+REVERT_INJECTED_POST_SCRIPT = """
+    var clientId = arguments[0], title = arguments[1], replaced = arguments[2];
+    var blockEditor = wp.data.dispatch('core/block-editor');
+    blockEditor.removeBlocks([clientId]);
+    if (replaced && wp.data.select('core/block-editor').getBlocks().length === 0) {
+        blockEditor.insertBlocks(wp.blocks.createBlock('core/paragraph'));
+    }
+    wp.data.dispatch('core/editor').editPost({title: title});
+    var blocks = wp.data.select('core/block-editor').getBlocks();
+    return wp.data.select('core/editor').getEditedPostAttribute('title') === title
+        && !blocks.some(function (b) { return b.clientId === clientId; });
+"""
+
+# wp-admin body 클래스(version-6-4-2)에서 WordPress 버전을 읽는 스크립트
+WP_VERSION_SCRIPT = """
+    var match = document.body && document.body.className.match(/(?:^|\\s)version-([\\d-]+)/);
+    return match ? match[1].replace(/-/g, '.') : null;
+"""
+
+# 후보 선택자들을 페이지 안에서 한 번에 확인해 조건에 맞는 첫 요소와 그 선택자를 반환하는 스크립트
+# arguments[0]: 선택자 목록, arguments[1]: 조건
+#   visible / enabled: 화면에 보이는지 / 비활성화되지 않았는지
+#   textContains: aria-label, 텍스트, class 중 하나에 포함되어야 할 문자열 (소문자 비교)
+#   excludeTitle: 부모 요소 HTML에 'title'이 있으면 제외 (제목 필드 구분)
+#   last: 선택자마다 마지막 요소부터 확인 (가장 최근에 추가된 요소 우선)
+FIND_FIRST_SCRIPT = """
+    var selectors = arguments[0], options = arguments[1];
+    function isVisible(el) {
+        var rect = el.getBoundingClientRect();
+        var style = window.getComputedStyle(el);
+        return (rect.width > 0 || rect.height > 0)
+            && style.visibility !== 'hidden' && style.display !== 'none';
+    }
+    function isEnabled(el) {
+        return !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+    }
+    function matchesText(el, needle) {
+        var className = typeof el.className === 'string' ? el.className : '';
+        var haystack = [el.getAttribute('aria-label') || '', el.innerText || el.textContent || '', className];
+        return haystack.join(' ').toLowerCase().indexOf(needle) !== -1;
+    }
+    function isTitle(el) {
+        var parent = el.parentElement;
+        return !!parent && parent.innerHTML.toLowerCase().indexOf('title') !== -1;
+    }
+    for (var i = 0; i < selectors.length; i++) {
+        var elements;
+        try { elements = Array.prototype.slice.call(document.querySelectorAll(selectors[i])); }
+        catch (e) { continue; }
+        if (options.last) { elements.reverse(); }
+        for (var j = 0; j < elements.length; j++) {
+            var el = elements[j];
+            if (options.visible && !isVisible(el)) { continue; }
+            if (options.enabled && !isEnabled(el)) { continue; }
+            if (options.textContains && !matchesText(el, options.textContains)) { continue; }
+            if (options.excludeTitle && isTitle(el)) { continue; }
+            return [el, selectors[i]];
+        }
+    }
+    return null;
+"""
+
+# 편집 완료 키 입력 (HTML 블록에서 TAB 두 번으로 포커스를 옮긴 뒤 ENTER)
+FINISH_EDITING_KEYS = ("TAB", "TAB", "ENTER")
+
+# 키 하나가 처리될 때까지 기다릴 최대 시간(초)
+KEY_HANDLED_TIMEOUT = 2.0
+
+# 키 입력 뒤 포커스가 옮겨 갔고(arguments[1]이 false일 때만) 에디터가 저장 중이 아닌지 확인하는 스크립트
+KEY_HANDLED_SCRIPT = """
+    try {
+        var editor = window.wp && wp.data && wp.data.select('core/editor');
+        if (editor && (editor.isSavingPost() || editor.isAutosavingPost())) { return false; }
+    } catch (e) {}
+    return arguments[1] || document.activeElement !== arguments[0];
+"""
+
+# ActionChains를 쓸 수 없을 때 현재 포커스 요소에 키 이벤트를 보내는 스크립트
+DISPATCH_KEY_SCRIPT = """
+    var key = arguments[0], keyCode = arguments[1];
+    ['keydown', 'keyup'].forEach(function (type) {
+        document.activeElement.dispatchEvent(new KeyboardEvent(type, {
+            key: key, code: key, keyCode: keyCode, bubbles: true
+        }));
+    });
+"""
+
+# 키 이름 -> (KeyboardEvent key, keyCode)
+KEY_EVENT_CODES = {"TAB": ("Tab", 9), "ENTER": ("Enter", 13), "ESCAPE": ("Escape", 27)}
+
+# core/html 블록이 삽입되었는지 확인하는 스크립트
+HTML_BLOCK_INSERTED_SCRIPT = """
+    try {
+        return wp.data.select('core/block-editor').getBlocks()
+            .some(function (block) { return block.name === 'core/html'; });
+    } catch (e) { return false; }
+"""
+
+
+def detect_chrome_version():
+    """네트워크 없이 설치된 Chrome 버전을 확인합니다. 확인하지 못하면 None."""
+    if os.name == 'nt':
+        commands = [
+            ['reg', 'query', r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon', '/v', 'version'],
+            ['reg', 'query', r'HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon', '/v', 'version'],
+        ]
+    else:
+        commands = [
+            ['google-chrome', '--version'],
+            ['google-chrome-stable', '--version'],
+            ['chromium', '--version'],
+            ['chromium-browser', '--version'],
+            ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '--version'],
+        ]
+
+    for command in commands:
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r'(\d+)\.\d+\.\d+\.\d+', result.stdout)
+        if match:
+            return match.group(0)
+    return None
+
+
+class ChromeDriverResolver:
+    """ChromeDriver 경로를 찾습니다. 한 번 확인한 경로는 Chrome 주 버전별로 저장해 재사용합니다.
+
+    확인 순서: 직접 지정한 경로 → 캐시 → webdriver-manager 다운로드 → Selenium 기본 탐색(None)
+    """
+
+    _memory_cache = {}  # 같은 프로세스 안에서는 파일도 다시 읽지 않습니다.
+    _lock = threading.Lock()
+
+    def __init__(self, explicit_path=None, cache_file=CHROMEDRIVER_CACHE_FILE, log=print):
+        self.explicit_path = explicit_path
+        self.cache_file = cache_file
+        self.log = log
+
+    def resolve(self):
+        """사용할 ChromeDriver 경로를 반환합니다. None이면 Selenium이 직접 찾도록 둡니다."""
+        if self.explicit_path:
+            if os.path.exists(self.explicit_path):
+                return self.explicit_path
+            self.log(f"⚠️ 지정한 ChromeDriver 경로가 없습니다: {self.explicit_path}")
+
+        version = detect_chrome_version()
+        key = version.split('.')[0] if version else "unknown"
+
+        with self._lock:
+            cached = self._memory_cache.get(key) or self._read_cache().get(key)
+            if cached and os.path.exists(cached):
+                self._memory_cache[key] = cached
+                return cached
+
+            try:
+                path = ChromeDriverManager().install()
+            except Exception as e:
+                self.log(f"⚠️ ChromeDriver 다운로드 확인 실패 ({str(e)}). Selenium 기본 탐색을 사용합니다.")
+                return None
+
+            self._memory_cache[key] = path
+            if version:
+                self._write_cache(key, path)
+            return path
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, key, path):
+        cache = self._read_cache()
+        cache[key] = path
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            self.log(f"⚠️ ChromeDriver 캐시 저장 실패: {str(e)}")
+
+
+class BatchProgress:
+    """일괄 발행 진행 상황을 파일에 기록해, 중단된 뒤 다시 실행하면 이어서 발행하게 합니다."""
+
+    def __init__(self, path, txt_files_dir):
+        self.path = path
+        self.txt_files_dir = txt_files_dir
+        self.done = []
+        self.failed = {}  # 파일 이름 -> 오류 메시지
+        self.started = time.time()
+        self.completed_this_run = 0
+        self.load()
+
+    def load(self):
+        """같은 폴더의 이전 진행 기록이 있으면 불러옵니다. 실패한 파일은 다시 시도합니다."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('txt_files_dir') == self.txt_files_dir:
+            self.done = data.get('done', [])
+
+    def save(self):
+        """진행 기록을 임시 파일에 쓴 뒤 교체합니다. (중간에 죽어도 파일이 깨지지 않음)"""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'txt_files_dir': self.txt_files_dir,
+                'done': self.done,
+                'failed': self.failed,
+            }, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def pending(self, filenames):
+        """아직 발행하지 않은 파일 이름만 순서대로 반환합니다."""
+        done = set(self.done)
+        return [name for name in filenames if name not in done]
+
+    def mark_done(self, filename):
+        self.done.append(filename)
+        self.failed.pop(filename, None)
+        self.completed_this_run += 1
+        self.save()
+
+    def mark_failed(self, filename, error):
+        self.failed[filename] = error
+        self.completed_this_run += 1
+        self.save()
+
+    def clear(self):
+        """모든 파일을 마쳤으면 기록을 지웁니다."""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def summary(self, total):
+        """완료/실패/남은 개수와 분당 발행 수를 한 줄로 만듭니다."""
+        elapsed = max(time.time() - self.started, 1e-6)
+        rate = (self.completed_this_run - len(self.failed)) * 60 / elapsed
+        remaining = total - len(self.done) - len(self.failed)
+        return (f"완료 {len(self.done)} / 실패 {len(self.failed)} / 남음 {remaining} "
+                f"({rate:.1f}개/분)")
+
+
+class DirectoryWatcher:
+    """폴더에 새로 생긴 글 파일(patterns)을 감지해, 쓰기가 끝나면 on_ready(파일 경로)를 호출합니다.
+
+    Linux에서 inotify_simple이 설치되어 있으면 inotify 이벤트로 바로 깨어나고,
+    그 외에는 수정 시각(mtime) 색인으로 폴더를 주기적으로 확인합니다.
+    크기와 수정 시각이 settle_time 동안 변하지 않아야 쓰기가 끝난 것으로 봅니다.
+    """
+
+    def __init__(self, directory, on_ready, patterns=POST_FILE_PATTERNS, poll_interval=1.0, settle_time=1.5,
+                 log=print):
+        self.directory = directory
+        self.on_ready = on_ready
+        self.patterns = patterns
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time
+        self.log = log
+        self._index = {}      # 경로 -> (크기, mtime): 이미 처리했거나 시작 시 있던 파일
+        self._pending = {}    # 경로 -> (크기, mtime, 마지막으로 바뀐 것을 본 시각)
+
+    def run(self, stop_event):
+        """stop_event가 설정될 때까지 폴더를 감시합니다. 시작 시 있던 파일은 건너뜁니다."""
+        self._index = self._scan()
+        inotify = self._open_inotify()
+        self.log(f"👀 폴더 감시를 시작합니다 ({'inotify' if inotify else '폴링'}): {self.directory}")
+
+        try:
+            while not stop_event.is_set():
+                if inotify:
+                    # 이벤트가 오면 바로, 아니면 대기 중인 파일 확인을 위해 주기적으로 깨어납니다.
+                    inotify.read(timeout=int(self.poll_interval * 1000))
+                else:
+                    stop_event.wait(self.poll_interval)
+                self._check()
+        finally:
+            if inotify:
+                inotify.close()
+
+    def _open_inotify(self):
+        if not INOTIFY_AVAILABLE:
+            return None
+        try:
+            inotify = INotify()
+            mask = (inotify_flags.CREATE | inotify_flags.MODIFY
+                    | inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+            inotify.add_watch(self.directory, mask)
+            return inotify
+        except OSError as e:
+            self.log(f"⚠️ inotify를 사용할 수 없어 폴링으로 감시합니다: {str(e)}")
+            return None
+
+    def _scan(self):
+        """폴더의 대상 파일별 (크기, mtime)을 반환합니다."""
+        result = {}
+        paths = itertools.chain.from_iterable(glob.glob(os.path.join(self.directory, pattern))
+                                              for pattern in self.patterns)
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # 확인하는 사이에 지워지거나 이름이 바뀐 파일
+            result[path] = (stat.st_size, stat.st_mtime)
+        return result
+
+    def _check(self):
+        """새 파일을 대기 목록에 넣고, 충분히 변하지 않은 파일은 on_ready로 넘깁니다."""
+        now = time.time()
+        for path, signature in self._scan().items():
+            if self._index.get(path) == signature:
+                continue
+            previous = self._pending.get(path)
+            if previous is None or previous[:2] != signature:
+                self._pending[path] = (*signature, now)
+                continue
+            if signature[0] > 0 and now - previous[2] >= self.settle_time:
+                del self._pending[path]
+                self._index[path] = signature
+                self.on_ready(path)
+
+
+def file_content_hash(file_path):
+    """파일 내용의 SHA-256 해시를 반환합니다. (큰 파일도 조각으로 읽음)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def text_digest(text):
+    """문자열의 (UTF-16 코드 단위 길이, FNV-1a 32비트 해시)를 반환합니다.
+
+    브라우저의 TEXT_DIGEST_SCRIPT와 같은 값을 계산하므로 입력한 본문 전체를 비교할 수 있습니다.
+    """
+    units = memoryview(text.encode('utf-16-le' if sys.byteorder == 'little' else 'utf-16-be')).cast('H')
+    digest = 0x811c9dc5
+    for unit in units:
+        digest = ((digest ^ unit) * 0x01000193) & 0xFFFFFFFF
+    return len(units), digest
+
+
+def parse_post_date(value):
+    """글 파일의 날짜(ISO 8601, 시간대가 없으면 이 컴퓨터의 현지 시각)를 UTC datetime으로 바꿉니다.
+
+    형식이 틀리면 ValueError를 발생시킵니다.
+    """
+    parsed = datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()
+    return parsed.astimezone(timezone.utc)
+
+
+def post_meta_from_fields(fields):
+    """front matter / JSON 항목에서 제목과 본문 외의 글 설정(slug, status, categories, tags, date)을 꺼냅니다.
+
+    categories와 tags는 이름 목록("a, b", "[a, b]" 또는 목록)이며, 잘못된 상태나 날짜는 ValueError를 발생시킵니다.
+    """
+    meta = {}
+    slug = str(fields.get("slug") or "").strip()
+    if slug:
+        meta["slug"] = slug
+
+    status = str(fields.get("status") or "").strip().lower()
+    if status:
+        if status not in POST_STATUSES:
+            raise ValueError(f"알 수 없는 글 상태입니다: {status} ({', '.join(POST_STATUSES)} 중 하나)")
+        meta["status"] = status
+
+    for key in ("categories", "tags"):
+        names = fields.get(key) or []
+        if isinstance(names, str):
+            names = names.strip()
+            if names.startswith('[') and names.endswith(']'):
+                names = names[1:-1]
+            names = names.split(',')
+        names = [unquote_front_matter_value(str(name)) for name in names]
+        if any(names):
+            meta[key] = [name for name in names if name]
+
+    if fields.get("date"):
+        try:
+            meta["date"] = parse_post_date(fields["date"])
+        except ValueError:
+            raise ValueError(f"날짜 형식이 잘못되었습니다: {fields['date']} (예: 2025-01-31 09:00)") from None
+    return meta
+
+
+def unquote_front_matter_value(value):
+    """front matter 값의 앞뒤 공백과 감싼 따옴표를 없앱니다."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        value = value[1:-1]
+    return value
+
+
+# front matter 머리말 한 줄: "항목: 값" 또는 목록 항목 "- 값"
+FRONT_MATTER_LINE_PATTERN = re.compile(r'^(?:([A-Za-z_][\w-]*)\s*:(.*)|\s*-\s+(.*)|\s*(?:#.*)?)$')
+
+
+def parse_front_matter(lines):
+    """--- 사이의 머리말 줄들을 {항목: 값}으로 바꿉니다. 머리말 형식이 아니면 None을 반환합니다.
+
+    값은 한 줄("title: 제목", "tags: [a, b]")이거나, 값 없이 끝난 항목 아래의 "- 값" 목록입니다.
+    """
+    fields = {}
+    list_key = None
+    for line in lines:
+        match = FRONT_MATTER_LINE_PATTERN.match(line.rstrip('\r\n'))
+        if not match:
+            return None
+        key, value, item = match.groups()
+        if key:
+            key = key.lower()
+            value = value.strip()
+            fields[key] = unquote_front_matter_value(value) if value else []
+            list_key = None if value else key
+        elif item is not None:
+            if list_key is None:
+                return None
+            fields[list_key].append(item)
+    # 값도 목록 항목도 없는 항목은 빈 값입니다.
+    fields = {key: "" if value == [] else value for key, value in fields.items()}
+    return fields or None
+
+
+def iter_post_file(file_path, log=print):
+    """글 파일 하나에서 글을 차례로 읽어 (내용 해시, 제목, 본문, 설정) 을 하나씩 돌려주는 생성기입니다.
+
+    파일을 한 줄씩 읽고 글 하나가 끝날 때마다 바로 내보내므로, 글이 수만 개인 파일도 한 번에 메모리에 올리지 않습니다.
+    - .jsonl: 한 줄에 글 하나 ({"title", "content", "slug", "status", "categories", "tags", "date"})
+    - 첫 줄이 ---: front matter 형식. 머리말(--- ~ ---) 다음 줄부터 다음 머리말 전까지가 본문이며,
+      한 파일에 여러 글을 이어 쓸 수 있습니다.
+    - 그 외: 기존 형식 (첫 줄 제목, 둘째 줄 비움, 셋째 줄부터 본문)
+
+    내용 해시는 글 하나에 해당하는 원본 바이트의 SHA-256이라, 글이 하나뿐인 파일은 file_content_hash와 같습니다.
+    설정에는 글 파일의 항목과 함께 글이 시작하는 줄 번호(line)가 들어 있습니다.
+    형식이 잘못된 글은 log로 알리고 건너뜁니다.
+    """
+    filename = os.path.basename(file_path)
+    with open(file_path, 'rb') as f:
+        first_line = f.readline()
+        lines = itertools.chain([first_line], f)
+        if file_path.lower().endswith('.jsonl'):
+            yield from _iter_jsonl_posts(lines, filename, log)
+        elif first_line.decode('utf-8-sig').strip() == FRONT_MATTER_DELIMITER:
+            yield from _iter_front_matter_posts(lines, filename, log)
+        else:
+            yield from _iter_legacy_post(lines, filename, log)
+
+
+def _iter_legacy_post(lines, filename, log):
+    digest = hashlib.sha256()
+    title = None
+    body = []
+    for line_no, raw in enumerate(lines, 1):
+        digest.update(raw)
+        if line_no == 1:
+            title = raw.decode('utf-8').strip()
+        elif line_no >= 3:
+            body.append(raw.decode('utf-8'))
+
+    if not body:
+        log(f"❌ 파일에 충분한 줄이 없습니다. (최소 3줄 필요): {filename}")
+        return
+    try:
+        post = _finish_post({"title": title}, ''.join(body), 1)
+    except ValueError as e:
+        log(f"❌ 글을 건너뜁니다 ({filename}): {str(e)}")
+        return
+    # 해시는 파일 전체 내용이라 file_content_hash로 남긴 이전 발행 기록과 같습니다.
+    yield (digest.hexdigest(), *post)
+
+
+def _iter_jsonl_posts(lines, filename, log):
+    for line_no, raw in enumerate(lines, 1):
+        if not raw.strip():
+            continue
+        try:
+            fields = json.loads(raw.decode('utf-8-sig' if line_no == 1 else 'utf-8'))
+            if not isinstance(fields, dict):
+                raise ValueError("JSON 객체가 아닙니다.")
+            post = _finish_post(fields, str(fields.get("content") or ""), line_no)
+        except ValueError as e:
+            log(f"❌ 글을 건너뜁니다 ({filename} {line_no}번째 줄): {str(e)}")
+            continue
+        yield (hashlib.sha256(raw.rstrip(b'\r\n')).hexdigest(), *post)
+
+
+def _iter_front_matter_posts(lines, filename, log):
+    current = None  # 읽고 있는 글: [시작 줄 번호, 해시, 머리말 항목, 본문 줄 목록]
+    candidate = None  # 머리말일 수도 있는 --- 이후의 원본 줄들
+    candidate_start = 0
+
+    def finish():
+        start, digest, fields, body = current
+        try:
+            post = _finish_post(fields, ''.join(body), start)
+        except ValueError as e:
+            log(f"❌ 글을 건너뜁니다 ({filename} {start}번째 줄): {str(e)}")
+            return None
+        return (digest.hexdigest(), *post)
+
+    def add_body(raws):
+        if current is not None:
+            for raw in raws:
+                current[1].update(raw)
+                current[3].append(raw.decode('utf-8'))
+
+    for line_no, raw in enumerate(lines, 1):
+        text = raw.decode('utf-8-sig' if line_no == 1 else 'utf-8')
+        if candidate is None:
+            if text.strip() == FRONT_MATTER_DELIMITER:
+                candidate, candidate_start = [raw], line_no
+            else:
+                add_body([raw])
+            continue
+
+        if text.strip() != FRONT_MATTER_DELIMITER:
+            candidate.append(raw)
+            if not FRONT_MATTER_LINE_PATTERN.match(text.rstrip('\r\n')):
+                # 본문 안의 구분선(<hr>)이었으므로 본문으로 돌립니다.
+                add_body(candidate)
+                candidate = None
+            continue
+
+        fields = parse_front_matter(raw.decode('utf-8') for raw in candidate[1:])
+        # 글 중간의 머리말은 title이 있어야 합니다. (구분선 사이의 "요약: ..." 같은 본문을 새 글로 자르지 않도록)
+        # 파일 첫 머리말은 아는 항목이 하나라도 있으면 머리말로 보고, title이 없으면 그 글을 오류로 알립니다.
+        if fields is not None and "title" not in fields and (
+                current is not None or not any(key in fields for key in FRONT_MATTER_KEYS)):
+            fields = None
+        if fields is None:
+            # 머리말이 아닌 --- ~ --- 사이: 앞의 ---부터는 본문이고, 이번 ---가 새 머리말의 시작일 수 있습니다.
+            add_body(candidate)
+            candidate, candidate_start = [raw], line_no
+            continue
+
+        if current is not None:
+            post = finish()
+            if post:
+                yield post
+        digest = hashlib.sha256()
+        for header_raw in candidate + [raw]:
+            digest.update(header_raw)
+        current = [candidate_start, digest, fields, []]
+        candidate = None
+
+    if candidate is not None and current is not None:
+        if any(raw.strip() for raw in candidate[1:]):
+            add_body(candidate)
+        else:
+            # 파일 끝의 구분선은 글을 닫는 표시로 보고 본문에 넣지 않습니다.
+            for raw in candidate:
+                current[1].update(raw)
+    if current is None:
+        log(f"❌ front matter 머리말(--- ~ ---)을 찾을 수 없습니다: {filename}")
+        return
+    post = finish()
+    if post:
+        yield post
+
+
+def _finish_post(fields, body, line):
+    """(제목, 본문, 설정)을 만들고 제목이나 본문이 없으면 ValueError를 발생시킵니다.
+
+    설정의 line에는 글이 시작하는 줄 번호를 넣어 발행 실패 로그에 함께 표시합니다.
+    """
+    title = str(fields.get("title") or "").strip()
+    content = body.strip()
+    if not title:
+        raise ValueError("제목(title)이 없습니다.")
+    if not content:
+        raise ValueError("본문이 없습니다.")
+    meta = post_meta_from_fields(fields)
+    meta["line"] = line
+    return title, content, meta
+
+
+class PendingPosts:
+    """글 파일들에서 이 사이트에 아직 발행하지 않은 글을 차례로 읽어 주는 목록입니다.
+
+    만들 때 파일을 한 번 훑어 발행할 글 수(len)만 세고, 반복할 때마다 파일을 다시 한 줄씩 읽어
+    (파일 경로, 내용 해시, 제목, 본문, 설정)을 돌려줍니다. 반복하는 사이에 발행된 글은 건너뜁니다.
+    """
+
+    def __init__(self, file_paths, ledger, site, log=print):
+        self.file_paths = file_paths
+        self.ledger = ledger
+        self.site = site
+        self.log = log
+        self.count = 0
+        self.skipped = 0
+        for content_hash in self._iter_hashes(log):
+            if self.ledger.get_published_post_id(content_hash, self.site):
+                self.skipped += 1
+            else:
+                self.count += 1
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        # 형식 오류는 개수를 셀 때 이미 알렸으므로 다시 로그에 남기지 않습니다.
+        for file_path in self.file_paths:
+            try:
+                for content_hash, title, content, meta in iter_post_file(file_path, log=lambda message: None):
+                    if not self.ledger.get_published_post_id(content_hash, self.site):
+                        yield file_path, content_hash, title, content, meta
+            except (OSError, ValueError) as e:
+                self.log(f"❌ 파일 읽기 실패 ({os.path.basename(file_path)}): {str(e)}")
+
+    def _iter_hashes(self, log):
+        for file_path in self.file_paths:
+            try:
+                for content_hash, _, _, _ in iter_post_file(file_path, log=log):
+                    yield content_hash
+            except (OSError, ValueError) as e:
+                log(f"❌ 파일 읽기 실패 ({os.path.basename(file_path)}): {str(e)}")
+
+
+def map_bounded(executor, fn, items, limit):
+    """executor.map과 같지만 items를 미리 다 꺼내지 않고 최대 limit개만 제출해 둡니다.
+
+    결과는 입력 순서대로 돌려주며, 아주 긴 생성기를 넘겨도 대기 중인 작업이 limit개를 넘지 않습니다.
+    """
+    in_flight = deque()
+    for item in items:
+        if len(in_flight) >= limit:
+            yield in_flight.popleft().result()
+        in_flight.append(executor.submit(fn, item))
+    while in_flight:
+        yield in_flight.popleft().result()
+
+
+class PublishLedger:
+    """파일 내용 해시별로 사이트, 글 ID, 상태, 소요 시간을 기록하는 SQLite 발행 기록입니다.
+
+    같은 내용은 사이트마다 한 번만 발행되도록 일괄 발행 경로에서 먼저 확인합니다.
+    병렬 작업자가 함께 쓰므로 연결 하나를 잠금으로 보호합니다.
+    """
+
+    STATUS_PUBLISHING = "publishing"
+    STATUS_PUBLISHED = "published"
+    STATUS_FAILED = "failed"
+
+    def __init__(self, path=PUBLISH_LEDGER_FILE):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS posts (
+                    content_hash TEXT NOT NULL,
+                    site TEXT NOT NULL,
+                    file_name TEXT,
+                    post_id TEXT,
+                    status TEXT NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    duration REAL,
+                    error TEXT,
+                    PRIMARY KEY (content_hash, site)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS media (
+                    content_hash TEXT NOT NULL,
+                    site TEXT NOT NULL,
+                    file_name TEXT,
+                    media_id TEXT NOT NULL,
+                    source_url TEXT NOT NULL,
+                    uploaded_at REAL,
+                    PRIMARY KEY (content_hash, site)
+                )
+            """)
+
+    def get_published_post_id(self, content_hash, site):
+        """이미 발행된 내용이면 글 ID를, 아니면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT post_id FROM posts WHERE content_hash = ? AND site = ? AND status = ?",
+                (content_hash, site, self.STATUS_PUBLISHED)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record_start(self, content_hash, site, file_name):
+        """발행 시작을 기록합니다. (중단되면 'publishing' 상태로 남아 다음 실행에서 다시 시도)"""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO posts (content_hash, site, file_name, status, started_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (content_hash, site) DO UPDATE SET
+                    file_name = excluded.file_name, status = excluded.status,
+                    started_at = excluded.started_at, finished_at = NULL, duration = NULL, error = NULL
+            """, (content_hash, site, file_name, self.STATUS_PUBLISHING, time.time()))
+
+    def record_result(self, content_hash, site, post_id, error=None):
+        """발행 결과(글 ID 또는 오류)와 소요 시간을 기록합니다."""
+        status = self.STATUS_PUBLISHED if post_id and not error else self.STATUS_FAILED
+        finished_at = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("""
+                UPDATE posts SET post_id = ?, status = ?, finished_at = ?,
+                    duration = ? - COALESCE(started_at, ?), error = ?
+                WHERE content_hash = ? AND site = ?
+            """, (str(post_id) if post_id else None, status, finished_at,
+                  finished_at, finished_at, error, content_hash, site))
+
+    def get_media(self, content_hash, site):
+        """이미 올린 미디어 파일이면 (미디어 ID, 주소)를, 아니면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT media_id, source_url FROM media WHERE content_hash = ? AND site = ?",
+                (content_hash, site)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def record_media(self, content_hash, site, file_name, media_id, source_url):
+        """올린 미디어 파일의 ID와 주소를 기록합니다."""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO media (content_hash, site, file_name, media_id, source_url, uploaded_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (content_hash, site, file_name, str(media_id), source_url, time.time()))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RunLog:
+    """로그 메시지, 단계별 소요 시간, 발행 결과를 JSON 한 줄씩 파일에 남기는 실행 기록입니다.
+
+    write는 큐에 넣기만 하고, 디스크 쓰기와 크기 기준 순환은 QueueListener의
+    백그라운드 스레드가 맡으므로 발행 스레드는 파일 입출력을 기다리지 않습니다.
+    한 줄에는 ts, time, run, event와 이벤트별 필드가 들어갑니다.
+    """
+
+    def __init__(self, path=RUN_LOG_FILE, max_bytes=RUN_LOG_MAX_BYTES, backup_count=RUN_LOG_BACKUP_COUNT):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self._handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True
+        )
+        self._handler.setFormatter(logging.Formatter('%(message)s'))
+        self._queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(self._queue, self._handler)
+        self._listener.start()
+        self._closed = False
+
+    def write(self, event, **fields):
+        """이벤트 한 건을 기록 대기열에 넣습니다. (어느 스레드에서 불러도 안전)"""
+        if self._closed:
+            return
+        now = time.time()
+        record = {
+            "ts": round(now, 3),
+            "time": time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(now)),
+            "run": self.run_id,
+            "event": event,
+            **fields,
+        }
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        self._queue.put(logging.makeLogRecord({'msg': line, 'levelno': logging.INFO, 'levelname': 'INFO'}))
+
+    def close(self):
+        """남은 기록을 모두 쓰고 파일을 닫습니다."""
+        if self._closed:
+            return
+        self._closed = True
+        self._listener.stop()
+        self._handler.close()
+
+
+class SelectorMemory:
+    """단계별로 성공한 CSS 선택자를 사이트·WordPress 버전마다 기억해 다음에 먼저 시도하게 합니다.
+
+    파일 하나를 병렬 작업자가 함께 쓰므로 같은 경로에는 인스턴스 하나만 만듭니다(for_path).
+    기록(record)은 메모리에만 쌓고 실행이 끝날 때 flush_all로 한 번에 저장합니다. 저장할 때는 파일을 다시 읽어
+    아직 쓰지 않은 증가분만 더하므로, 같은 파일을 쓰는 다른 버전·다른 사이트 작업자의 기록을 덮어쓰지 않습니다.
+
+    정렬은 호출하는 쪽이 나눈 단계(tier) 안에서만 하므로, 한 번 맞았던 범용 선택자(.wp-block 등)가
+    구체적인 선택자보다 앞서지 않습니다.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+    _file_locks = {}  # 경로 -> 저장 잠금 (버전이 다른 인스턴스도 같은 파일을 씀)
+
+    def __init__(self, path, wp_version):
+        self.path = path
+        self.wp_version = wp_version or "unknown"
+        self._lock = threading.Lock()
+        self.steps = self._read().get(self.wp_version, {})
+        self._pending = {}  # 단계 -> 아직 파일에 쓰지 않은 증가분
+
+    @classmethod
+    def for_path(cls, path, wp_version):
+        """경로와 버전별로 하나의 인스턴스를 반환합니다."""
+        with cls._instances_lock:
+            key = (path, wp_version or "unknown")
+            if key not in cls._instances:
+                cls._instances[key] = cls(path, wp_version)
+            return cls._instances[key]
+
+    @classmethod
+    def _file_lock(cls, path):
+        with cls._instances_lock:
+            return cls._file_locks.setdefault(path, threading.Lock())
+
+    @staticmethod
+    def _new_stats():
+        return {"hits": {}, "attempts": 0, "first_try": 0, "lookup_time": 0.0}
+
+    @staticmethod
+    def _add(stats, delta):
+        hits = stats.setdefault("hits", {})
+        for selector, count in delta["hits"].items():
+            hits[selector] = hits.get(selector, 0) + count
+        for key in ("attempts", "first_try", "lookup_time"):
+            stats[key] = stats.get(key, 0) + delta[key]
+
+    def order(self, step, *tiers):
+        """단계(tier)마다 많이 성공한 선택자부터 정렬해 이어 붙입니다. (같으면 원래 순서 유지)
+
+        앞 단계의 선택자는 뒤 단계의 선택자가 아무리 많이 맞았어도 항상 앞에 옵니다.
+        """
+        with self._lock:
+            hits = self.steps.get(step, {}).get("hits", {})
+            return [selector for tier in tiers
+                    for selector in sorted(tier, key=lambda selector: -hits.get(selector, 0))]
+
+    def record(self, step, selector, used_index, elapsed):
+        """성공한 선택자와, 정렬된 목록에서의 순서·찾는 데 걸린 시간을 메모리에 기록합니다. (저장은 flush)"""
+        delta = {"hits": {selector: 1}, "attempts": 1,
+                 "first_try": 1 if used_index == 0 else 0, "lookup_time": elapsed}
+        with self._lock:
+            self._add(self.steps.setdefault(step, self._new_stats()), delta)
+            self._add(self._pending.setdefault(step, self._new_stats()), delta)
+
+    def flush(self):
+        """아직 저장하지 않은 기록이 있으면 파일에 저장합니다."""
+        with self._lock:
+            if self._pending:
+                self._save()
+
+    @classmethod
+    def flush_all(cls):
+        """이 프로세스에서 쓴 모든 선택자 기억을 저장합니다."""
+        with cls._instances_lock:
+            instances = list(cls._instances.values())
+        for memory in instances:
+            memory.flush()
+
+    def summary(self):
+        """단계별 첫 시도 적중률과 평균 찾기 시간을 줄 단위로 반환합니다.
+
+        find_first는 후보를 한 번의 호출로 모두 확인하므로 순서를 바꿔도 호출 수는 같습니다.
+        적중률은 기억한 순서의 맨 앞 선택자가 실제로 쓰인 비율입니다.
+        """
+        lines = []
+        with self._lock:
+            for step, stats in self.steps.items():
+                attempts = stats.get("attempts", 0)
+                if not attempts:
+                    continue
+                hit_rate = stats.get("first_try", 0) * 100 / attempts
+                average = stats.get("lookup_time", 0.0) / attempts
+                lines.append(f"{step}: 첫 시도 적중 {hit_rate:.0f}% ({attempts}회), 평균 찾기 {average:.3f}초")
+        return lines
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self):
+        """파일을 다시 읽어 아직 쓰지 않은 증가분을 더한 뒤 저장합니다."""
+        with self._file_lock(self.path):
+            data = self._read()
+            steps = data.setdefault(self.wp_version, {})
+            for step, delta in self._pending.items():
+                self._add(steps.setdefault(step, self._new_stats()), delta)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        self.steps = steps
+        self._pending = {}
+
+
+class WebDriverProfiler:
+    """WebDriver 명령(이름, 단계, 소요 시간, 성공 여부)과 sleep 대기를 단계별로 기록합니다.
+
+    attach(driver)는 driver.execute를 감싸므로 WebElement 명령까지 모두 기록되고, 대기는 앱이 time.sleep 대신
+    부르는 sleep()으로 잽니다. (time 모듈을 바꾸지 않으므로 다른 스레드의 sleep은 섞이지 않음)
+    단계 시간은 하위 단계를 뺀 값이라 단계별 합이 전체 시간과 같습니다.
+    """
+
+    OTHER_STEP = "기타"
+
+    def __init__(self):
+        self.commands = []
+        self.sleeps = []
+        self.step_wall = {}
+        self.started = time.time()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def attach(self, driver):
+        """driver의 모든 명령을 기록하도록 감쌉니다."""
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            started = time.perf_counter()
+            succeeded = False
+            try:
+                result = original_execute(driver_command, params)
+                succeeded = True
+                return result
+            finally:
+                self._record(self.commands, {
+                    "command": driver_command,
+                    "step": self.current_step(),
+                    "duration": time.perf_counter() - started,
+                    "success": succeeded,
+                })
+
+        driver.execute = execute
+
+    def sleep(self, seconds):
+        """seconds만큼 쉬고, 쉰 시간을 현재 단계의 대기 시간으로 기록합니다."""
+        started = time.perf_counter()
+        try:
+            time.sleep(seconds)
+        finally:
+            self._record(self.sleeps, {
+                "step": self.current_step(),
+                "duration": time.perf_counter() - started,
+            })
+
+    def current_step(self):
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1][0] if stack else self.OTHER_STEP
+
+    @contextlib.contextmanager
+    def step(self, name):
+        """with 블록 안의 명령과 대기를 name 단계로 기록합니다."""
+        stack = self._local.__dict__.setdefault('stack', [])
+        frame = [name, time.perf_counter(), 0.0]  # 이름, 시작 시각, 하위 단계 시간
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            total = time.perf_counter() - frame[1]
+            if stack:
+                stack[-1][2] += total
+            with self._lock:
+                self.step_wall[name] = self.step_wall.get(name, 0.0) + total - frame[2]
+
+    def _record(self, target, entry):
+        with self._lock:
+            target.append(entry)
+
+    def breakdown(self):
+        """단계별 명령 수, 명령 시간, 대기 시간, 전체 시간을 계산합니다."""
+        with self._lock:
+            steps = {}
+            for name, wall in self.step_wall.items():
+                steps[name] = {"commands": 0, "failed": 0, "command_time": 0.0, "sleep_time": 0.0, "wall_time": wall}
+            for entry in self.commands:
+                stats = steps.setdefault(entry["step"], {"commands": 0, "failed": 0, "command_time": 0.0,
+                                                         "sleep_time": 0.0, "wall_time": 0.0})
+                stats["commands"] += 1
+                stats["failed"] += 0 if entry["success"] else 1
+                stats["command_time"] += entry["duration"]
+            for entry in self.sleeps:
+                stats = steps.setdefault(entry["step"], {"commands": 0, "failed": 0, "command_time": 0.0,
+                                                         "sleep_time": 0.0, "wall_time": 0.0})
+                stats["sleep_time"] += entry["duration"]
+            return steps
+
+    def report_lines(self):
+        """단계별 요약을 로그용 문자열 목록으로 반환합니다."""
+        lines = []
+        for name, stats in self.breakdown().items():
+            lines.append(f"{name}: 명령 {stats['commands']}회 (실패 {stats['failed']}), "
+                         f"전체 {stats['wall_time']:.2f}초 = 명령 {stats['command_time']:.2f}초 + "
+                         f"대기 {stats['sleep_time']:.2f}초 + 기타")
+        total_commands = len(self.commands)
+        total_sleep = sum(entry["duration"] for entry in self.sleeps)
+        lines.append(f"합계: 명령 {total_commands}회, 대기 {total_sleep:.2f}초, "
+                     f"실행 시간 {time.time() - self.started:.2f}초")
+        return lines
+
+    def dump(self, path):
+        """기록 전체를 JSON 파일로 저장합니다. (실행 전후 비교용)"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._lock:
+            data = {
+                "started": self.started,
+                "commands": list(self.commands),
+                "sleeps": list(self.sleeps),
+            }
+        data["steps"] = self.breakdown()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+class WordPressRestPublisher:
+    """WordPress REST API(/wp-json/wp/v2/posts)로 브라우저 없이 글을 발행합니다.
+
+    인증은 WordPress 애플리케이션 비밀번호(Basic 인증)를 사용합니다.
+    """
+
+    def __init__(self, domain, username, app_password, timeout=30):
+        self.domain = domain.rstrip('/')
+        self.username = username
+        self.app_password = app_password
+        self.timeout = timeout
+        self._term_ids = {}  # (분류, 소문자 이름) -> ID
+        self._term_lock = threading.Lock()
+
+    def api_url(self, route):
+        """wp-json 경로의 전체 URL을 만듭니다."""
+        return f"{self.domain}/wp-json/{route.lstrip('/')}"
+
+    def auth_header(self):
+        """애플리케이션 비밀번호로 Basic 인증 헤더 값을 만듭니다."""
+        # 애플리케이션 비밀번호는 공백이 포함된 형태로 복사되는 경우가 많아 제거합니다.
+        credentials = f"{self.username}:{self.app_password.replace(' ', '')}"
+        token = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+        return f"Basic {token}"
+
+    def request(self, method, route, payload=None):
+        """REST API를 호출하고 JSON 응답을 반환합니다.
+
+        실패하면 urllib.error.HTTPError / URLError를 그대로 발생시킵니다.
+        """
+        data = None
+        headers = {
+            "Authorization": self.auth_header(),
+            "Accept": "application/json",
+        }
+        if payload is not None:
+            data = json.dumps(payload).encode('utf-8')
+            headers["Content-Type"] = "application/json; charset=utf-8"
+
+        req = urllib.request.Request(self.api_url(route), data=data, headers=headers, method=method)
+        with urllib.request.urlopen(req, timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def create_post(self, title, content, status="publish", post_date=None, meta=None):
+        """글 하나를 한 번의 HTTP 요청으로 발행하고 생성된 글 정보를 반환합니다.
+
+        post_date(UTC datetime)가 미래이면 WordPress가 그 시각에 예약 발행합니다.
+        meta(글 파일의 설정)가 있으면 그 status와 slug를 쓰고, categories/tags 이름은 ID로 바꿔 보냅니다.
+        """
+        meta = meta or {}
+        terms = {key: self.term_ids(key, meta[key]) for key in ("categories", "tags") if meta.get(key)}
+        payload = self.post_payload(title, content, meta.get("status", status), post_date, meta.get("slug"), **terms)
+        return self.request("POST", "wp/v2/posts", payload)
+
+    @staticmethod
+    def post_payload(title, content, status="publish", post_date=None, slug=None, categories=None, tags=None):
+        """글 생성 요청 본문을 만듭니다. (categories, tags는 ID 목록)"""
+        payload = {
+            "title": title,
+            "content": content,
+            "status": status,
+        }
+        if post_date:
+            payload["date_gmt"] = post_date.strftime('%Y-%m-%dT%H:%M:%S')
+        if slug:
+            payload["slug"] = slug
+        if categories:
+            payload["categories"] = categories
+        if tags:
+            payload["tags"] = tags
+        return payload
+
+    def term_ids(self, taxonomy, names):
+        """분류(categories 또는 tags) 이름 목록을 ID 목록으로 바꿉니다.
+
+        없는 이름은 새로 만들고, 찾은 ID는 기억해 두어 같은 이름은 한 번만 조회합니다.
+        동시에 같은 이름을 두 번 만들지 않도록 조회와 생성은 잠금 안에서 합니다.
+        """
+        ids = []
+        for name in names:
+            key = (taxonomy, name.lower())
+            with self._term_lock:
+                if key not in self._term_ids:
+                    self._term_ids[key] = self._find_or_create_term(taxonomy, name)
+                ids.append(self._term_ids[key])
+        return ids
+
+    def _find_or_create_term(self, taxonomy, name):
+        query = urlencode({"search": name, "per_page": 100})
+        for term in self.request("GET", f"wp/v2/{taxonomy}?{query}"):
+            # REST 응답의 이름은 HTML 이스케이프되어 있습니다. (예: &amp;)
+            if html.unescape(term.get("name", "")).lower() == name.lower():
+                return term["id"]
+        return self.request("POST", f"wp/v2/{taxonomy}", {"name": name})["id"]
+
+    def upload_media(self, file_path):
+        """파일 하나를 미디어 라이브러리(/wp/v2/media)에 올리고 생성된 미디어 정보를 반환합니다."""
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        file_name = os.path.basename(file_path)
+        headers = {
+            "Authorization": self.auth_header(),
+            "Accept": "application/json",
+            "Content-Type": mimetypes.guess_type(file_name)[0] or "application/octet-stream",
+            # WordPress는 filename= 값만 읽으며, HTTP 헤더에는 ASCII만 쓸 수 있어 한글 이름은 % 인코딩합니다.
+            "Content-Disposition": f'attachment; filename="{quote(file_name)}"',
+        }
+        req = urllib.request.Request(self.api_url("wp/v2/media"), data=data, headers=headers, method="POST")
+        with urllib.request.urlopen(req, timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    @staticmethod
+    def error_body(error):
+        """HTTPError 응답 본문(JSON)을 dict로 반환합니다. 본문은 한 번만 읽을 수 있어 오류 객체에 보관합니다."""
+        if not hasattr(error, 'wp_error_body'):
+            try:
+                body = json.loads(error.read().decode('utf-8'))
+            except Exception:
+                body = None
+            error.wp_error_body = body if isinstance(body, dict) else {}
+        return error.wp_error_body
+
+    @staticmethod
+    def describe_error(error):
+        """HTTPError 응답 본문에서 WordPress 오류 메시지를 꺼냅니다."""
+        body = WordPressRestPublisher.error_body(error)
+        if not body:
+            return f"HTTP {error.code}: {error.reason}"
+        return f"{body.get('code', error.code)}: {body.get('message', error.reason)}"
+
+    @staticmethod
+    def is_rest_unavailable(error):
+        """REST API 경로가 없거나 사이트에서 REST API/앱 비밀번호를 꺼 둔 오류인지 확인합니다.
+
+        잘못된 아이디·비밀번호 같은 일반 인증 오류(401/403)는 해당하지 않습니다.
+        """
+        if error.code in REST_FALLBACK_STATUS_CODES:
+            return True
+        code = WordPressRestPublisher.error_body(error).get('code')
+        return error.code in (401, 403) and code in REST_DISABLED_ERROR_CODES
+
+
+def resolve_credential(reference):
+    """설정 파일의 비밀번호 참조를 실제 값으로 바꿉니다.
+
+    "env:이름"은 환경 변수, "file:경로"는 파일 내용이며, 그 외 문자열은 그대로 사용합니다.
+    """
+    reference = (reference or "").strip()
+    if reference.startswith("env:"):
+        name = reference[4:]
+        if name not in os.environ:
+            raise ValueError(f"환경 변수 {name}이(가) 설정되지 않았습니다.")
+        return os.environ[name]
+    if reference.startswith("file:"):
+        with open(os.path.expanduser(reference[5:]), 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    return reference
+
+
+def load_sites_config(path):
+    """여러 사이트 설정 파일(JSON)을 읽어 사이트별 설정 목록을 반환합니다.
+
+    {"sites": [...]} 또는 목록 형식이며, 사이트마다 domain, username, content_dir, backend(rest/xmlrpc/selenium),
+    concurrency와 선택 항목 rate_per_minute, burst, window_minutes, keep_session을 가집니다.
+    비밀번호(참조)는 로그인 비밀번호 password와 애플리케이션 비밀번호 app_password 중 하나 이상이 있어야 하며,
+    selenium 방식에는 password가 필요합니다. 형식이 틀리면 ValueError를 발생시킵니다.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    entries = data.get("sites", []) if isinstance(data, dict) else data
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("설정 파일에 사이트가 없습니다.")
+
+    sites = []
+    for index, entry in enumerate(entries, 1):
+        missing = [key for key in ("domain", "username", "content_dir") if not entry.get(key)]
+        if not entry.get("password") and not entry.get("app_password"):
+            missing.append("password 또는 app_password")
+        if missing:
+            raise ValueError(f"{index}번째 사이트에 {', '.join(missing)} 항목이 없습니다.")
+        domain = entry["domain"].strip().rstrip('/')
+        if not domain.startswith(('http://', 'https://')):
+            domain = 'https://' + domain
+        backend = entry.get("backend", "rest")
+        if backend not in SITE_BACKENDS:
+            raise ValueError(f"{domain}: 지원하지 않는 발행 방식입니다: {backend} ({', '.join(SITE_BACKENDS)})")
+        if backend == "selenium" and not entry.get("password"):
+            raise ValueError(f"{domain}: selenium 방식은 브라우저로 로그인하므로 password 항목이 필요합니다.")
+        sites.append({
+            "domain": domain,
+            "username": entry["username"],
+            "password": entry.get("password", ""),
+            "app_password": entry.get("app_password", ""),
+            "content_dir": os.path.expanduser(entry["content_dir"]),
+            "backend": backend,
+            "concurrency": max(1, int(entry.get("concurrency", 1))),
+            "rate_per_minute": entry.get("rate_per_minute", DEFAULT_PUBLISH_RATE_PER_MINUTE),
+            "burst": entry.get("burst", DEFAULT_PUBLISH_BURST),
+            "window_minutes": entry.get("window_minutes", DEFAULT_PUBLISH_WINDOW_MINUTES),
+            "keep_session": bool(entry.get("keep_session", False)),
+        })
+    return sites
+
+
+class FixedVar:
+    """tk 변수 대신 쓰는 고정 값입니다. (사이트별 작업자 복사본이 GUI 입력 대신 설정 값을 읽도록 함)"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class HeadlessRoot:
+    """GUI 없이 실행할 때 tk 루트 대신 쓰는 객체입니다. 화면 갱신 예약(after)은 무시합니다."""
+
+    def after(self, delay_ms, callback=None, *args):
+        return None
+
+
+class RecentLogQueue(queue.Queue):
+    """가장 최근 limit개만 남기는 로그 큐입니다. (GUI 없이 실행할 때 log_queue로 사용)
+
+    headless 실행에는 큐를 비우는 flush_log_queue가 돌지 않으므로, 가득 차면 가장 오래된 줄을 버려
+    오래 도는 감시·다중 사이트 실행에서도 메모리가 늘지 않게 합니다. 전체 로그는 실행 기록(RunLog)에 남습니다.
+    """
+
+    def __init__(self, limit=LOG_MAX_LINES):
+        super().__init__()
+        self.limit = limit
+
+    def _put(self, item):
+        if len(self.queue) >= self.limit:
+            self.queue.popleft()
+        self.queue.append(item)
+
+
+class PublishScheduler:
+    """사이트 하나로 보내는 발행 요청의 속도와 동시 실행 수를 제한합니다.
+
+    - 토큰 버킷: 분당 rate_per_minute개씩 채워지고 최대 burst개까지 쌓입니다.
+    - 동시 실행: 한 번에 max_concurrent개 글까지만 발행합니다. (0이면 제한 없음)
+    - 예약 발행: plan_window로 글 수와 시간 범위를 정하면 next_publish_date가 글마다
+      고르게 나뉜 발행 시각을 돌려줍니다. (첫 글은 바로 발행)
+
+    병렬 작업자가 함께 쓰도록 사이트마다 인스턴스 하나만 만듭니다(for_site).
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, rate_per_minute=DEFAULT_PUBLISH_RATE_PER_MINUTE, burst=DEFAULT_PUBLISH_BURST,
+                 max_concurrent=DEFAULT_PUBLISH_CONCURRENCY):
+        self.rate_per_minute = rate_per_minute
+        self.burst = max(1, burst)
+        self.max_concurrent = max_concurrent
+        self._semaphore = threading.BoundedSemaphore(max_concurrent) if max_concurrent > 0 else None
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._dates = []
+
+    @classmethod
+    def for_site(cls, site, rate_per_minute=DEFAULT_PUBLISH_RATE_PER_MINUTE, burst=DEFAULT_PUBLISH_BURST,
+                 max_concurrent=DEFAULT_PUBLISH_CONCURRENCY):
+        """사이트별로 하나의 인스턴스를 반환합니다. 설정이 바뀌었으면 새로 만듭니다."""
+        settings = (rate_per_minute, max(1, burst), max_concurrent)
+        with cls._instances_lock:
+            scheduler = cls._instances.get(site)
+            if scheduler is None or scheduler.settings() != settings:
+                scheduler = cls._instances[site] = cls(rate_per_minute, burst, max_concurrent)
+            return scheduler
+
+    def settings(self):
+        return (self.rate_per_minute, self.burst, self.max_concurrent)
+
+    def _take_token(self):
+        """토큰 하나를 가져오면 0을, 모자라면 다음 토큰까지 남은 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_minute / 60)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) * 60 / self.rate_per_minute
+
+    def acquire(self, tokens=1):
+        """토큰 tokens개를 얻을 때까지 기다리고, 기다린 시간(초)을 반환합니다."""
+        if self.rate_per_minute <= 0:
+            return 0.0
+        waited = 0.0
+        for _ in range(tokens):
+            while True:
+                delay = self._take_token()
+                if not delay:
+                    break
+                time.sleep(delay)
+                waited += delay
+        return waited
+
+    async def acquire_async(self, tokens=1):
+        """acquire와 같지만 스레드 대신 이벤트 루프에서 기다립니다."""
+        if self.rate_per_minute <= 0:
+            return 0.0
+        waited = 0.0
+        for _ in range(tokens):
+            while True:
+                delay = self._take_token()
+                if not delay:
+                    break
+                await asyncio.sleep(delay)
+                waited += delay
+        return waited
+
+    @contextlib.contextmanager
+    def slot(self):
+        """동시 실행 자리와 토큰 하나를 얻은 동안 발행합니다. with 값은 기다린 시간(초)입니다."""
+        with self._semaphore or contextlib.nullcontext():
+            yield self.acquire()
+
+    def plan_window(self, count, window_minutes, start=None):
+        """count개 글을 start(기본: 지금)부터 window_minutes분에 고르게 나눠 발행하도록 시각을 정합니다."""
+        with self._lock:
+            if count <= 0 or window_minutes <= 0:
+                self._dates = []
+                return []
+            start = start or datetime.now(timezone.utc)
+            interval = timedelta(minutes=window_minutes) / count
+            self._dates = [start + interval * index for index in range(count)]
+            return list(self._dates)
+
+    def next_publish_date(self):
+        """다음 글의 예약 발행 시각(UTC datetime)을 반환합니다. 바로 발행할 글이면 None."""
+        with self._lock:
+            if not self._dates:
+                return None
+            post_date = self._dates.pop(0)
+        return post_date if post_date > datetime.now(timezone.utc) + timedelta(seconds=60) else None
+
+
+class AsyncHttpConnectionPool:
+    """aiohttp가 없을 때 쓰는 asyncio 스트림 기반 HTTP/1.1 keep-alive 연결 풀입니다. (호스트 하나용)
+
+    최대 size개 연결을 열어 두고 요청이 끝난 연결을 다음 요청에 다시 씁니다.
+    """
+
+    def __init__(self, base_url, size=DEFAULT_ASYNC_CONCURRENCY, timeout=30):
+        parsed = urlparse(base_url)
+        self.host = parsed.hostname
+        self.use_tls = parsed.scheme == 'https'
+        self.port = parsed.port or (443 if self.use_tls else 80)
+        self.timeout = timeout
+        self.opened = 0
+        self._ssl_context = ssl.create_default_context() if self.use_tls else None
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle = []  # (reader, writer, 마지막 사용 시각)
+
+    async def _connect(self):
+        self.opened += 1
+        return await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self._ssl_context,
+                                    server_hostname=self.host if self.use_tls else None),
+            self.timeout
+        )
+
+    async def _checkout(self):
+        """쉬고 있는 연결 중 아직 살아 있는 것을, 없으면 새 연결을 (reader, writer, 재사용 여부)로 반환합니다."""
+        while self._idle:
+            reader, writer, last_used = self._idle.pop()
+            if reader.at_eof() or time.monotonic() - last_used > ASYNC_IDLE_CONNECTION_TIMEOUT:
+                writer.close()
+                continue
+            return reader, writer, True
+        reader, writer = await self._connect()
+        return reader, writer, False
+
+    async def request(self, method, url, headers, body=None):
+        """요청 하나를 보내고 (상태 코드, 사유, 응답 본문)을 반환합니다.
+
+        다시 쓴 연결이 서버가 이미 닫은 연결이면(연결 재설정, 빈 응답) 새 연결로 한 번만 다시 보냅니다.
+        단, 요청을 이미 보낸 뒤에 끊긴 POST는 서버가 글을 만들었을 수 있으므로 다시 보내지 않고 오류로 알립니다.
+        """
+        async with self._semaphore:
+            reader, writer, reused = await self._checkout()
+            sent = False
+            try:
+                await asyncio.wait_for(self._send(writer, method, url, headers, body), self.timeout)
+                sent = True
+                return await self._receive(reader, writer, method)
+            except ConnectionError:
+                writer.close()
+                if not reused or (sent and method not in ASYNC_RETRY_SAFE_METHODS):
+                    raise
+            except BaseException:
+                writer.close()
+                raise
+
+            reader, writer = await self._connect()
+            try:
+                await asyncio.wait_for(self._send(writer, method, url, headers, body), self.timeout)
+                return await self._receive(reader, writer, method)
+            except BaseException:
+                writer.close()
+                raise
+
+    async def _send(self, writer, method, url, headers, body):
+        parsed = urlparse(url)
+        target = parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        host = self.host if parsed.port is None else f"{self.host}:{self.port}"
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}", "Connection: keep-alive",
+                 f"Content-Length: {len(body or b'')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + (body or b''))
+        await writer.drain()
+
+    async def _receive(self, reader, writer, method):
+        """응답을 읽고, keep-alive 연결이면 다음 요청을 위해 풀에 돌려놓습니다."""
+        status, reason, keep_alive, data = await asyncio.wait_for(self._read_response(reader, method), self.timeout)
+        if keep_alive:
+            self._idle.append((reader, writer, time.monotonic()))
+        else:
+            writer.close()
+        return status, reason, data
+
+    async def _read_response(self, reader, method):
+        status_line = (await reader.readline()).decode('latin-1').strip()
+        if not status_line:
+            raise ConnectionError("서버가 응답 없이 연결을 닫았습니다.")
+        version, status, reason = (status_line.split(' ', 2) + [''])[:3]
+        status = int(status)
+
+        response_headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        connection = response_headers.get('connection', '').lower()
+        keep_alive = connection != 'close' and (version != 'HTTP/1.0' or connection == 'keep-alive')
+
+        if status in (204, 304) or 100 <= status < 200 or method == 'HEAD':
+            data = b''
+        elif 'chunked' in response_headers.get('transfer-encoding', '').lower():
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0].strip(), 16)
+                if size == 0:
+                    # 마지막 빈 줄(과 trailer)까지 읽어 다음 응답과 섞이지 않게 합니다.
+                    while (await reader.readline()).strip():
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b''.join(chunks)
+        elif 'content-length' in response_headers:
+            data = await reader.readexactly(int(response_headers['content-length']))
+        else:
+            data = await reader.read()
+            keep_alive = False
+        return status, reason, keep_alive, data
+
+    async def close(self):
+        while self._idle:
+            _, writer, _ = self._idle.pop()
+            writer.close()
+
+
+class AsyncWordPressRestPublisher(WordPressRestPublisher):
+    """asyncio로 여러 글을 동시에 발행하는 REST API 클라이언트입니다.
+
+    사이트마다 concurrency개의 keep-alive(TLS) 연결을 유지하며 요청마다 새로 연결하지 않습니다.
+    aiohttp가 설치되어 있으면 aiohttp를, 없으면 표준 라이브러리 AsyncHttpConnectionPool을 사용합니다.
+    "async with" 안에서 사용하며, 오류 응답은 동기 버전과 같이 urllib.error.HTTPError로 발생시킵니다.
+    """
+
+    def __init__(self, domain, username, app_password, concurrency=DEFAULT_ASYNC_CONCURRENCY, timeout=30):
+        super().__init__(domain, username, app_password, timeout)
+        self.concurrency = concurrency
+        self._session = None
+        self._pool = None
+
+    async def __aenter__(self):
+        if AIOHTTP_AVAILABLE:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        else:
+            self._pool = AsyncHttpConnectionPool(self.domain, self.concurrency, self.timeout)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._session:
+            await self._session.close()
+        if self._pool:
+            await self._pool.close()
+
+    def connections_opened(self):
+        """지금까지 연 연결 수를 반환합니다. (aiohttp 사용 시 None)"""
+        return self._pool.opened if self._pool else None
+
+    async def request_async(self, method, route, payload=None):
+        """request의 비동기 버전입니다."""
+        url = self.api_url(route)
+        headers = {
+            "Authorization": self.auth_header(),
+            "Accept": "application/json",
+        }
+        body = None
+        if payload is not None:
+            body = json.dumps(payload).encode('utf-8')
+            headers["Content-Type"] = "application/json; charset=utf-8"
+
+        if self._session:
+            async with self._session.request(method, url, data=body, headers=headers) as response:
+                status, reason, data = response.status, response.reason, await response.read()
+        else:
+            status, reason, data = await self._pool.request(method, url, headers, body)
+
+        if status >= 400:
+            raise urllib.error.HTTPError(url, status, reason, None, io.BytesIO(data))
+        return json.loads(data.decode('utf-8'))
+
+    async def create_post_async(self, title, content, status="publish", post_date=None, meta=None):
+        """create_post의 비동기 버전입니다.
+
+        분류 이름 -> ID 조회는 이름마다 처음 한 번뿐이라 기존 term_ids를 작업 스레드에서 그대로 씁니다.
+        """
+        meta = meta or {}
+        terms = {}
+        for key in ("categories", "tags"):
+            if meta.get(key):
+                terms[key] = await asyncio.to_thread(self.term_ids, key, meta[key])
+        payload = self.post_payload(title, content, meta.get("status", status), post_date, meta.get("slug"), **terms)
+        return await self.request_async("POST", "wp/v2/posts", payload)
+
+
+class MediaUploader:
+    """본문의 로컬 이미지(<img src="...">)를 미디어 라이브러리에 올리고 src를 업로드된 주소로 바꿉니다.
+
+    같은 내용의 파일은 발행 기록의 media 표(내용 해시 -> 미디어 ID/주소)로 한 번만 올리고,
+    새 파일은 작업자 max_workers개가 동시에 올립니다. 여러 글이 같은 이미지를 동시에 올리지 않도록
+    업로드는 (사이트, 내용 해시)마다 하나씩만 진행하고, 기다린 쪽은 먼저 올린 결과를 재사용합니다.
+    """
+
+    _upload_locks = {}  # (사이트, 내용 해시) -> 업로드 잠금 (프로세스 안의 모든 업로더가 공유)
+    _upload_locks_lock = threading.Lock()
+
+    def __init__(self, publisher, ledger, site, max_workers=MEDIA_UPLOAD_WORKERS, log=print):
+        self.publisher = publisher
+        self.ledger = ledger
+        self.site = site
+        self.max_workers = max_workers
+        self.log = log
+
+    def _upload_lock(self, content_hash):
+        with self._upload_locks_lock:
+            return self._upload_locks.setdefault((self.site, content_hash), threading.Lock())
+
+    def upload_once(self, content_hash, path):
+        """이미지 하나를 올리고 (주소, 새로 올렸는지)를 반환합니다. 다른 글이 먼저 올렸으면 그 기록을 씁니다."""
+        with self._upload_lock(content_hash):
+            cached = self.ledger.get_media(content_hash, self.site)
+            if cached:
+                return cached[1], False
+            media = self.publisher.upload_media(path)
+            self.ledger.record_media(content_hash, self.site, os.path.basename(path),
+                                     media.get('id'), media.get('source_url'))
+        self.log(f"🖼️ 이미지 업로드 완료: {os.path.basename(path)} (ID: {media.get('id')})")
+        return media.get('source_url'), True
+
+    @staticmethod
+    def is_local_source(src):
+        """txt 파일 폴더 기준 상대 경로, file: 주소, Windows 드라이브 경로처럼 로컬 파일을 가리키는지 확인합니다.
+
+        http(s)://, //, data: 같은 주소와 사이트 기준 경로(/wp-content/...), ?·#로 시작하는 값은
+        이미 사이트에 있는 이미지이므로 로컬 파일로 보지 않습니다.
+        """
+        src = src.strip()
+        if src.lower().startswith('file:'):
+            return True
+        if re.match(r'^[a-zA-Z]:[\\/]', src):  # Windows 드라이브 경로
+            return True
+        return bool(src) and not re.match(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|[/?#])', src)
+
+    @staticmethod
+    def resolve_path(src, base_dir):
+        """src 값을 txt 파일 폴더 기준의 로컬 파일 경로로 바꿉니다."""
+        src = src.strip()
+        if src.lower().startswith('file:'):
+            path = unquote(urlparse(src).path)
+            # file:///C:/... 형태의 Windows 경로
+            if re.match(r'^/[a-zA-Z]:', path):
+                path = path[1:]
+            return path
+        return os.path.normpath(os.path.join(base_dir, unquote(src)))
+
+    @classmethod
+    def find_local_images(cls, content):
+        """본문에 나오는 로컬 이미지 src 값을 순서대로(중복 없이) 반환합니다."""
+        sources = []
+        for match in IMG_SRC_PATTERN.finditer(content):
+            src = match.group(3)
+            if cls.is_local_source(src) and src not in sources:
+                sources.append(src)
+        return sources
+
+    def localize(self, content, base_dir):
+        """로컬 이미지를 올리고 src를 바꾼 본문과 (새로 올린 수, 재사용한 수)를 반환합니다.
+
+        파일이 없거나 업로드에 실패하면 RuntimeError를 발생시킵니다. (성공한 업로드는 기록되어 재시도 때 재사용)
+        """
+        sources = self.find_local_images(content)
+        if not sources:
+            return content, 0, 0
+
+        # src -> 파일 경로 -> 내용 해시 (같은 내용의 다른 파일도 한 번만 올림)
+        hash_by_src = {}
+        path_by_hash = {}
+        missing = []
+        for src in sources:
+            path = self.resolve_path(src, base_dir)
+            if not os.path.isfile(path):
+                missing.append(src)
+                continue
+            content_hash = file_content_hash(path)
+            hash_by_src[src] = content_hash
+            path_by_hash.setdefault(content_hash, path)
+        if missing:
+            raise RuntimeError(f"이미지 파일을 찾을 수 없습니다: {', '.join(missing)}")
+
+        url_by_hash = {}
+        to_upload = []
+        for content_hash, path in path_by_hash.items():
+            cached = self.ledger.get_media(content_hash, self.site)
+            if cached:
+                url_by_hash[content_hash] = cached[1]
+            else:
+                to_upload.append((content_hash, path))
+
+        errors = []
+        uploaded = 0
+        if to_upload:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(to_upload)))) as executor:
+                futures = [(content_hash, path, executor.submit(self.upload_once, content_hash, path))
+                           for content_hash, path in to_upload]
+                for content_hash, path, future in futures:
+                    try:
+                        url_by_hash[content_hash], is_new = future.result()
+                    except urllib.error.HTTPError as e:
+                        errors.append(f"{os.path.basename(path)} ({WordPressRestPublisher.describe_error(e)})")
+                        continue
+                    except Exception as e:
+                        errors.append(f"{os.path.basename(path)} ({e})")
+                        continue
+                    uploaded += is_new
+        if errors:
+            raise RuntimeError(f"이미지 업로드 실패: {', '.join(errors)}")
+
+        def replace_src(match):
+            src = match.group(3)
+            content_hash = hash_by_src.get(src)
+            if content_hash is None:
+                return match.group(0)
+            return f"{match.group(1)}{match.group(2)}{url_by_hash[content_hash]}{match.group(2)}"
+
+        localized = IMG_SRC_PATTERN.sub(replace_src, content)
+        return localized, uploaded, len(path_by_hash) - uploaded
+
+
+class WordPressXmlRpcPublisher:
+    """xmlrpc.php의 system.multicall로 여러 글을 한 번의 요청에 묶어 발행합니다.
+
+    /wp-json이 막혀 있지만 XML-RPC는 열려 있는 사이트용입니다.
+    """
+
+    def __init__(self, domain, username, password, batch_size=50):
+        self.domain = domain.rstrip('/')
+        self.username = username
+        self.password = password
+        self.batch_size = batch_size
+        self.server = xmlrpc.client.ServerProxy(self.endpoint_url(), allow_none=True)
+
+    def endpoint_url(self):
+        """xmlrpc.php 엔드포인트 URL을 반환합니다."""
+        return f"{self.domain}/xmlrpc.php"
+
+    def publish_batch(self, posts, status="publish", dates=None, metas=None):
+        """(제목, 본문) 목록을 wp.newPost 호출 하나씩으로 만들어 한 번에 보냅니다.
+
+        dates가 주어지면 글마다 예약 발행 시각(UTC datetime 또는 None)으로 사용합니다.
+        metas가 주어지면 글마다 설정(status, slug, categories/tags 이름)을 적용합니다.
+        요청 순서대로 (글 ID 또는 None, 오류 메시지 또는 None) 목록을 반환합니다.
+        """
+        multicall = xmlrpc.client.MultiCall(self.server)
+        for (title, content), post_date, meta in zip(posts, dates or [None] * len(posts),
+                                                     metas or [{}] * len(posts)):
+            post = {
+                "post_type": "post",
+                "post_status": meta.get("status", status),
+                "post_title": title,
+                "post_content": content,
+            }
+            if post_date:
+                post["post_date_gmt"] = xmlrpc.client.DateTime(post_date.timetuple())
+            if meta.get("slug"):
+                post["post_name"] = meta["slug"]
+            # terms_names는 없는 분류를 WordPress가 이름으로 새로 만듭니다.
+            terms = {taxonomy: meta[key] for key, taxonomy in (("categories", "category"), ("tags", "post_tag"))
+                     if meta.get(key)}
+            if terms:
+                post["terms_names"] = terms
+            multicall.wp.newPost(0, self.username, self.password, post)
+
+        results = []
+        # MultiCall 결과는 꺼낼 때 개별 Fault를 발생시키므로 하나씩 확인합니다.
+        iterator = iter(multicall())
+        for _ in posts:
+            try:
+                results.append((str(next(iterator)), None))
+            except xmlrpc.client.Fault as fault:
+                results.append((None, f"{fault.faultCode}: {fault.faultString}"))
+        return results
+
+    def publish_all(self, posts, status="publish", on_batch=None, scheduler=None, dates=None, metas=None):
+        """전체 글을 batch_size 단위로 나누어 발행하고 모든 결과를 반환합니다.
+
+        on_batch(완료 개수, 전체 개수, 이번 묶음 결과)가 주어지면 묶음마다 바로 호출하므로,
+        뒤 묶음에서 오류가 나도 앞 묶음 결과는 이미 처리되어 있습니다.
+        scheduler(PublishScheduler)가 주어지면 묶음을 보내기 전에 글 수만큼 발행 속도 제한을 기다립니다.
+        """
+        results = []
+        for start in range(0, len(posts), self.batch_size):
+            batch = posts[start:start + self.batch_size]
+            if scheduler:
+                scheduler.acquire(len(batch))
+            results.extend(self.publish_batch(batch, status,
+                                              dates[start:start + self.batch_size] if dates else None,
+                                              metas[start:start + self.batch_size] if metas else None))
+            if on_batch:
+                on_batch(len(results), len(posts), results[-len(batch):])
+        return results
+
+
+class WebDriverPool:
+    """로그인까지 마친 WebDriver를 미리 띄워 두고 작업자에게 빌려주는 풀입니다.
+
+    create_driver(slot)은 로그인된 driver를 반환해야 합니다. slot 번호는 재시작 시에도
+    유지되므로 슬롯별 브라우저 프로필 폴더 이름에 사용할 수 있습니다.
+    """
+
+    def __init__(self, create_driver, size=DEFAULT_POOL_SIZE, max_uses=25, log=print):
+        self.create_driver = create_driver
+        self.size = size
+        self.max_uses = max_uses  # 이 횟수만큼 사용한 브라우저는 새로 띄웁니다.
+        self.log = log
+        self._idle = queue.Queue()
+        self._slots = {}  # driver -> slot 번호
+        self._uses = {}   # driver -> 사용 횟수
+        self._lock = threading.Lock()
+
+    def start(self):
+        """브라우저를 병렬로 띄우고 로그인시킨 뒤, 준비된 개수를 반환합니다."""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            drivers = list(executor.map(self._launch, range(self.size)))
+        for driver in drivers:
+            if driver:
+                self._idle.put(driver)
+        return len(self._slots)
+
+    def checkout(self, timeout=None):
+        """쉬고 있는 driver 하나를 꺼냅니다. 응답이 없는 driver는 새로 띄워 교체합니다.
+
+        기다리는 동안 마지막 브라우저까지 교체에 실패해 슬롯이 모두 없어지면 RuntimeError를,
+        timeout(초) 안에 빈 driver가 없으면 queue.Empty를 발생시킵니다.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if not self._slots:
+                    raise RuntimeError("사용할 수 있는 브라우저가 없습니다.")
+            # 다른 작업자가 슬롯을 잃어도 알아차리도록 짧게 기다리며 슬롯 수를 다시 확인합니다.
+            wait = POOL_CHECKOUT_POLL_INTERVAL
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    raise queue.Empty
+            try:
+                driver = self._idle.get(timeout=wait)
+            except queue.Empty:
+                continue
+            if self.is_healthy(driver):
+                return driver
+            self.log("⚠️ 응답 없는 브라우저를 교체합니다.")
+            driver = self._recycle(driver)
+            if driver:
+                return driver
+
+    def checkin(self, driver, healthy=True):
+        """사용한 driver를 돌려받습니다. 응답하지 않거나(healthy=False) 많이 사용한 driver는 새로 띄웁니다."""
+        with self._lock:
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            worn_out = self._uses[driver] >= self.max_uses
+        if not healthy or worn_out:
+            driver = self._recycle(driver)
+        if driver:
+            self._idle.put(driver)
+
+    def close(self):
+        """풀의 모든 브라우저를 종료합니다."""
+        with self._lock:
+            drivers = list(self._slots)
+            self._slots.clear()
+            self._uses.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    @staticmethod
+    def is_healthy(driver):
+        """driver가 명령에 응답하는지 확인합니다."""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def _launch(self, slot):
+        """slot 번호로 새 driver를 띄워 등록합니다. 실패하면 None을 반환합니다."""
+        try:
+            driver = self.create_driver(slot)
+        except Exception as e:
+            self.log(f"❌ 브라우저 {slot + 1} 시작 실패: {str(e)}")
+            return None
+        with self._lock:
+            self._slots[driver] = slot
+            self._uses[driver] = 0
+        return driver
+
+    def _recycle(self, driver):
+        """driver를 종료하고 같은 slot에 새 driver를 띄웁니다."""
+        with self._lock:
+            slot = self._slots.pop(driver, None)
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        if slot is None:
+            return None
+        return self._launch(slot)
+
 
 class WordPressAutoLogin:
     def __init__(self, root):
         self.root = root
         self.root.title("WordPress 자동 로그인 프로그램")
-        self.root.geometry("600x500")
+        self.root.geometry("600x590")
         self.root.resizable(True, True)
         
-        # 변수 초기화
-        self.driver = None
-        self.is_logged_in = False
-        self.txt_files_dir = r"C:\Users\4-002\Desktop\강동혁\python\테스트"
+        self.init_state()
         
         # GUI 구성 요소 생성
         self.create_widgets()
@@ -49,6 +2185,53 @@ class WordPressAutoLogin:
             self.log_message("오류: Selenium이 설치되지 않았습니다. pip install selenium webdriver-manager를 실행해주세요.")
             self.login_button.config(state='disabled')
     
+    def init_state(self, run_log=None):
+        """GUI와 관계없는 상태 변수를 초기화합니다."""
+        self.log_queue = queue.Queue()  # 작업 스레드 -> GUI 스레드 로그 전달
+        self.driver = None
+        self.is_logged_in = False
+        self.txt_files_dir = r"C:\Users\4-002\Desktop\강동혁\python\테스트"
+        self.use_data_store_injection = True  # wp.data 스토어로 제목/본문을 한 번에 입력
+        self.pool_size = DEFAULT_POOL_SIZE  # 병렬 발행 시 브라우저 수
+        self.async_concurrency = DEFAULT_ASYNC_CONCURRENCY  # 비동기 REST 발행 시 동시 요청 수
+        self.chromedriver_path = os.environ.get("CHROMEDRIVER_PATH", "")  # 오프라인 PC용 직접 지정 경로
+        self.sites_config_path = os.environ.get("WORDPRESS_SITES_FILE", SITES_CONFIG_FILE)  # 여러 사이트 설정 파일
+        self.lean_pool_browsers = True  # 병렬 발행 브라우저는 가벼운 헤드리스 프로필로 실행
+        self.watch_stop_event = threading.Event()  # 폴더 감시 중지 신호
+        self.ledger = None  # 발행 기록 (처음 사용할 때 연결)
+        self.site_key = None  # 발행 기록·실행 기록의 사이트 키 (작업 스레드가 Tk 변수를 읽지 않도록 GUI 스레드에서 정함)
+        self.selector_memory = None  # 사이트·버전별 선택자 기억 (에디터에서 처음 사용할 때 생성)
+        self.profiler = None  # WebDriver 명령 프로파일러 (프로파일링을 켠 실행에서만 사용)
+        self.run_log = run_log or RunLog()  # 로그/단계 시간/발행 결과를 남기는 JSON lines 실행 기록
+        self.post_type = "post"  # 사용자 정의 글 유형에 발행하려면 변경 (예: "page")
+        self.publish_rate_per_minute = DEFAULT_PUBLISH_RATE_PER_MINUTE  # 사이트별 분당 발행 수 (0: 제한 없음)
+        self.publish_burst = DEFAULT_PUBLISH_BURST  # 속도 제한 중에도 한 번에 몰아서 허용할 글 수
+        self.publish_concurrency = DEFAULT_PUBLISH_CONCURRENCY  # 사이트별 동시 발행 수 (0: 제한 없음)
+        self.publish_window_minutes = DEFAULT_PUBLISH_WINDOW_MINUTES  # 일괄 발행을 예약 발행으로 나눌 시간 범위
+    
+    @classmethod
+    def headless(cls, domain, username, password, txt_files_dir, app_password="", keep_session=False, run_log=None):
+        """GUI 없이 발행 기능만 쓰는 인스턴스를 만듭니다. (벤치마크, 서버 실행용)
+        
+        입력 칸 대신 FixedVar를 쓰고, GUI 갱신(root.after)은 무시합니다. 로그는 실행 기록에 남고,
+        log_queue에는 최근 LOG_MAX_LINES줄만 남습니다. (비우는 쪽이 없어도 메모리가 늘지 않음)
+        """
+        app = cls.__new__(cls)
+        app.root = HeadlessRoot()
+        app.init_state(run_log)
+        app.log_queue = RecentLogQueue()
+        app.txt_files_dir = txt_files_dir
+        app.domain_var = FixedVar(domain)
+        app.username_var = FixedVar(username)
+        app.password_var = FixedVar(password)
+        app.app_password_var = FixedVar(app_password)
+        app.keep_session_var = FixedVar(keep_session)
+        app.profile_var = FixedVar(False)
+        app.publish_mode_var = FixedVar(list(PUBLISH_MODES)[0])
+        app.status_var = FixedVar("")
+        app.site_key = urlparse(domain.strip()).netloc
+        return app
+    
     def create_widgets(self):
         """GUI 위젯들을 생성합니다."""
         
@@ -80,9 +2263,35 @@ class WordPressAutoLogin:
                                        width=40, show="*")
         self.password_entry.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
         
+        # 애플리케이션 비밀번호 입력 (REST API 발행용, 비우면 비밀번호 사용)
+        ttk.Label(main_frame, text="앱 비밀번호:").grid(row=4, column=0, sticky=tk.W, pady=5)
+        self.app_password_var = tk.StringVar()
+        self.app_password_entry = ttk.Entry(main_frame, textvariable=self.app_password_var,
+                                           width=40, show="*")
+        self.app_password_entry.grid(row=4, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))
+        
+        # 발행 방식 선택
+        ttk.Label(main_frame, text="발행 방식:").grid(row=5, column=0, sticky=tk.W, pady=5)
+        self.publish_mode_var = tk.StringVar(value=list(PUBLISH_MODES)[0])
+        self.publish_mode_combo = ttk.Combobox(main_frame, textvariable=self.publish_mode_var,
+                                               values=list(PUBLISH_MODES), state='readonly', width=37)
+        self.publish_mode_combo.grid(row=5, column=1, sticky=tk.W, pady=5, padx=(10, 0))
+        
+        # 로그인 유지 (사이트별 브라우저 프로필과 쿠키 재사용)
+        options_frame = ttk.Frame(main_frame)
+        options_frame.grid(row=6, column=1, sticky=tk.W, pady=5, padx=(10, 0))
+        self.keep_session_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="로그인 유지 (브라우저 프로필과 쿠키 저장)",
+                        variable=self.keep_session_var).pack(side=tk.LEFT)
+        
+        # WebDriver 명령 프로파일링 (단계별 명령 수와 시간 기록)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="명령 프로파일링",
+                        variable=self.profile_var).pack(side=tk.LEFT, padx=(10, 0))
+        
         # 버튼 프레임
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=20)
+        button_frame.grid(row=7, column=0, columnspan=2, pady=20)
         
         # 로그인 버튼
         self.login_button = ttk.Button(button_frame, text="로그인", 
@@ -102,11 +2311,11 @@ class WordPressAutoLogin:
         # 상태 표시
         self.status_var = tk.StringVar(value="준비됨")
         status_label = ttk.Label(main_frame, textvariable=self.status_var)
-        status_label.grid(row=5, column=0, columnspan=2, pady=10)
+        status_label.grid(row=8, column=0, columnspan=2, pady=10)
         
         # 로그 영역
         log_frame = ttk.LabelFrame(main_frame, text="로그", padding="5")
-        log_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=10)
+        log_frame.grid(row=9, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=10)
         
         self.log_text = scrolledtext.ScrolledText(log_frame, width=70, height=15)
         self.log_text.pack(fill=tk.BOTH, expand=True)
@@ -115,23 +2324,28 @@ class WordPressAutoLogin:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(6, weight=1)
+        main_frame.rowconfigure(9, weight=1)
         
         # Enter 키 바인딩
         self.root.bind('<Return>', lambda e: self.start_login_thread())
         
+        # 로그 큐를 GUI 스레드에서 주기적으로 비움
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self.flush_log_queue)
+        
         # 초기 메시지
         self.log_message("WordPress 자동 로그인 프로그램이 시작되었습니다.")
         self.log_message("도메인 주소를 입력하고 로그인 정보를 입력한 후 '로그인' 버튼을 클릭하세요.")
         self.log_message(f"텍스트 파일 경로: {self.txt_files_dir}")
     
     def get_txt_files(self):
-        """텍스트 파일 목록을 가져옵니다."""
+        """글 파일(POST_FILE_PATTERNS: txt, md, jsonl) 목록을 가져옵니다."""
         if not os.path.exists(self.txt_files_dir):
             self.log_message(f"❌ 텍스트 파일 폴더가 존재하지 않습니다: {self.txt_files_dir}")
             return []
         
-        txt_files = glob.glob(os.path.join(self.txt_files_dir, "*.txt"))
+        txt_files = []
+        for pattern in POST_FILE_PATTERNS:
+            txt_files.extend(glob.glob(os.path.join(self.txt_files_dir, pattern)))
         return txt_files
     
     def read_txt_file(self, file_path):
@@ -152,49 +2366,262 @@ class WordPressAutoLogin:
             return None, None
         
         # 첫 번째 파일 사용
-        file_path = txt_files[0]
-        filename = os.path.basename(file_path)
-        
-        # 파일 내용 읽기
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            if len(lines) < 3:
-                self.log_message("❌ 파일에 충분한 줄이 없습니다. (최소 3줄 필요)")
+        title, content = self.read_post_file(txt_files[0])
+        if title and content:
+            try:
+                content = self.upload_post_media(content, txt_files[0])
+            except Exception as e:
+                self.log_message(f"❌ {str(e)}")
                 return None, None
-            
-            # 첫 번째 줄이 제목
-            title = lines[0].strip()
-            
-            # 세 번째 줄부터가 본문 (줄 번호는 0부터 시작하므로 인덱스 2부터)
-            content_lines = lines[2:]  # 세 번째 줄부터 끝까지
-            content = ''.join(content_lines).strip()
-            
             self.log_message(f"📝 파일에서 읽은 제목: {title}")
             self.log_message(f"📝 파일에서 읽은 본문 길이: {len(content)}자")
-            self.log_message(f"📝 사용된 파일: {filename}")
-            
-            return title, content
+            self.log_message(f"📝 사용된 파일: {os.path.basename(txt_files[0])}")
+        return title, content
+    
+    def get_ledger(self):
+        """발행 기록(SQLite)을 반환합니다. 처음 호출할 때 연결합니다."""
+        if self.ledger is None:
+            self.ledger = PublishLedger()
+        return self.ledger
+    
+    def get_site_key(self):
+        """발행 기록에서 사이트를 구분하는 키(도메인 호스트)를 반환합니다.
+        
+        발행 시작 때 정해 둔 값을 쓰므로 작업 스레드에서 불러도 Tk 변수를 읽지 않습니다.
+        """
+        if self.site_key is None:
+            self.site_key = urlparse(self.domain_var.get().strip()).netloc
+        return self.site_key
+    
+    def get_pending_post_entries(self, file_paths=None):
+        """폴더의 글 파일(또는 file_paths)에서 이 사이트에 아직 발행하지 않은 글만 파일 이름 순서로 가져옵니다.
+        
+        각 항목은 (파일 경로, 내용 해시, 제목, 본문, 설정)이며, 목록(PendingPosts)은 반복할 때마다
+        파일을 한 줄씩 다시 읽으므로 글이 많아도 본문을 한꺼번에 메모리에 두지 않습니다.
+        """
+        if file_paths is None:
+            file_paths = self.get_txt_files()
+        pending = PendingPosts(sorted(file_paths), self.get_ledger(), self.get_site_key(), log=self.log_message)
+        if pending.skipped:
+            self.log_message(f"📝 이미 발행된 글 {pending.skipped}개를 건너뜁니다. (발행 기록 기준)")
+        return pending
+    
+    def get_scheduler(self):
+        """이 사이트의 발행 속도 제한기(PublishScheduler)를 반환합니다."""
+        return PublishScheduler.for_site(self.get_site_key(), self.publish_rate_per_minute,
+                                         self.publish_burst, self.publish_concurrency)
+    
+    def plan_publish_window(self, count):
+        """이번 실행의 글 count개에 예약 발행 시각을 나눠 정하고 속도 제한 설정을 로그에 남깁니다."""
+        scheduler = self.get_scheduler()
+        dates = scheduler.plan_window(count, self.publish_window_minutes)
+        if scheduler.rate_per_minute > 0:
+            self.log_message(f"⏳ 발행 속도 제한: 분당 {scheduler.rate_per_minute}개, "
+                             f"한 번에 최대 {scheduler.burst}개")
+        if dates:
+            last = dates[-1].astimezone().strftime('%Y-%m-%d %H:%M')
+            self.log_message(f"🗓️ {count}개 글을 {self.publish_window_minutes}분에 나눠 예약 발행합니다. (마지막: {last})")
+        return scheduler
+    
+    def upload_post_media(self, content, file_path):
+        """본문의 로컬 이미지를 REST API로 미디어 라이브러리에 올리고 src를 바꾼 본문을 반환합니다.
+        
+        이미지 경로는 txt 파일 폴더 기준이며, 업로드에는 앱 비밀번호를 사용합니다.
+        REST API는 로그인 비밀번호를 받지 않으므로 앱 비밀번호가 없으면 경고만 남기고 본문을 그대로 둡니다.
+        """
+        if not MediaUploader.find_local_images(content):
+            return content
+        app_password = self.app_password_var.get().strip()
+        if not app_password:
+            self.log_message(f"⚠️ 앱 비밀번호가 없어 본문 이미지를 올리지 않습니다 ({os.path.basename(file_path)}). "
+                             f"이미지 주소는 그대로 둡니다.")
+            return content
+        publisher = WordPressRestPublisher(self.domain_var.get().strip(), self.username_var.get().strip(), app_password)
+        uploader = MediaUploader(publisher, self.get_ledger(), self.get_site_key(), log=self.log_message)
+        
+        content, uploaded, reused = uploader.localize(content, os.path.dirname(file_path))
+        self.log_message(f"🖼️ 본문 이미지 처리 완료 ({os.path.basename(file_path)}): "
+                         f"새로 업로드 {uploaded}개, 기존 미디어 재사용 {reused}개")
+        return content
+    
+    def publish_entry(self, file_path, content_hash, title, content, meta, publish):
+        """publish(제목, 본문, 예약 시각, 설정)으로 글 하나를 발행하고 결과를 발행 기록에 남깁니다.
+        
+        발행은 사이트별 속도 제한(get_scheduler) 안에서 이루어지며, 글 파일에 날짜가 있으면 그 날짜를 씁니다.
+        """
+        ledger = self.get_ledger()
+        site = self.get_site_key()
+        ledger.record_start(content_hash, site, os.path.basename(file_path))
+        
+        post_id = None
+        error = None
+        scheduler = self.get_scheduler()
+        started = time.time()
+        try:
+            with scheduler.slot() as waited:
+                if waited >= 1:
+                    self.log_message(f"⏳ 발행 속도 제한으로 {waited:.1f}초 기다렸습니다.")
+                content = self.upload_post_media(content, file_path)
+                post_id = publish(title, content, meta.get("date") or scheduler.next_publish_date(), meta)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        
+        error = error or (None if post_id else "발행 실패")
+        if error:
+            self.log_publish_error(file_path, title, meta, error)
+        ledger.record_result(content_hash, site, post_id, error)
+        self.log_post_result(site, file_path, content_hash, post_id, error, time.time() - started)
+        return post_id
+    
+    def log_publish_error(self, file_path, title, meta, error):
+        """발행에 실패한 글의 파일 이름·줄 번호·제목과 실패 이유를 로그에 남깁니다."""
+        where = os.path.basename(file_path) if file_path else "?"
+        if meta and meta.get("line"):
+            where += f" {meta['line']}번째 줄"
+        self.log_message(f"❌ 발행 실패 ({where}, {title[:30]}): {error}")
+    
+    def log_post_result(self, site, file_path, content_hash, post_id, error, duration):
+        """글 하나의 발행 결과를 실행 기록에 남깁니다."""
+        self.run_log.write(
+            "post", site=site, file=os.path.basename(file_path) if file_path else None,
+            content_hash=content_hash, post_id=post_id, ok=bool(post_id) and not error,
+            error=error, duration=round(duration, 3)
+        )
+    
+    def read_post_file(self, file_path):
+        """글 파일 하나에서 첫 번째 글의 제목과 본문을 읽습니다. (형식은 iter_post_file 참고)"""
+        filename = os.path.basename(file_path)
+        
+        try:
+            for _, title, content, _ in iter_post_file(file_path, log=self.log_message):
+                return title, content
+            return None, None
             
         except Exception as e:
             self.log_message(f"❌ 파일 읽기 실패 ({filename}): {str(e)}")
             return None, None
     
     def log_message(self, message):
-        """로그 메시지를 추가합니다."""
+        """로그 메시지를 추가합니다. (어느 스레드에서 불러도 안전)
+        
+        위젯에 바로 쓰지 않고 큐에 넣으며, GUI 스레드의 flush_log_queue가 모아서 표시합니다.
+        """
         timestamp = time.strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}\n"
         
-        self.log_text.insert(tk.END, formatted_message)
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        self.log_queue.put(formatted_message)
+        self.run_log.write("log", message=message)
+    
+    def flush_log_queue(self):
+        """쌓인 로그를 한 번에 로그 패널에 넣고, 오래된 줄은 LOG_MAX_LINES에 맞춰 지웁니다."""
+        lines = []
+        try:
+            while True:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if lines:
+            self.log_text.insert(tk.END, ''.join(lines[-LOG_MAX_LINES:]))
+            line_count = int(self.log_text.index('end-1c').split('.')[0]) - 1
+            if line_count > LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{line_count - LOG_MAX_LINES + 1}.0')
+            self.log_text.see(tk.END)
+        
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self.flush_log_queue)
+    
+    def _sleep(self, seconds):
+        """seconds만큼 쉽니다. 프로파일링 중이면 현재 단계의 대기 시간으로 기록합니다."""
+        if self.profiler:
+            self.profiler.sleep(seconds)
+        else:
+            time.sleep(seconds)
+    
+    def wait_until(self, condition, timeout=10, poll=WAIT_POLL_INTERVAL):
+        """조건이 참이 될 때까지 짧은 간격으로 확인합니다.
+        
+        조건을 만족하면 그 결과를, 시간 안에 만족하지 못하면 None을 반환합니다.
+        조건 실행 중 발생하는 WebDriver 예외(요소 교체 등)는 다음 확인까지 무시합니다.
+        확인 사이의 대기는 _sleep으로 하므로 프로파일링 중에는 조건 대기 시간도 기록됩니다.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    return value
+            except WebDriverException:
+                pass
+            if time.monotonic() >= deadline:
+                return None
+            self._sleep(poll)
+    
+    def find_first(self, selectors, visible=True, enabled=True, text_contains=None,
+                   exclude_title=False, last=False):
+        """후보 선택자들을 execute_script 한 번으로 확인해 조건에 맞는 첫 요소를 찾습니다.
+        
+        요소마다 is_displayed()/get_attribute()를 부르는 대신 페이지 안에서 한꺼번에 거릅니다.
+        (요소, 선택자)를 반환하며, 찾지 못하면 (None, None)입니다.
+        """
+        try:
+            result = self.driver.execute_script(FIND_FIRST_SCRIPT, list(selectors), {
+                'visible': visible,
+                'enabled': enabled,
+                'textContains': text_contains.lower() if text_contains else None,
+                'excludeTitle': exclude_title,
+                'last': last,
+            })
+        except WebDriverException:
+            return None, None
+        if not result:
+            return None, None
+        return result[0], result[1]
+    
+    @contextlib.contextmanager
+    def profile_step(self, name):
+        """name 단계의 소요 시간을 실행 기록에 남기고, 프로파일링 중이면 프로파일러에도 기록합니다."""
+        started = time.perf_counter()
+        failed = True
+        try:
+            with (self.profiler.step(name) if self.profiler else contextlib.nullcontext()):
+                yield
+            failed = False
+        finally:
+            self.run_log.write("step", site=self.get_site_key(), step=name,
+                               duration=round(time.perf_counter() - started, 4), failed=failed)
+    
+    def start_profiling(self):
+        """'명령 프로파일링'이 켜져 있으면 이번 실행의 기록을 시작합니다."""
+        if self.profile_var.get():
+            self.profiler = WebDriverProfiler()
+            self.log_message("⏱️ WebDriver 명령 프로파일링을 시작합니다.")
+    
+    def finish_profiling(self):
+        """단계별 기록을 로그에 출력하고 JSON 파일로 저장합니다."""
+        profiler, self.profiler = self.profiler, None
+        if not profiler:
+            return
+        for line in profiler.report_lines():
+            self.log_message(f"⏱️ {line}")
+        try:
+            path = os.path.join(SESSION_BASE_DIR, "profiles", time.strftime("run-%Y%m%d-%H%M%S.json"))
+            profiler.dump(path)
+            self.log_message(f"💾 프로파일 기록 저장: {path}")
+        except Exception as e:
+            self.log_message(f"⚠️ 프로파일 기록 저장 실패: {str(e)}")
     
     def validate_inputs(self):
         """입력값을 검증합니다."""
+        if self.get_publish_mode() == "multisite":
+            if not os.path.isfile(self.sites_config_path):
+                messagebox.showerror("오류", f"사이트 설정 파일이 없습니다:\n{self.sites_config_path}")
+                return False
+            return True
+        
         domain = self.domain_var.get().strip()
         username = self.username_var.get().strip()
         password = self.password_var.get().strip()
+        app_password = self.app_password_var.get().strip()
         
         if not domain:
             messagebox.showerror("오류", "도메인 주소를 입력해주세요.")
@@ -204,7 +2631,7 @@ class WordPressAutoLogin:
             messagebox.showerror("오류", "아이디를 입력해주세요.")
             return False
         
-        if not password:
+        if not password and not (self.get_publish_mode() != "selenium" and app_password):
             messagebox.showerror("오류", "비밀번호를 입력해주세요.")
             return False
         
@@ -228,80 +2655,651 @@ class WordPressAutoLogin:
         """로그인을 별도 스레드에서 시작합니다."""
         if not self.validate_inputs():
             return
+        self.site_key = urlparse(self.domain_var.get().strip()).netloc
         
         # 버튼 상태 변경
         self.login_button.config(state='disabled')
         self.status_var.set("로그인 진행 중...")
         
-        # 별도 스레드에서 로그인 실행
-        thread = threading.Thread(target=self.perform_login)
+        # 별도 스레드에서 로그인 실행 (REST 방식은 브라우저 없이 바로 발행)
+        if self.get_publish_mode() == "rest":
+            target = self.perform_rest_publish
+        elif self.get_publish_mode() == "rest_async":
+            target = self.perform_async_rest_publish
+        elif self.get_publish_mode() == "xmlrpc":
+            target = self.perform_xmlrpc_publish
+        elif self.get_publish_mode() == "selenium_pool":
+            target = self.perform_pool_publish
+        elif self.get_publish_mode() == "selenium_batch":
+            target = self.perform_batch_publish
+        elif self.get_publish_mode() == "watch":
+            target = self.perform_watch_publish
+        elif self.get_publish_mode() == "multisite":
+            target = self.perform_multi_site_publish
+        else:
+            target = self.perform_login
+        thread = threading.Thread(target=target)
         thread.daemon = True
         thread.start()
     
-    def perform_login(self):
-        """실제 로그인을 수행합니다."""
+    def get_publish_mode(self):
+        """선택된 발행 방식의 내부 키를 반환합니다."""
+        return PUBLISH_MODES.get(self.publish_mode_var.get(), "selenium")
+    
+    def perform_rest_publish(self):
+        """REST API로 브라우저 없이 글을 발행합니다.
+        
+        사이트에 REST API가 없거나 REST API/앱 비밀번호가 꺼져 있고 로그인 비밀번호가 입력되어 있으면
+        기존 Selenium 흐름으로 전환합니다. 그 밖의 인증 오류는 그대로 알립니다.
+        """
         try:
             domain = self.domain_var.get().strip()
             username = self.username_var.get().strip()
-            password = self.password_var.get().strip()
+            app_password = self.app_password_var.get().strip() or self.password_var.get().strip()
             
-            # wp-admin URL 생성
-            admin_url = urljoin(domain.rstrip('/') + '/', 'wp-admin/')
+            title, content = self.get_post_data()
+            if not title or not content:
+                self.log_message("❌ 텍스트 파일에서 데이터를 가져올 수 없습니다.")
+                self.root.after(0, self.on_login_failure)
+                return
             
-            self.log_message(f"WordPress 관리자 페이지에 접속합니다: {admin_url}")
+            publisher = WordPressRestPublisher(domain, username, app_password)
+            self.log_message(f"REST API로 글을 발행합니다: {publisher.api_url('wp/v2/posts')}")
+            
+            started = time.time()
+            post = publisher.create_post(title, content)
+            elapsed = time.time() - started
+            
+            self.log_post_result(self.get_site_key(), None, None, post.get('id'), None, elapsed)
+            self.log_message(f"✅ REST API 발행 완료 (ID: {post.get('id')}, {elapsed:.2f}초)")
+            if post.get('link'):
+                self.log_message(f"🔗 글 주소: {post['link']}")
+            self.root.after(0, self.on_publish_success)
+            
+        except urllib.error.HTTPError as e:
+            reason = WordPressRestPublisher.describe_error(e)
+            if WordPressRestPublisher.is_rest_unavailable(e):
+                if self.password_var.get().strip():
+                    self.log_message(f"⚠️ REST API를 사용할 수 없습니다 ({reason}). 브라우저 방식으로 전환합니다.")
+                    self.perform_login()
+                else:
+                    self.log_message(f"❌ REST API를 사용할 수 없습니다 ({reason}). "
+                                     f"브라우저 방식으로 발행하려면 비밀번호를 입력해주세요.")
+                    self.root.after(0, self.on_login_failure)
+            elif e.code in (401, 403):
+                self.log_message(f"❌ REST API 인증 실패: {reason} (아이디와 앱 비밀번호를 확인해주세요)")
+                self.root.after(0, self.on_login_failure)
+            else:
+                self.log_message(f"❌ REST API 발행 실패: {reason}")
+                self.root.after(0, self.on_login_failure)
             
-            # Chrome 옵션 설정
-            chrome_options = Options()
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
+        except urllib.error.URLError as e:
+            self.log_message(f"❌ 사이트에 연결할 수 없습니다: {e.reason}")
+            self.root.after(0, self.on_login_failure)
             
-            # WebDriver 초기화
-            self.log_message("브라우저를 시작하고 있습니다...")
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        except Exception as e:
+            self.log_message(f"❌ 예상치 못한 오류가 발생했습니다: {str(e)}")
+            self.root.after(0, self.on_login_failure)
+    
+    def perform_async_rest_publish(self):
+        """폴더의 모든 txt 파일을 비동기 REST 클라이언트로 keep-alive 연결을 재사용하며 동시에 발행합니다."""
+        try:
+            entries = self.get_pending_post_entries()
+            if not entries:
+                self.log_message("📝 새로 발행할 텍스트 파일이 없습니다.")
+                self.root.after(0, self.on_publish_success)
+                return
             
-            # 페이지 로드
-            self.driver.get(admin_url)
-            self.log_message("WordPress 로그인 페이지를 로드했습니다.")
+            self.log_message(f"REST API로 {len(entries)}개 글을 최대 {self.async_concurrency}개씩 동시에 발행합니다. "
+                             f"({'aiohttp' if AIOHTTP_AVAILABLE else 'asyncio'})")
+            started = time.time()
+            results = self.publish_entries_via_async_rest(entries, self.async_concurrency)
+            elapsed = time.time() - started
             
-            # 로그인 폼 요소 대기 및 찾기
-            wait = WebDriverWait(self.driver, 10)
+            succeeded = sum(1 for post_id in results if post_id)
+            self.log_message(f"✅ 비동기 REST 발행 완료: 성공 {succeeded}개, 실패 {len(results) - succeeded}개 "
+                             f"({elapsed:.2f}초, 분당 {succeeded / elapsed * 60 if elapsed > 0 else 0:.1f}개)")
+            self.root.after(0, self.on_publish_success)
             
-            # 사용자명 입력 필드 찾기 (user_login)
-            self.log_message("로그인 폼을 찾고 있습니다...")
-            username_field = wait.until(
-                EC.presence_of_element_located((By.ID, "user_login"))
-            )
+        except Exception as e:
+            self.log_message(f"❌ 예상치 못한 오류가 발생했습니다: {str(e)}")
+            self.root.after(0, self.on_login_failure)
+    
+    def perform_xmlrpc_publish(self):
+        """폴더의 모든 txt 파일을 XML-RPC system.multicall 묶음으로 발행합니다."""
+        try:
+            domain = self.domain_var.get().strip()
+            username = self.username_var.get().strip()
+            password = self.app_password_var.get().strip() or self.password_var.get().strip()
+            
+            entries = self.get_pending_post_entries()
+            if not entries:
+                self.log_message("📝 새로 발행할 텍스트 파일이 없습니다.")
+                self.root.after(0, self.on_publish_success)
+                return
+            
+            publisher = WordPressXmlRpcPublisher(domain, username, password)
+            self.log_message(f"XML-RPC로 {len(entries)}개 글을 발행합니다: {publisher.endpoint_url()}")
+            
+            started = time.time()
+            results = self.publish_entries_via_xmlrpc(entries, publisher)
+            elapsed = time.time() - started
+            
+            succeeded = sum(1 for post_id in results if post_id)
+            self.log_message(f"✅ XML-RPC 발행 완료: 성공 {succeeded}개, "
+                             f"실패 {len(results) - succeeded}개 ({elapsed:.2f}초)")
+            self.root.after(0, self.on_publish_success)
+            
+        except xmlrpc.client.ProtocolError as e:
+            self.log_message(f"❌ XML-RPC를 사용할 수 없습니다: HTTP {e.errcode} {e.errmsg}")
+            self.root.after(0, self.on_login_failure)
+            
+        except xmlrpc.client.Fault as e:
+            self.log_message(f"❌ XML-RPC 오류: {e.faultCode}: {e.faultString}")
+            self.root.after(0, self.on_login_failure)
+            
+        except OSError as e:
+            self.log_message(f"❌ 사이트에 연결할 수 없습니다: {str(e)}")
+            self.root.after(0, self.on_login_failure)
+            
+        except Exception as e:
+            self.log_message(f"❌ 예상치 못한 오류가 발생했습니다: {str(e)}")
+            self.root.after(0, self.on_login_failure)
+    
+    def publish_entries_via_xmlrpc(self, entries, publisher):
+        """글 목록을 XML-RPC 묶음으로 발행하고 항목 순서대로 글 ID(실패하면 None) 목록을 반환합니다.
+        
+        글은 batch_size개씩 읽어 보내므로 한 번에 묶음 하나 분량의 본문만 메모리에 둡니다.
+        """
+        ledger = self.get_ledger()
+        site = self.get_site_key()
+        scheduler = self.plan_publish_window(len(entries))
+        results = []
+        iterator = iter(entries)
+        while True:
+            chunk = list(itertools.islice(iterator, publisher.batch_size))
+            if not chunk:
+                break
+            
+            chunk_results = [None] * len(chunk)
+            ready = []
+            for index, (file_path, content_hash, title, content, meta) in enumerate(chunk):
+                ledger.record_start(content_hash, site, os.path.basename(file_path))
+                try:
+                    content = self.upload_post_media(content, file_path)
+                except Exception as e:
+                    ledger.record_result(content_hash, site, None, str(e))
+                    self.log_post_result(site, file_path, content_hash, None, str(e), 0)
+                    self.log_publish_error(file_path, title, meta, str(e))
+                    continue
+                ready.append((index, file_path, content_hash, title, content, meta))
+            
+            if ready:
+                posts = [(title, content) for _, _, _, title, content, _ in ready]
+                metas = [meta for *_, meta in ready]
+                dates = [meta.get("date") or scheduler.next_publish_date() for meta in metas]
+                started = time.time()
+                
+                def record_batch(done, total, outcomes):
+                    # WordPress가 받은 묶음은 바로 기록해, 다음 묶음이 실패해도 다시 실행할 때 중복 발행하지 않습니다.
+                    elapsed = (time.time() - started) / done
+                    for (index, file_path, content_hash, title, _, meta), (post_id, error) in zip(
+                            ready[done - len(outcomes):done], outcomes):
+                        ledger.record_result(content_hash, site, post_id, error)
+                        self.log_post_result(site, file_path, content_hash, post_id, error, elapsed)
+                        if error:
+                            self.log_publish_error(file_path, title, meta, error)
+                        chunk_results[index] = post_id if not error else None
+                
+                publisher.publish_all(posts, on_batch=record_batch, scheduler=scheduler, dates=dates, metas=metas)
+            
+            results.extend(chunk_results)
+            self.log_message(f"📝 발행 진행: {len(results)}/{len(entries)}")
+        
+        return results
+    
+    def perform_pool_publish(self):
+        """미리 로그인한 브라우저 여러 개로 폴더의 모든 글을 동시에 발행합니다."""
+        try:
+            entries = self.get_pending_post_entries()
+            if not entries:
+                self.log_message("📝 새로 발행할 텍스트 파일이 없습니다.")
+                self.root.after(0, self.on_publish_success)
+                return
+            
+            started = time.time()
+            results = self.publish_entries_via_pool(entries)
+            elapsed = time.time() - started
+            if results is None:
+                self.root.after(0, self.on_login_failure)
+                return
+            
+            succeeded = sum(1 for post_id in results if post_id)
+            self.log_message(f"✅ 병렬 발행 완료: 성공 {succeeded}개, 실패 {len(entries) - succeeded}개 "
+                             f"({elapsed:.2f}초)")
+            self.log_selector_stats()
+            self.root.after(0, self.on_publish_success)
+            
+        except Exception as e:
+            self.log_message(f"❌ 병렬 발행 중 오류가 발생했습니다: {str(e)}")
+            self.root.after(0, self.on_login_failure)
+    
+    def publish_entries_via_pool(self, entries):
+        """로그인한 브라우저 pool_size개로 글 목록을 동시에 발행합니다.
+        
+        항목 순서대로 글 ID(실패하면 None) 목록을, 브라우저를 하나도 준비하지 못하면 None을 반환합니다.
+        """
+        self.log_message(f"브라우저 {self.pool_size}개를 미리 띄워 로그인합니다...")
+        pool = WebDriverPool(self.create_pool_driver, size=self.pool_size, log=self.log_message)
+        try:
+            ready = pool.start()
+            if not ready:
+                self.log_message("❌ 로그인된 브라우저를 준비하지 못했습니다.")
+                return None
+            
+            self.log_message(f"✅ 브라우저 {ready}개 준비 완료. {len(entries)}개 글을 발행합니다.")
+            publish = lambda title, content, post_date, meta: self.publish_post_from_pool(pool, title, content,
+                                                                                         post_date, meta)
+            self.plan_publish_window(len(entries))
+            with ThreadPoolExecutor(max_workers=ready) as executor:
+                return list(map_bounded(executor, lambda entry: self.publish_entry(*entry, publish),
+                                        entries, ready * 2))
+        finally:
+            pool.close()
+    
+    def publish_entries_via_async_rest(self, entries, concurrency=DEFAULT_ASYNC_CONCURRENCY):
+        """글 목록을 이벤트 루프 하나에서 비동기 REST 요청으로 발행하고 항목 순서대로 글 ID(실패하면 None) 목록을 반환합니다."""
+        publisher = AsyncWordPressRestPublisher(
+            self.domain_var.get().strip(),
+            self.username_var.get().strip(),
+            self.app_password_var.get().strip() or self.password_var.get().strip(),
+            concurrency=concurrency
+        )
+        self.plan_publish_window(len(entries))
+        return asyncio.run(self._publish_entries_async(entries, publisher))
+    
+    async def _publish_entries_async(self, entries, publisher):
+        ledger = self.get_ledger()
+        site = self.get_site_key()
+        scheduler = self.get_scheduler()
+        
+        # 발행 기록(SQLite)과 실행 기록(파일) 쓰기는 이벤트 루프를 막지 않도록 작업 스레드에서 합니다.
+        def finish(file_path, content_hash, title, meta, post_id, error, elapsed):
+            error = error or (None if post_id else "발행 실패")
+            if error:
+                self.log_publish_error(file_path, title, meta, error)
+            ledger.record_result(content_hash, site, post_id, error)
+            self.log_post_result(site, file_path, content_hash, post_id, error, elapsed)
+        
+        async def publish_one(file_path, content_hash, title, content, meta):
+            await asyncio.to_thread(ledger.record_start, content_hash, site, os.path.basename(file_path))
+            post_id = None
+            error = None
+            started = time.time()
+            try:
+                async with slots:
+                    await scheduler.acquire_async()
+                    if MediaUploader.find_local_images(content):
+                        content = await asyncio.to_thread(self.upload_post_media, content, file_path)
+                    post = await publisher.create_post_async(title, content, meta=meta,
+                                                             post_date=meta.get("date") or scheduler.next_publish_date())
+                post_id = post.get('id')
+            except urllib.error.HTTPError as e:
+                error = WordPressRestPublisher.describe_error(e)
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            
+            await asyncio.to_thread(finish, file_path, content_hash, title, meta, post_id, error,
+                                    time.time() - started)
+            return post_id
+        
+        # 글 목록(PendingPosts)은 파일을 읽고 발행 기록을 조회하므로 작업 스레드에서 꺼내 큐로 넘기고,
+        # 작업자 concurrency개가 큐에서 하나씩 받아 발행합니다. (글 전체를 코루틴으로 미리 만들지 않음)
+        workers = max(1, publisher.concurrency)
+        # 사이트별 동시 발행 수(publish_concurrency)는 연결 수보다 작을 수 있으므로 따로 지킵니다. (0: 제한 없음)
+        slots = asyncio.Semaphore(min(workers, scheduler.max_concurrent) if scheduler.max_concurrent > 0 else workers)
+        loop = asyncio.get_running_loop()
+        pending = asyncio.Queue(maxsize=workers * 2)
+        results = {}
+        
+        def produce():
+            try:
+                for item in enumerate(entries):
+                    asyncio.run_coroutine_threadsafe(pending.put(item), loop).result()
+            finally:
+                for _ in range(workers):
+                    asyncio.run_coroutine_threadsafe(pending.put(None), loop).result()
+        
+        async def worker():
+            while True:
+                item = await pending.get()
+                if item is None:
+                    return
+                index, entry = item
+                results[index] = await publish_one(*entry)
+        
+        async with publisher:
+            await asyncio.gather(asyncio.to_thread(produce), *(worker() for _ in range(workers)))
+            if publisher.connections_opened() is not None:
+                self.log_message(f"🔗 {len(results)}개 요청에 연결 {publisher.connections_opened()}개를 사용했습니다.")
+        return [results[index] for index in range(len(results))]
+    
+    def publish_entries_via_rest(self, entries, publisher, concurrency=1):
+        """글 목록을 REST API로 concurrency개씩 동시에 발행하고 항목 순서대로 글 ID(실패하면 None) 목록을 반환합니다."""
+        def publish(title, content, post_date, meta):
+            try:
+                return publisher.create_post(title, content, post_date=post_date, meta=meta).get('id')
+            except urllib.error.HTTPError as e:
+                raise RuntimeError(WordPressRestPublisher.describe_error(e)) from e
+        
+        self.plan_publish_window(len(entries))
+        concurrency = max(1, concurrency)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(map_bounded(executor, lambda entry: self.publish_entry(*entry, publish),
+                                    entries, concurrency * 2))
+    
+    def perform_batch_publish(self):
+        """한 번 로그인한 브라우저로 폴더의 모든 txt 파일을 차례로 발행합니다.
+        
+        진행 상황은 파일마다 기록되어, 중단된 뒤 다시 실행하면 남은 파일부터 이어서 발행합니다.
+        """
+        try:
+            domain = self.domain_var.get().strip()
+            username = self.username_var.get().strip()
+            password = self.password_var.get().strip()
             
-            # 비밀번호 입력 필드 찾기 (user_pass)
-            password_field = self.driver.find_element(By.ID, "user_pass")
+            file_paths = sorted(self.get_txt_files())
+            if not file_paths:
+                self.log_message("❌ 발행할 텍스트 파일을 찾을 수 없습니다.")
+                self.root.after(0, self.on_login_failure)
+                return
+            
+            progress = BatchProgress(os.path.join(self.get_session_dir(domain), "batch_progress.json"),
+                                     self.txt_files_dir)
+            names = [os.path.basename(path) for path in file_paths]
+            pending = set(progress.pending(names))
+            if len(pending) < len(names):
+                self.log_message(f"📝 이전 진행 기록을 찾았습니다. {len(names) - len(pending)}개를 건너뛰고 이어서 발행합니다.")
+            
+            if not self.login_with_browser(domain, username, password, self.keep_session_var.get()):
+                self.log_message("❌ 로그인에 실패했습니다. 아이디와 비밀번호를 확인해주세요.")
+                self.root.after(0, self.on_login_failure)
+                return
+            
+            self.is_logged_in = True
+            self.root.after(0, self.on_login_success)
+            self.plan_publish_window(len(self.get_pending_post_entries(
+                [path for path in file_paths if os.path.basename(path) in pending])))
+            
+            for index, file_path in enumerate(file_paths, 1):
+                filename = os.path.basename(file_path)
+                if filename not in pending:
+                    continue
+                
+                self.log_message(f"📝 [{index}/{len(file_paths)}] {filename} 발행 중...")
+                post_id = self.publish_file_in_session(file_path)
+                if post_id:
+                    progress.mark_done(filename)
+                else:
+                    progress.mark_failed(filename, "발행 실패")
+                
+                summary = progress.summary(len(file_paths))
+                self.log_message(f"📊 {summary}")
+                self.root.after(0, lambda text=summary: self.status_var.set(f"일괄 발행 중 - {text}"))
             
-            # 로그인 버튼 찾기 (wp-submit)
-            login_button = self.driver.find_element(By.ID, "wp-submit")
+            if not progress.failed:
+                progress.clear()
+            self.log_message(f"🎉 일괄 발행이 끝났습니다: {progress.summary(len(file_paths))}")
+            self.log_selector_stats()
+            self.root.after(0, self.on_publish_success)
+            
+        except Exception as e:
+            self.log_message(f"❌ 일괄 발행 중 오류가 발생했습니다: {str(e)}")
+            self.root.after(0, self.on_login_failure)
+    
+    def perform_watch_publish(self):
+        """한 번 로그인한 뒤 텍스트 폴더를 감시하며 새 txt 파일을 바로 발행합니다.
+        
+        '로그아웃' 버튼을 누르면 감시를 멈춥니다.
+        """
+        try:
+            domain = self.domain_var.get().strip()
+            username = self.username_var.get().strip()
+            password = self.password_var.get().strip()
             
-            self.log_message("로그인 정보를 입력하고 있습니다...")
+            if not os.path.isdir(self.txt_files_dir):
+                self.log_message(f"❌ 텍스트 파일 폴더가 존재하지 않습니다: {self.txt_files_dir}")
+                self.root.after(0, self.on_login_failure)
+                return
             
-            # 입력 필드 클리어 후 입력
-            username_field.clear()
-            username_field.send_keys(username)
+            if not self.login_with_browser(domain, username, password, self.keep_session_var.get()):
+                self.log_message("❌ 로그인에 실패했습니다. 아이디와 비밀번호를 확인해주세요.")
+                self.root.after(0, self.on_login_failure)
+                return
             
-            password_field.clear()
-            password_field.send_keys(password)
+            self.is_logged_in = True
+            self.root.after(0, self.on_login_success)
+            self.root.after(0, lambda: self.status_var.set("폴더 감시 중..."))
             
-            # 잠시 대기
-            time.sleep(1)
+            self.watch_stop_event.clear()
+            self.plan_publish_window(0)
+            watcher = DirectoryWatcher(self.txt_files_dir, self.publish_watched_file, log=self.log_message)
+            watcher.run(self.watch_stop_event)
+            self.log_message("✅ 폴더 감시를 멈췄습니다.")
             
-            # 로그인 버튼 클릭
-            self.log_message("로그인 버튼을 클릭합니다...")
-            login_button.click()
+        except Exception as e:
+            self.log_message(f"❌ 폴더 감시 중 오류가 발생했습니다: {str(e)}")
+            self.root.after(0, self.on_login_failure)
+    
+    def publish_watched_file(self, file_path):
+        """감시 중 발견한 파일을 발행하고, 파일이 생긴 뒤 발행까지 걸린 시간을 기록합니다."""
+        filename = os.path.basename(file_path)
+        self.log_message(f"📥 새 파일 감지: {filename}")
+        
+        post_id = self.publish_file_in_session(file_path)
+        if post_id:
+            try:
+                latency = time.time() - os.path.getmtime(file_path)
+                self.log_message(f"✅ {filename} 발행 완료 (파일 저장 후 {latency:.1f}초)")
+            except OSError:
+                self.log_message(f"✅ {filename} 발행 완료")
+        else:
+            self.log_message(f"❌ {filename} 발행 실패")
+        self.save_selector_memory()
+    
+    def publish_file_in_session(self, file_path):
+        """현재 로그인된 브라우저로 글 파일 하나의 글을 모두 발행하고 마지막 글 ID를 반환합니다.
+        
+        같은 내용이 이미 이 사이트에 발행되었으면 다시 발행하지 않고 기록된 글 ID를 씁니다.
+        글을 하나도 읽지 못했거나 하나라도 실패하면 None을 반환합니다.
+        """
+        ledger = self.get_ledger()
+        site = self.get_site_key()
+        post_id = None
+        failed = False
+        try:
+            for content_hash, title, content, meta in iter_post_file(file_path, log=self.log_message):
+                existing_post_id = ledger.get_published_post_id(content_hash, site)
+                if existing_post_id:
+                    self.log_message(f"📝 이미 발행된 내용입니다 (ID: {existing_post_id}). 건너뜁니다.")
+                    post_id = existing_post_id
+                    continue
+                
+                post_id = self.publish_entry(file_path, content_hash, title, content, meta,
+                                             self.publish_post_in_session)
+                failed = failed or not post_id
+            return None if failed else post_id
             
-            # 로그인 결과 확인
-            time.sleep(3)
+        except Exception as e:
+            self.log_message(f"❌ 글 발행 실패 ({os.path.basename(file_path)}): {str(e)}")
+            return None
+    
+    def publish_post_in_session(self, title, content, post_date=None, meta=None):
+        """현재 로그인된 브라우저로 새 글을 작성해 저장하고 글 ID를 반환합니다."""
+        self.post_title, self.post_content = title, content
+        with self.profile_step("글 작성 페이지 이동"):
+            self.driver.get(self.get_post_new_url())
+        if not self.write_loaded_post(finish_editing=False):
+            return None
+        return self.save_post_via_data_store(post_date=post_date, meta=meta)
+    
+    def clone_for_worker(self, driver=None):
+        """병렬 작업자용 얕은 복사본을 만듭니다.
+        
+        GUI 위젯과 설정은 원본과 공유하고, driver와 글 데이터만 작업자별로 가집니다.
+        """
+        worker = copy.copy(self)
+        worker.driver = driver
+        worker.post_title = None
+        worker.post_content = None
+        return worker
+    
+    def create_pool_driver(self, slot):
+        """풀 슬롯용 브라우저를 띄워 로그인한 뒤 driver를 반환합니다."""
+        worker = self.clone_for_worker()
+        domain = self.domain_var.get().strip()
+        username = self.username_var.get().strip()
+        password = self.password_var.get().strip()
+        
+        # 같은 프로필 폴더는 브라우저 하나만 쓸 수 있으므로 슬롯별로 나눕니다.
+        if not worker.login_with_browser(domain, username, password, self.keep_session_var.get(),
+                                         profile_name=f"profile-{slot}", lean=self.lean_pool_browsers):
+            if worker.driver:
+                worker.driver.quit()
+            raise WebDriverException("로그인에 실패했습니다.")
+        return worker.driver
+    
+    def publish_post_from_pool(self, pool, title, content, post_date=None, meta=None):
+        """풀에서 브라우저를 빌려 글 하나를 작성하고 저장합니다. 저장된 글 ID를 반환합니다."""
+        driver = pool.checkout()
+        post_id = None
+        try:
+            worker = self.clone_for_worker(driver)
+            worker.post_title, worker.post_content = title, content
+            with worker.profile_step("글 작성 페이지 이동"):
+                driver.get(worker.get_post_new_url())
+            if worker.write_loaded_post(finish_editing=False):
+                post_id = worker.save_post_via_data_store(post_date=post_date, meta=meta)
+        except Exception as e:
+            self.log_message(f"❌ 글 발행 실패 ({title[:30]}): {str(e)}")
+        finally:
+            # 글 내용이나 저장 실패는 브라우저 문제가 아니므로 응답이 없을 때만 새로 띄웁니다.
+            pool.checkin(driver, healthy=bool(post_id) or pool.is_healthy(driver))
+        return post_id
+    
+    def clone_for_site(self, site):
+        """사이트 설정 하나로 발행하는 작업자 복사본을 만듭니다.
+        
+        GUI 입력 대신 설정 값을 읽고, 로그에는 사이트 주소를 붙입니다.
+        """
+        worker = self.clone_for_worker()
+        password = resolve_credential(site["password"])  # 브라우저 로그인용
+        app_password = resolve_credential(site["app_password"])  # REST/XML-RPC용 (없으면 password 사용)
+        worker.domain_var = FixedVar(site["domain"])
+        worker.site_key = urlparse(site["domain"]).netloc  # 발행 기록과 속도 제한기(get_scheduler)도 이 사이트 기준
+        # 선택자 기억·프로파일러·로그인 상태는 사이트마다 따로 가집니다. (원본 실행의 것을 물려받지 않음)
+        worker.selector_memory = None
+        worker.profiler = None
+        worker.is_logged_in = False
+        worker.username_var = FixedVar(site["username"])
+        worker.password_var = FixedVar(password)
+        worker.app_password_var = FixedVar(app_password)
+        worker.keep_session_var = FixedVar(site["keep_session"])
+        worker.txt_files_dir = site["content_dir"]
+        worker.pool_size = site["concurrency"]
+        worker.publish_rate_per_minute = site["rate_per_minute"]
+        worker.publish_burst = site["burst"]
+        worker.publish_concurrency = site["concurrency"]
+        worker.publish_window_minutes = site["window_minutes"]
+        label = urlparse(site["domain"]).netloc
+        worker.log_message = lambda message: self.log_message(f"[{label}] {message}")
+        return worker
+    
+    def publish_site(self, site):
+        """사이트 하나의 폴더를 설정된 방식으로 발행하고 사이트별 통계를 반환합니다.
+        
+        오류는 이 사이트의 통계에만 기록되고 다른 사이트 발행에는 영향을 주지 않습니다.
+        """
+        stats = {"site": urlparse(site["domain"]).netloc, "backend": site["backend"],
+                 "total": 0, "succeeded": 0, "failed": 0, "elapsed": 0.0, "error": None}
+        started = time.time()
+        try:
+            worker = self.clone_for_site(site)
+            entries = worker.get_pending_post_entries()
+            stats["total"] = len(entries)
+            if entries:
+                username = site["username"]
+                password = worker.app_password_var.get() or worker.password_var.get()
+                if site["backend"] == "rest":
+                    publisher = WordPressRestPublisher(site["domain"], username, password)
+                    results = worker.publish_entries_via_rest(entries, publisher, site["concurrency"])
+                elif site["backend"] == "rest_async":
+                    results = worker.publish_entries_via_async_rest(entries, site["concurrency"])
+                elif site["backend"] == "xmlrpc":
+                    publisher = WordPressXmlRpcPublisher(site["domain"], username, password)
+                    results = worker.publish_entries_via_xmlrpc(entries, publisher)
+                else:
+                    results = worker.publish_entries_via_pool(entries)
+                    if results is None:
+                        raise RuntimeError("로그인된 브라우저를 준비하지 못했습니다.")
+                stats["succeeded"] = sum(1 for post_id in results if post_id)
+                stats["failed"] = len(results) - stats["succeeded"]
+        except Exception as e:
+            stats["error"] = str(e)
+            stats["failed"] = stats["total"] - stats["succeeded"]
+        stats["elapsed"] = time.time() - started
+        return stats
+    
+    def perform_multi_site_publish(self):
+        """설정 파일의 모든 사이트를 사이트마다 별도 작업자 그룹으로 동시에 발행합니다."""
+        try:
+            sites = load_sites_config(self.sites_config_path)
+        except (OSError, ValueError) as e:
+            self.log_message(f"❌ 사이트 설정 파일을 읽을 수 없습니다: {str(e)}")
+            self.root.after(0, self.on_login_failure)
+            return
+        
+        self.log_message(f"🌐 {len(sites)}개 사이트에 동시에 발행합니다: {self.sites_config_path}")
+        self.get_ledger()  # 사이트별 작업자가 같은 발행 기록 연결을 쓰도록 복사 전에 연결
+        started = time.time()
+        all_stats = []
+        with ThreadPoolExecutor(max_workers=len(sites)) as executor:
+            futures = [executor.submit(self.publish_site, site) for site in sites]
+            for future in as_completed(futures):
+                stats = future.result()
+                all_stats.append(stats)
+                self.run_log.write("site", **stats)
+                rate = stats["succeeded"] / stats["elapsed"] * 60 if stats["elapsed"] > 0 else 0
+                line = (f"📊 [{stats['site']}] {stats['backend']}: 성공 {stats['succeeded']}/{stats['total']}개, "
+                        f"실패 {stats['failed']}개, {stats['elapsed']:.1f}초 (분당 {rate:.1f}개)")
+                if stats["error"]:
+                    line += f" - 오류: {stats['error']}"
+                self.log_message(line)
+        
+        succeeded = sum(stats["succeeded"] for stats in all_stats)
+        failed = sum(stats["failed"] for stats in all_stats)
+        broken = [stats["site"] for stats in all_stats if stats["error"]]
+        self.log_message(f"🎉 여러 사이트 발행 완료: 성공 {succeeded}개, 실패 {failed}개 "
+                         f"({time.time() - started:.1f}초)")
+        if broken:
+            self.log_message(f"⚠️ 오류가 난 사이트: {', '.join(broken)}")
+        self.root.after(0, self.on_publish_success)
+    
+    def on_publish_success(self):
+        """브라우저 없이 발행을 마쳤을 때 UI 업데이트"""
+        self.status_var.set("글 발행 완료")
+        self.login_button.config(state='normal')
+    
+    def perform_login(self):
+        """실제 로그인을 수행합니다."""
+        self.start_profiling()
+        try:
+            domain = self.domain_var.get().strip()
+            username = self.username_var.get().strip()
+            password = self.password_var.get().strip()
             
             # 로그인 성공 여부 확인
-            if "wp-admin" in self.driver.current_url and "wp-login.php" not in self.driver.current_url:
+            if self.login_with_browser(domain, username, password, self.keep_session_var.get()):
                 self.log_message("✅ 로그인에 성공했습니다!")
                 self.is_logged_in = True
                 
@@ -336,6 +3334,198 @@ class WordPressAutoLogin:
         except Exception as e:
             self.log_message(f"❌ 예상치 못한 오류가 발생했습니다: {str(e)}")
             self.root.after(0, self.on_login_failure)
+            
+        finally:
+            self.finish_profiling()
+    
+    def start_browser(self, domain, keep_session, profile_name="profile", lean=False):
+        """Chrome을 시작해 self.driver로 설정합니다.
+        
+        lean=True이면 발행 전용 프로필(헤드리스, eager 로드, 이미지·폰트 차단)로 실행합니다.
+        """
+        # Chrome 옵션 설정
+        chrome_options = Options()
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        if lean:
+            self.apply_publisher_options(chrome_options)
+        
+        # 사이트별 브라우저 프로필 사용 (HTTP 캐시 유지)
+        if keep_session:
+            profile_dir = os.path.join(self.get_session_dir(domain), profile_name)
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+            self.log_message(f"브라우저 프로필을 사용합니다: {profile_dir}")
+        
+        # WebDriver 초기화
+        self.log_message("브라우저를 시작하고 있습니다...")
+        started = time.time()
+        driver_path = ChromeDriverResolver(self.chromedriver_path, log=self.log_message).resolve()
+        resolved = time.time()
+        
+        service = Service(driver_path) if driver_path else Service()
+        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        
+        if self.profiler:
+            self.profiler.attach(self.driver)
+        
+        if lean:
+            self.block_heavy_resources()
+        
+        self.log_message(f"⏱️ 브라우저 시작 {time.time() - started:.2f}초 "
+                         f"(드라이버 확인 {resolved - started:.2f}초)")
+        return self.driver
+    
+    def apply_publisher_options(self, chrome_options):
+        """발행 전용 프로필 옵션을 적용합니다. (브라우저당 메모리와 에디터 로드 시간 절감)"""
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1280,900")  # 에디터 레이아웃이 모바일로 바뀌지 않는 크기
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+        # DOMContentLoaded에서 get()이 반환되고, 이후 준비 여부는 조건 대기로 확인합니다.
+        chrome_options.page_load_strategy = 'eager'
+    
+    def block_heavy_resources(self):
+        """DevTools Network.setBlockedURLs로 에디터에 필요 없는 리소스 요청을 막습니다."""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": PUBLISHER_BLOCKED_URLS})
+        except Exception as e:
+            self.log_message(f"⚠️ 리소스 차단 설정 실패: {str(e)}")
+    
+    def login_with_browser(self, domain, username, password, keep_session, profile_name="profile", lean=False):
+        """브라우저를 시작하고 wp-admin에 로그인합니다. 로그인되면 True를 반환합니다."""
+        # wp-admin URL 생성
+        admin_url = urljoin(domain.rstrip('/') + '/', 'wp-admin/')
+        
+        self.log_message(f"WordPress 관리자 페이지에 접속합니다: {admin_url}")
+        with self.profile_step("브라우저 시작"):
+            self.start_browser(domain, keep_session, profile_name, lean=lean)
+        
+        with self.profile_step("로그인"):
+            # 저장된 로그인 쿠키 복원
+            if keep_session:
+                self.restore_session_cookies(domain)
+            
+            # 페이지 로드
+            self.driver.get(admin_url)
+            
+            if self.is_admin_page():
+                self.log_message("✅ 저장된 세션으로 로그인되어 있습니다. 로그인 폼을 건너뜁니다.")
+            else:
+                self.log_message("WordPress 로그인 페이지를 로드했습니다.")
+                self.submit_login_form(username, password, remember=keep_session)
+            
+            if not self.is_admin_page():
+                return False
+        
+        if keep_session:
+            self.save_session_cookies(domain)
+        return True
+    
+    def submit_login_form(self, username, password, remember=False):
+        """wp-login.php 폼에 로그인 정보를 입력하고 제출합니다."""
+        # 로그인 폼 요소 대기 및 찾기
+        wait = WebDriverWait(self.driver, 10)
+        
+        # 사용자명 입력 필드 찾기 (user_login)
+        self.log_message("로그인 폼을 찾고 있습니다...")
+        username_field = wait.until(
+            EC.presence_of_element_located((By.ID, "user_login"))
+        )
+        
+        # 비밀번호 입력 필드 찾기 (user_pass)
+        password_field = self.driver.find_element(By.ID, "user_pass")
+        
+        # 로그인 버튼 찾기 (wp-submit)
+        login_button = self.driver.find_element(By.ID, "wp-submit")
+        
+        self.log_message("로그인 정보를 입력하고 있습니다...")
+        
+        # 입력 필드 클리어 후 입력
+        username_field.clear()
+        username_field.send_keys(username)
+        
+        password_field.clear()
+        password_field.send_keys(password)
+        
+        # 로그인 유지 체크 (세션 쿠키 대신 만료일이 있는 쿠키를 받기 위함)
+        if remember:
+            remember_boxes = self.driver.find_elements(By.ID, "rememberme")
+            if remember_boxes and not remember_boxes[0].is_selected():
+                remember_boxes[0].click()
+        
+        # 로그인 버튼 클릭
+        self.log_message("로그인 버튼을 클릭합니다...")
+        login_button.click()
+        
+        # 로그인 결과 확인: 로그인 페이지를 벗어나거나 오류 메시지가 나타날 때까지 대기
+        self.wait_until(
+            lambda d: "wp-login.php" not in d.current_url or d.find_elements(By.ID, "login_error"),
+            timeout=15
+        )
+    
+    def is_admin_page(self):
+        """현재 페이지가 로그인된 wp-admin 페이지인지 확인합니다."""
+        current_url = self.driver.current_url
+        return "wp-admin" in current_url and "wp-login.php" not in current_url
+    
+    def get_session_dir(self, domain):
+        """사이트별 세션 저장 폴더를 반환합니다. (없으면 생성)"""
+        site_name = urlparse(domain).netloc.replace(':', '_') or "default"
+        session_dir = os.path.join(SESSION_BASE_DIR, site_name)
+        os.makedirs(session_dir, exist_ok=True)
+        return session_dir
+    
+    def save_session_cookies(self, domain):
+        """현재 브라우저의 로그인 쿠키를 파일에 저장합니다. (소유자만 읽고 쓸 수 있는 0600 권한)"""
+        try:
+            cookie_path = os.path.join(self.get_session_dir(domain), "cookies.json")
+            fd = os.open(cookie_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.chmod(cookie_path, 0o600)  # 예전 버전이 만든 파일도 권한을 줄임
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.driver.get_cookies(), f, ensure_ascii=False)
+            self.log_message("💾 로그인 쿠키를 저장했습니다.")
+        except Exception as e:
+            self.log_message(f"⚠️ 로그인 쿠키 저장 실패: {str(e)}")
+    
+    def restore_session_cookies(self, domain):
+        """저장된 로그인 쿠키 중 만료되지 않은 것을 브라우저에 복원합니다."""
+        cookie_path = os.path.join(self.get_session_dir(domain), "cookies.json")
+        if not os.path.exists(cookie_path):
+            return False
+        
+        try:
+            with open(cookie_path, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+            
+            now = time.time()
+            valid_cookies = [c for c in cookies if not c.get('expiry') or c['expiry'] > now]
+            if not valid_cookies:
+                self.log_message("📝 저장된 로그인 쿠키가 만료되었습니다. 다시 로그인합니다.")
+                return False
+            
+            # 쿠키는 같은 도메인 페이지에 있을 때만 추가할 수 있습니다.
+            self.driver.get(urljoin(domain.rstrip('/') + '/', 'wp-login.php'))
+            for cookie in valid_cookies:
+                try:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException:
+                    continue
+            
+            self.log_message(f"📝 저장된 로그인 쿠키 {len(valid_cookies)}개를 복원했습니다.")
+            return True
+            
+        except Exception as e:
+            self.log_message(f"⚠️ 로그인 쿠키 복원 실패: {str(e)}")
+            return False
     
     def on_login_success(self):
         """로그인 성공 시 UI 업데이트"""
@@ -360,6 +3550,7 @@ class WordPressAutoLogin:
     
     def logout(self):
         """로그아웃을 수행합니다."""
+        self.watch_stop_event.set()
         if self.driver:
             try:
                 self.log_message("로그아웃 중...")
@@ -390,9 +3581,44 @@ class WordPressAutoLogin:
         else:
             messagebox.showwarning("경고", "먼저 로그인을 해주세요.")
     
+    def get_post_new_url(self):
+        """글 유형에 맞는 wp-admin/post-new.php 주소를 만듭니다."""
+        domain = self.domain_var.get().strip()
+        url = urljoin(domain.rstrip('/') + '/', 'wp-admin/post-new.php')
+        if self.post_type and self.post_type != "post":
+            url += '?' + urlencode({'post_type': self.post_type})
+        return url
+    
     def navigate_to_add_post(self):
-        """글 추가 페이지로 이동하는 실제 작업을 수행합니다."""
+        """post-new.php로 바로 이동합니다. 실패하면 메뉴를 따라 이동합니다."""
+        try:
+            post_new_url = self.get_post_new_url()
+            self.log_message(f"글 작성 페이지로 바로 이동합니다: {post_new_url}")
+            with self.profile_step("글 작성 페이지 이동"):
+                self.driver.get(post_new_url)
+            
+            # 권한 오류 페이지(wp_die)는 #error-page로 표시됩니다.
+            if ("post-new.php" in self.driver.current_url
+                    and not self.driver.find_elements(By.ID, "error-page")):
+                self.log_message("✅ 글 작성 페이지로 이동했습니다!")
+                self.root.after(0, lambda: self.status_var.set("글 작성 중..."))
+                
+                # 글 작성 전체 프로세스 시작
+                self.start_post_writing_process()
+                return
+            
+            self.log_message("⚠️ 글 작성 페이지로 바로 이동하지 못했습니다. 메뉴를 통해 이동합니다.")
+            
+        except Exception as e:
+            self.log_message(f"⚠️ 글 작성 페이지 직접 이동 실패: {str(e)}. 메뉴를 통해 이동합니다.")
+        
+        with self.profile_step("글 작성 페이지 이동"):
+            self.navigate_via_admin_menu()
+    
+    def navigate_via_admin_menu(self):
+        """'글' 메뉴와 '글 추가' 버튼을 눌러 글 추가 페이지로 이동합니다."""
         try:
+            self.driver.get(urljoin(self.domain_var.get().strip().rstrip('/') + '/', 'wp-admin/'))
             self.log_message("글 메뉴를 찾고 있습니다...")
             
             wait = WebDriverWait(self.driver, 10)
@@ -436,8 +3662,8 @@ class WordPressAutoLogin:
             self.log_message("'글' 메뉴를 클릭합니다...")
             self.driver.execute_script("arguments[0].click();", posts_menu)
             
-            # 페이지 로드 대기
-            time.sleep(2)
+            # 글 목록 페이지로 이동할 때까지 대기
+            self.wait_until(lambda d: "edit.php" in d.current_url)
             
             # "글 추가" 버튼 찾기 (page-title-action 클래스)
             self.log_message("'글 추가' 버튼을 찾고 있습니다...")
@@ -477,8 +3703,8 @@ class WordPressAutoLogin:
             self.log_message("'글 추가' 버튼을 클릭합니다...")
             self.driver.execute_script("arguments[0].click();", add_new_button)
             
-            # 페이지 로드 대기
-            time.sleep(3)
+            # 글 작성 페이지로 이동할 때까지 대기
+            self.wait_until(lambda d: "post-new.php" in d.current_url)
             
             # 성공 확인
             if "post-new.php" in self.driver.current_url or "wp-admin" in self.driver.current_url:
@@ -506,25 +3732,93 @@ class WordPressAutoLogin:
             # 1단계: 텍스트 파일에서 데이터 읽기
             if not self.load_post_data():
                 return
-                
-            # 2단계: 페이지 로드 완료 대기
-            self.wait_for_page_load()
             
-            # 3단계: 제목 입력
-            if not self.input_post_title():
-                return
-                
-            # 4단계: HTML 블록 추가 및 내용 입력
-            if not self.add_html_block_and_content():
-                return
-                
-            # 5단계: 편집 완료 처리
-            self.finish_post_editing()
+            self.write_loaded_post()
+            self.log_selector_stats()
             
         except Exception as e:
             self.log_message(f"❌ 글 작성 프로세스 중 오류: {str(e)}")
             self.root.after(0, lambda: self.status_var.set("글 작성 실패"))
     
+    def write_loaded_post(self, finish_editing=True):
+        """열려 있는 글 작성 페이지에 self.post_title/post_content를 입력합니다.
+        
+        입력(finish_editing이면 편집 완료 단계까지)을 마치면 True를 반환합니다.
+        키보드 편집 완료(TAB → TAB → ENTER)는 입력 칸에 직접 입력한 경우에만 하고, 스토어 입력이 성공했으면 건너뜁니다.
+        바로 save_post_via_data_store로 저장하는 호출자는 finish_editing=False로 키 입력을 건너뜁니다.
+        """
+        # 2단계: 페이지 로드 완료 대기
+        with self.profile_step("에디터 로드"):
+            self.wait_for_page_load()
+        
+        # 빠른 경로: wp.data 스토어로 제목과 HTML 블록을 한 번에 입력
+        if self.use_data_store_injection:
+            with self.profile_step("스토어 입력"):
+                injected = self.inject_post_via_data_store()
+            if injected:
+                # 스토어 입력은 포커스된 입력 칸이 없으므로 키보드 편집 완료 단계가 필요 없습니다.
+                if finish_editing:
+                    self.mark_post_written()
+                return True
+            if injected is None:
+                return False
+        
+        # 3단계: 제목 입력
+        with self.profile_step("제목"):
+            if not self.input_post_title():
+                return False
+            
+        # 4단계: HTML 블록 추가 및 내용 입력
+        with self.profile_step("본문"):
+            if not self.add_html_block_and_content():
+                return False
+            
+        # 5단계: 편집 완료 처리
+        if finish_editing:
+            with self.profile_step("편집 완료"):
+                self.finish_post_editing()
+        return True
+    
+    def save_post_via_data_store(self, status="publish", timeout=30, post_date=None, meta=None):
+        """에디터 스토어로 글을 저장(발행)하고 저장된 글 ID를 반환합니다. 실패하면 None.
+        
+        post_date(UTC datetime)가 주어지면 그 시각으로 예약 발행합니다.
+        meta(글 파일의 설정)가 있으면 그 status, slug, categories/tags를 함께 저장합니다.
+        """
+        with self.profile_step("저장"):
+            return self._save_post_via_data_store(status, timeout, post_date, meta or {})
+    
+    def _save_post_via_data_store(self, status, timeout, post_date=None, meta=None):
+        meta = meta or {}
+        status = meta.get("status", status)
+        date = post_date.strftime('%Y-%m-%dT%H:%M:%SZ') if post_date else None
+        try:
+            edits = self.post_edits_from_meta(meta)
+            self.driver.execute_script(SAVE_POST_SCRIPT, status, date, edits)
+        except Exception as e:
+            self.log_message(f"❌ 글 저장 요청 실패: {str(e)}")
+            return None
+        
+        post_id = self.wait_until(lambda d: d.execute_script(POST_SAVED_SCRIPT, status), timeout=timeout)
+        if post_id:
+            self.log_message(f"✅ 글 저장 완료 (ID: {post_id})")
+        else:
+            self.log_message("❌ 글 저장 확인 시간이 초과되었습니다.")
+        return post_id
+    
+    def post_edits_from_meta(self, meta):
+        """글 설정의 slug와 categories/tags 이름을 에디터에 넣을 속성으로 바꿉니다. (분류는 ID로 조회)"""
+        edits = {}
+        if meta.get("slug"):
+            edits["slug"] = meta["slug"]
+        for key in ("categories", "tags"):
+            if meta.get(key):
+                result = self.driver.execute_async_script(TERM_IDS_SCRIPT, key, meta[key])
+                if result.get("error"):
+                    raise RuntimeError(f"{key} 조회 실패: {result['error']}")
+                edits[key] = result["ids"]
+        return edits
+    
     def load_post_data(self):
         """텍스트 파일에서 제목과 내용을 로드합니다."""
         try:
@@ -541,19 +3835,103 @@ class WordPressAutoLogin:
             self.log_message(f"❌ 글 데이터 로드 실패: {str(e)}")
             return False
     
+    def inject_post_via_data_store(self):
+        """execute_script 한 번으로 제목과 core/html 블록을 에디터 스토어에 넣습니다.
+        
+        결과 블록 목록을 확인해 제목과 본문 길이가 맞으면 True를 반환합니다.
+        맞지 않으면 넣은 블록과 제목을 되돌리고 False(기존 방식으로 입력해도 됨)를,
+        되돌리지 못하면 None(기존 방식으로 입력하면 본문이 중복됨)을 반환합니다.
+        """
+        self.log_message("📝 에디터 스토어로 제목과 HTML 블록을 입력합니다...")
+        
+        try:
+            result = self.driver.execute_script(INJECT_POST_SCRIPT, self.post_title, self.post_content)
+        except Exception as e:
+            self.log_message(f"⚠️ 에디터 스토어 입력 실패: {str(e)}. 기존 방식으로 진행합니다.")
+            return False
+        
+        if not result or not result.get('ok'):
+            error = result.get('error') if result else '응답 없음'
+            self.log_message(f"⚠️ 에디터 스토어 입력 실패: {error}. 기존 방식으로 진행합니다.")
+            return False
+        
+        # JavaScript 문자열 길이는 UTF-16 코드 단위 기준입니다.
+        expected_length = len(self.post_content.encode('utf-16-le')) // 2
+        blocks = result.get('blocks') or []
+        html_blocks = [b for b in blocks if b.get('name') == 'core/html']
+        
+        if result.get('title') != self.post_title or not any(b.get('length') == expected_length for b in html_blocks):
+            self.log_message(f"⚠️ 에디터 스토어 입력 결과가 일치하지 않습니다: {blocks}. 입력한 내용을 되돌립니다.")
+            try:
+                reverted = self.driver.execute_script(REVERT_INJECTED_POST_SCRIPT, result.get('clientId'),
+                                                      result.get('previousTitle', ''), result.get('replaced'))
+            except Exception as e:
+                self.log_message(f"⚠️ 되돌리기 실패: {str(e)}")
+                reverted = False
+            if not reverted:
+                self.log_message("❌ 에디터 스토어 입력을 되돌리지 못해 이 글 작성을 중단합니다.")
+                return None
+            self.log_message("📝 되돌렸습니다. 기존 방식으로 진행합니다.")
+            return False
+        
+        self.log_message(f"✅ 에디터 스토어 입력 완료 (블록 {len(blocks)}개, 본문 {len(self.post_content)}자)")
+        return True
+    
     def wait_for_page_load(self):
         """페이지가 완전히 로드될 때까지 대기합니다."""
         self.log_message("📝 페이지 로드 완료를 기다립니다...")
-        time.sleep(5)  # 기본 대기
         
-        # 에디터가 로드될 때까지 대기
-        try:
-            wait = WebDriverWait(self.driver, 15)
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".block-editor-writing-flow, .editor-styles-wrapper")))
+        # 에디터 DOM과 wp.data 스토어가 모두 준비될 때까지 대기
+        ready = self.wait_until(
+            lambda d: d.find_elements(By.CSS_SELECTOR, ".block-editor-writing-flow, .editor-styles-wrapper")
+            and d.execute_script(EDITOR_READY_SCRIPT),
+            timeout=20
+        )
+        if ready:
             self.log_message("✅ 에디터 로드 완료")
-        except:
+        else:
             self.log_message("⚠️ 에디터 로드 확인 실패, 계속 진행합니다.")
     
+    def get_selector_memory(self):
+        """현재 사이트와 WordPress 버전의 선택자 기억을 반환합니다."""
+        if self.selector_memory is None:
+            try:
+                wp_version = self.driver.execute_script(WP_VERSION_SCRIPT)
+            except Exception:
+                wp_version = None
+            path = os.path.join(self.get_session_dir(self.domain_var.get().strip()), "selectors.json")
+            self.selector_memory = SelectorMemory.for_path(path, wp_version)
+        return self.selector_memory
+    
+    def ordered_selectors(self, step, *tiers):
+        """이 사이트에서 성공했던 선택자가 앞에 오도록 정렬한 목록을 반환합니다.
+        
+        범용 대체 선택자는 마지막 tier로 넘기면 구체적인 선택자보다 앞으로 올라오지 않습니다.
+        """
+        return self.get_selector_memory().order(step, *tiers)
+    
+    def remember_selector(self, step, ordered, selector, started):
+        """성공한 선택자를 기억합니다."""
+        try:
+            self.get_selector_memory().record(step, selector, ordered.index(selector), time.time() - started)
+        except Exception as e:
+            self.log_message(f"⚠️ 선택자 기록 실패: {str(e)}")
+    
+    def save_selector_memory(self):
+        """이번 실행에서 기억한 선택자를 파일에 저장합니다. (발행 중에는 메모리에만 기록)"""
+        try:
+            SelectorMemory.flush_all()
+        except Exception as e:
+            self.log_message(f"⚠️ 선택자 기록 저장 실패: {str(e)}")
+    
+    def log_selector_stats(self):
+        """선택자 기억을 저장하고 단계별 적중률과 평균 찾기 시간을 로그에 출력합니다."""
+        self.save_selector_memory()
+        if self.selector_memory is None:
+            return
+        for line in self.selector_memory.summary():
+            self.log_message(f"📊 선택자 {line}")
+    
     def input_post_title(self):
         """글 제목을 입력합니다."""
         self.log_message("📝 제목을 입력합니다...")
@@ -568,19 +3946,12 @@ class WordPressAutoLogin:
                 ".block-editor-rich-text__editable[aria-label*='제목'], .block-editor-rich-text__editable[aria-label*='title']"
             ]
             
-            title_field = None
-            for selector in title_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            title_field = element
-                            self.log_message(f"✅ 제목 필드 찾음: {selector}")
-                            break
-                    if title_field:
-                        break
-                except:
-                    continue
+            ordered = self.ordered_selectors("title", title_selectors)
+            started = time.time()
+            title_field, selector = self.find_first(ordered)
+            if title_field:
+                self.log_message(f"✅ 제목 필드 찾음: {selector}")
+                self.remember_selector("title", ordered, selector, started)
             
             if not title_field:
                 self.log_message("❌ 제목 입력 필드를 찾을 수 없습니다.")
@@ -588,10 +3959,14 @@ class WordPressAutoLogin:
             
             # 제목 입력
             self.driver.execute_script("arguments[0].focus();", title_field)
-            time.sleep(1)
             title_field.clear()
             title_field.send_keys(self.post_title)
-            time.sleep(2)
+            
+            # 에디터 스토어(또는 필드)에 제목이 반영될 때까지 대기
+            self.wait_until(
+                lambda d: (d.execute_script(EDITOR_TITLE_SCRIPT) or title_field.text) == self.post_title,
+                timeout=5
+            )
             
             self.log_message(f"✅ 제목 입력 완료: {self.post_title}")
             return True
@@ -632,21 +4007,21 @@ class WordPressAutoLogin:
         try:
             content_selectors = [
                 ".block-editor-writing-flow",
+                ".block-editor-block-list__layout"
+            ]
+            fallback_selectors = [
                 ".wp-block",
-                ".block-editor-block-list__layout",
                 ".editor-styles-wrapper"
             ]
             
-            for selector in content_selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element.is_displayed():
-                        self.driver.execute_script("arguments[0].click();", element)
-                        time.sleep(2)
-                        self.log_message(f"✅ 본문 영역 클릭 완료: {selector}")
-                        return True
-                except:
-                    continue
+            ordered = self.ordered_selectors("content_area", content_selectors, fallback_selectors)
+            started = time.time()
+            element, selector = self.find_first(ordered, enabled=False)
+            if element:
+                self.driver.execute_script("arguments[0].click();", element)
+                self.log_message(f"✅ 본문 영역 클릭 완료: {selector}")
+                self.remember_selector("content_area", ordered, selector, started)
+                return True
                     
             self.log_message("❌ 본문 영역을 찾을 수 없습니다.")
             return False
@@ -663,21 +4038,19 @@ class WordPressAutoLogin:
             add_block_selectors = [
                 ".block-editor-inserter__toggle",
                 ".block-editor-button-block-appender",
-                "[aria-label*='블록 추가'], [aria-label*='Add block']",
-                ".components-button.has-icon"
+                "[aria-label*='블록 추가'], [aria-label*='Add block']"
             ]
-            
-            for selector in add_block_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            self.driver.execute_script("arguments[0].click();", element)
-                            time.sleep(3)
-                            self.log_message(f"✅ 블록 추가 버튼 클릭 완료: {selector}")
-                            return True
-                except:
-                    continue
+            fallback_selectors = [".components-button.has-icon"]
+            
+            ordered = self.ordered_selectors("add_block", add_block_selectors, fallback_selectors)
+            started = time.time()
+            element, selector = self.find_first(ordered)
+            if element:
+                self.driver.execute_script("arguments[0].click();", element)
+                self.remember_selector("add_block", ordered, selector, started)
+                self.wait_for_inserter()
+                self.log_message(f"✅ 블록 추가 버튼 클릭 완료: {selector}")
+                return True
             
             # 대안: 키보드 단축키 사용
             self.log_message("📝 키보드 단축키로 블록 추가를 시도합니다...")
@@ -686,7 +4059,7 @@ class WordPressAutoLogin:
             
             actions = ActionChains(self.driver)
             actions.send_keys(Keys.ENTER).perform()
-            time.sleep(2)
+            self.wait_for_inserter(timeout=3)
             
             return True
             
@@ -694,6 +4067,25 @@ class WordPressAutoLogin:
             self.log_message(f"❌ 블록 추가 버튼 클릭 실패: {str(e)}")
             return False
     
+    def wait_for_inserter(self, timeout=10):
+        """블록 삽입기(검색창 또는 블록 목록)가 화면에 나타날 때까지 대기합니다."""
+        return self.wait_until(
+            lambda d: self.find_first([
+                ".block-editor-inserter__search input",
+                ".components-search-control__input",
+                ".block-editor-block-types-list__list-item",
+            ], enabled=False)[0],
+            timeout=timeout
+        )
+    
+    def wait_for_html_block(self, timeout=10):
+        """core/html 블록이 삽입되고 textarea가 나타날 때까지 대기합니다."""
+        return self.wait_until(
+            lambda d: d.execute_script(HTML_BLOCK_INSERTED_SCRIPT)
+            or d.find_elements(By.CSS_SELECTOR, ".wp-block[data-type='core/html'] textarea, .wp-block-html textarea"),
+            timeout=timeout
+        )
+    
     def search_and_select_html_block(self):
         """HTML 블록을 검색하고 선택합니다."""
         self.log_message("📝 HTML 블록을 검색합니다...")
@@ -706,24 +4098,21 @@ class WordPressAutoLogin:
                 ".block-editor-inserter__search input"
             ]
             
-            search_input = None
-            for selector in search_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            search_input = element
-                            break
-                    if search_input:
-                        break
-                except:
-                    continue
+            ordered = self.ordered_selectors("inserter_search", search_selectors)
+            started = time.time()
+            search_input, selector = self.find_first(ordered)
+            if search_input:
+                self.remember_selector("inserter_search", ordered, selector, started)
             
             if search_input:
                 self.driver.execute_script("arguments[0].focus();", search_input)
                 search_input.clear()
                 search_input.send_keys("html")
-                time.sleep(3)
+                # 검색 결과에 HTML 블록이 나타날 때까지 대기
+                self.wait_until(
+                    lambda d: d.find_elements(By.CSS_SELECTOR, ".editor-block-list-item-html"),
+                    timeout=5
+                )
                 self.log_message("✅ 'html' 검색 완료")
             
             # HTML 블록 선택
@@ -732,25 +4121,21 @@ class WordPressAutoLogin:
                 "button[aria-label*='HTML'], button[title*='HTML']"
             ]
             
-            for selector in html_block_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            element_text = element.get_attribute('aria-label') or element.text or ''
-                            if 'html' in element_text.lower():
-                                self.driver.execute_script("arguments[0].click();", element)
-                                time.sleep(3)
-                                self.log_message("✅ HTML 블록 선택 완료")
-                                return True
-                except:
-                    continue
+            ordered = self.ordered_selectors("html_block", html_block_selectors)
+            started = time.time()
+            element, selector = self.find_first(ordered, text_contains='html')
+            if element:
+                self.remember_selector("html_block", ordered, selector, started)
+                self.driver.execute_script("arguments[0].click();", element)
+                self.wait_for_html_block()
+                self.log_message("✅ HTML 블록 선택 완료")
+                return True
             
             # XPath로 텍스트 기반 검색
             try:
                 html_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'HTML')]")
                 self.driver.execute_script("arguments[0].click();", html_button)
-                time.sleep(3)
+                self.wait_for_html_block()
                 self.log_message("✅ HTML 블록 선택 완료 (XPath)")
                 return True
             except:
@@ -768,39 +4153,24 @@ class WordPressAutoLogin:
         self.log_message("📝 HTML 내용을 입력합니다...")
         
         try:
-            time.sleep(3)  # HTML 블록 로드 대기
-            
-            # HTML textarea 찾기
-            html_textarea = None
-            textarea_selectors = [
-                ".wp-block[data-type='core/html'] textarea",
-                ".wp-block-html textarea",
-                "textarea[aria-label*='HTML']"
-            ]
+            self.wait_for_html_block()  # HTML 블록 로드 대기
             
-            # 일반적인 textarea 중에서 HTML 블록용 찾기
-            all_textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
-            self.log_message(f"📝 전체 textarea 개수: {len(all_textareas)}")
-            
-            # 가장 최근에 추가된 textarea (HTML 블록용) 선택
-            for textarea in reversed(all_textareas):
-                if textarea.is_displayed() and textarea.is_enabled():
-                    # 제목 필드가 아닌지 확인
-                    parent_html = self.driver.execute_script("return arguments[0].parentElement.innerHTML;", textarea)
-                    if 'title' not in parent_html.lower():
-                        html_textarea = textarea
-                        self.log_message("✅ HTML textarea 발견")
-                        break
+            # HTML textarea 찾기: 가장 최근에 추가된, 제목 필드가 아닌 textarea (HTML 블록용)
+            html_textarea, _ = self.find_first(["textarea"], exclude_title=True, last=True)
+            if html_textarea:
+                self.log_message("✅ HTML textarea 발견")
             
             if not html_textarea:
                 self.log_message("❌ HTML textarea를 찾을 수 없습니다.")
                 return False
             
-            # 내용 입력 (여러 방법 시도)
+            # 내용 입력 (여러 방법 시도): 한 글자씩 입력하는 send_keys는 큰 본문에서 수 분이 걸리므로
+            # 값을 한 번에 넣는 방법만 사용하고, 입력 결과는 본문 전체의 해시로 확인합니다.
+            expected_digest = list(text_digest(self.post_content))
             input_success = False
             input_methods = [
-                ("send_keys", lambda: (html_textarea.clear(), html_textarea.send_keys(self.post_content))),
-                ("javascript", lambda: self.driver.execute_script("arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('input'));", html_textarea, self.post_content)),
+                ("react_setter", lambda: self.driver.execute_script(SET_TEXTAREA_VALUE_SCRIPT, html_textarea, self.post_content)),
+                ("insert_text", lambda: self.insert_text_via_devtools(html_textarea)),
                 ("clipboard", lambda: self.paste_via_clipboard(html_textarea))
             ]
             
@@ -808,155 +4178,31 @@ class WordPressAutoLogin:
                 try:
                     self.log_message(f"📝 {method_name} 방법으로 입력 시도...")
                     self.driver.execute_script("arguments[0].focus();", html_textarea)
-                    time.sleep(1)
-                    
-                    if method_name == "send_keys":
-                        html_textarea.clear()
-                        html_textarea.send_keys(self.post_content)
-                    elif method_name == "javascript":
-                        self.driver.execute_script("arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('input'));", html_textarea, self.post_content)
-                    elif method_name == "clipboard":
-                        self.paste_via_clipboard(html_textarea)
                     
-                    time.sleep(2)
+                    started = time.perf_counter()
+                    method_func()
                     
-                    # 입력 확인
-                    current_value = html_textarea.get_attribute('value') or ''
-                    if self.post_content[:50] in current_value:
-                        self.log_message(f"✅ {method_name} 방법으로 입력 성공")
+                    # 입력 확인: textarea 값 전체가 본문과 같아질 때까지 대기
+                    if self.wait_until(
+                        lambda d: d.execute_script(TEXT_DIGEST_SCRIPT, html_textarea) == expected_digest,
+                        timeout=3
+                    ):
+                        self.log_message(f"✅ {method_name} 방법으로 입력 성공 "
+                                         f"({len(self.post_content)}자, {time.perf_counter() - started:.2f}초)")
                         input_success = True
                         break
+                    self.log_message(f"⚠️ {method_name} 방법으로 입력한 내용이 본문과 일치하지 않습니다.")
                     
                 except Exception as e:
                     self.log_message(f"❌ {method_name} 방법 실패: {str(e)}")
                     continue
             
             if input_success:
-                # HTML 내용 입력 완료 후 키보드 시퀀스 실행
+                # HTML 내용 입력 완료 후 키보드 시퀀스 실행 (키마다 포커스 이동을 확인하고 바로 다음 키로)
                 self.log_message("📝 HTML 내용 입력 완료, 키보드 시퀀스 실행...")
-                time.sleep(2)  # 입력 완료 후 충분한 대기
-                
                 try:
-                    from selenium.webdriver.common.keys import Keys
-                    from selenium.webdriver.common.action_chains import ActionChains
-                    
-                    # 현재 활성 요소에 포커스 확인
-                    active_element = self.driver.switch_to.active_element
-                    self.log_message(f"📝 현재 활성 요소: {active_element.tag_name}")
-                    
-                    # 방법 1: ActionChains를 사용한 키 입력
-                    try:
-                        self.log_message("📝 방법 1: ActionChains로 키 시퀀스 실행...")
-                        
-                        actions = ActionChains(self.driver)
-                        actions.send_keys(Keys.TAB)
-                        actions.pause(1)
-                        actions.send_keys(Keys.TAB)  
-                        actions.pause(1)
-                        actions.send_keys(Keys.ENTER)
-                        actions.perform()
-                        
-                        time.sleep(2)
-                        self.log_message("✅ 방법 1 완료 (ActionChains)")
-                        
-                    except Exception as e1:
-                        self.log_message(f"❌ 방법 1 실패: {str(e1)}")
-                        
-                        # 방법 2: 개별 키 입력
-                        try:
-                            self.log_message("📝 방법 2: 개별 키 입력...")
-                            
-                            # TAB 키 첫 번째
-                            html_textarea.send_keys(Keys.TAB)
-                            time.sleep(1)
-                            self.log_message("✅ TAB 키 1회 완료")
-                            
-                            # TAB 키 두 번째
-                            self.driver.switch_to.active_element.send_keys(Keys.TAB)
-                            time.sleep(1)
-                            self.log_message("✅ TAB 키 2회 완료")
-                            
-                            # ENTER 키
-                            self.driver.switch_to.active_element.send_keys(Keys.ENTER)
-                            time.sleep(1)
-                            self.log_message("✅ ENTER 키 완료")
-                            
-                        except Exception as e2:
-                            self.log_message(f"❌ 방법 2 실패: {str(e2)}")
-                            
-                            # 방법 3: body 요소를 통한 키 입력
-                            try:
-                                self.log_message("📝 방법 3: body 요소를 통한 키 입력...")
-                                
-                                body = self.driver.find_element(By.TAG_NAME, "body")
-                                
-                                body.send_keys(Keys.TAB)
-                                time.sleep(1)
-                                self.log_message("✅ body TAB 키 1회")
-                                
-                                body.send_keys(Keys.TAB)
-                                time.sleep(1)
-                                self.log_message("✅ body TAB 키 2회")
-                                
-                                body.send_keys(Keys.ENTER)
-                                time.sleep(1)
-                                self.log_message("✅ body ENTER 키")
-                                
-                            except Exception as e3:
-                                self.log_message(f"❌ 방법 3도 실패: {str(e3)}")
-                                
-                                # 방법 4: JavaScript 키 이벤트
-                                try:
-                                    self.log_message("📝 방법 4: JavaScript 키 이벤트...")
-                                    
-                                    # TAB 키 이벤트 2번
-                                    for i in range(2):
-                                        self.driver.execute_script("""
-                                            var event = new KeyboardEvent('keydown', {
-                                                key: 'Tab',
-                                                code: 'Tab',
-                                                keyCode: 9,
-                                                bubbles: true
-                                            });
-                                            document.activeElement.dispatchEvent(event);
-                                            
-                                            var event2 = new KeyboardEvent('keyup', {
-                                                key: 'Tab',
-                                                code: 'Tab', 
-                                                keyCode: 9,
-                                                bubbles: true
-                                            });
-                                            document.activeElement.dispatchEvent(event2);
-                                        """)
-                                        time.sleep(1)
-                                        self.log_message(f"✅ JavaScript TAB 키 {i+1}회")
-                                    
-                                    # ENTER 키 이벤트
-                                    self.driver.execute_script("""
-                                        var event = new KeyboardEvent('keydown', {
-                                            key: 'Enter',
-                                            code: 'Enter',
-                                            keyCode: 13,
-                                            bubbles: true
-                                        });
-                                        document.activeElement.dispatchEvent(event);
-                                        
-                                        var event2 = new KeyboardEvent('keyup', {
-                                            key: 'Enter',
-                                            code: 'Enter',
-                                            keyCode: 13,
-                                            bubbles: true
-                                        });
-                                        document.activeElement.dispatchEvent(event2);
-                                    """)
-                                    time.sleep(1)
-                                    self.log_message("✅ JavaScript ENTER 키")
-                                    
-                                except Exception as e4:
-                                    self.log_message(f"❌ 방법 4도 실패: {str(e4)}")
-                    
+                    self.press_editor_keys(FINISH_EDITING_KEYS)
                     self.log_message("✅ 키보드 시퀀스 시도 완료")
-                    
                 except Exception as e:
                     self.log_message(f"❌ 키보드 시퀀스 전체 실패: {str(e)}")
             
@@ -966,12 +4212,16 @@ class WordPressAutoLogin:
             self.log_message(f"❌ HTML 내용 입력 실패: {str(e)}")
             return False
     
+    def insert_text_via_devtools(self, element):
+        """DevTools Input.insertText로 요소의 기존 값을 본문으로 한 번에 바꿉니다. (Chrome 전용)"""
+        self.driver.execute_script("arguments[0].focus(); arguments[0].select();", element)
+        self.driver.execute_cdp_cmd("Input.insertText", {"text": self.post_content})
+    
     def paste_via_clipboard(self, element):
         """클립보드를 통한 붙여넣기"""
         try:
             import subprocess
-            subprocess.run(['clip'], input=self.post_content, text=True, check=True)
-            time.sleep(0.5)
+            subprocess.run(['clip'], input=self.post_content, text=True, check=True)  # 끝날 때까지 기다리므로 추가 대기 불필요
             
             from selenium.webdriver.common.keys import Keys
             from selenium.webdriver.common.action_chains import ActionChains
@@ -981,42 +4231,36 @@ class WordPressAutoLogin:
         except:
             pass
     
+    def press_editor_keys(self, keys, timeout=KEY_HANDLED_TIMEOUT):
+        """keys(Keys 속성 이름)를 차례로 누릅니다.
+        
+        고정 대기 대신 키마다 포커스가 옮겨 가고(ENTER·ESCAPE는 생략) 에디터 저장이 끝날 때까지만 기다립니다.
+        ActionChains가 실패하면 남은 키를 JavaScript 키 이벤트로 보냅니다.
+        """
+        for index, key in enumerate(keys):
+            before = self.driver.switch_to.active_element
+            try:
+                ActionChains(self.driver).send_keys(getattr(Keys, key)).perform()
+            except WebDriverException as e:
+                self.log_message(f"⚠️ 키 입력 실패 ({key}): {str(e)}. JavaScript 키 이벤트로 보냅니다.")
+                for name in keys[index:]:
+                    self.driver.execute_script(DISPATCH_KEY_SCRIPT, *KEY_EVENT_CODES[name])
+                return
+            self.wait_until(lambda d: d.execute_script(KEY_HANDLED_SCRIPT, before, key != "TAB"), timeout=timeout)
+    
+    def mark_post_written(self):
+        """글 입력이 끝났음을 상태 표시줄과 로그에 알립니다."""
+        self.root.after(0, lambda: self.status_var.set("글 작성 완료"))
+        self.log_message("🎉 모든 작업이 완료되었습니다!")
+    
     def finish_post_editing(self):
-        """편집 완료 처리를 합니다."""
+        """편집 완료 처리를 합니다. (TAB → TAB → ENTER, 실패하면 Escape)"""
         self.log_message("📝 키보드 입력으로 편집을 완료합니다...")
         
         try:
-            from selenium.webdriver.common.keys import Keys
-            from selenium.webdriver.common.action_chains import ActionChains
-            
-            # TAB 키 두 번, ENTER 키 한 번 시퀀스
-            actions = ActionChains(self.driver)
-            
-            # 1단계: TAB 키 첫 번째
-            self.log_message("📝 TAB 키 첫 번째 입력...")
-            actions.send_keys(Keys.TAB)
-            actions.perform()
-            time.sleep(1)
-            
-            # 2단계: TAB 키 두 번째  
-            self.log_message("📝 TAB 키 두 번째 입력...")
-            actions = ActionChains(self.driver)  # 새로운 액션 체인 생성
-            actions.send_keys(Keys.TAB)
-            actions.perform()
-            time.sleep(1)
-            
-            # 3단계: ENTER 키
-            self.log_message("📝 ENTER 키 입력...")
-            actions = ActionChains(self.driver)  # 새로운 액션 체인 생성
-            actions.send_keys(Keys.ENTER)
-            actions.perform()
-            time.sleep(2)
-            
+            self.press_editor_keys(FINISH_EDITING_KEYS)
             self.log_message("✅ 키보드 시퀀스 완료 (TAB → TAB → ENTER)")
-            
-            # 최종 완료
-            self.root.after(0, lambda: self.status_var.set("글 작성 완료"))
-            self.log_message("🎉 모든 작업이 완료되었습니다!")
+            self.mark_post_written()
             
         except Exception as e:
             self.log_message(f"❌ 키보드 시퀀스 실행 실패: {str(e)}")
@@ -1024,15 +4268,9 @@ class WordPressAutoLogin:
             # 대안: Escape 키 사용
             try:
                 self.log_message("📝 대안으로 Escape 키를 사용합니다...")
-                actions = ActionChains(self.driver)
-                actions.send_keys(Keys.ESCAPE)
-                actions.perform()
-                time.sleep(1)
+                self.press_editor_keys(("ESCAPE",))
                 self.log_message("✅ Escape 키로 편집 완료")
-                
-                # 최종 완료
-                self.root.after(0, lambda: self.status_var.set("글 작성 완료"))
-                self.log_message("🎉 모든 작업이 완료되었습니다!")
+                self.mark_post_written()
                 
             except Exception as e2:
                 self.log_message(f"❌ 대안 방법도 실패: {str(e2)}")
@@ -1047,18 +4285,14 @@ class WordPressAutoLogin:
                 "button[class*='editor-block-list-item-html']"
             ]
             
-            for selector in button_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            element_class = element.get_attribute('class') or ''
-                            if 'html' in element_class.lower():
-                                self.driver.execute_script("arguments[0].click();", element)
-                                time.sleep(2)
-                                return True
-                except:
-                    continue
+            ordered = self.ordered_selectors("html_block_button", button_selectors)
+            started = time.time()
+            element, selector = self.find_first(ordered, text_contains='html')
+            if element:
+                self.remember_selector("html_block_button", ordered, selector, started)
+                self.driver.execute_script("arguments[0].click();", element)
+                self.wait_for_html_block()
+                return True
             
             return False
             
@@ -1079,7 +4313,7 @@ class WordPressAutoLogin:
                 return
             
             wait = WebDriverWait(self.driver, 15)
-            time.sleep(3)  # 페이지 로드 대기
+            self._sleep(3)  # 페이지 로드 대기
             
             # 1. 제목 입력
             self.log_message("📝 제목을 입력하고 있습니다...")
@@ -1106,20 +4340,20 @@ class WordPressAutoLogin:
             
             if title_field:
                 self.driver.execute_script("arguments[0].click();", title_field)
-                time.sleep(1)
+                self._sleep(1)
                 title_field.clear()
                 title_field.send_keys(title)
                 self.log_message(f"✅ 제목 입력 완료: {title}")
             else:
                 self.log_message("❌ 제목 입력 필드를 찾을 수 없습니다.")
             
-            time.sleep(2)
+            self._sleep(2)
             
             # 2. 본문 영역 클릭 (block-editor-plain-text)
             self.log_message("📝 본문 영역을 클릭하고 있습니다...")
             
             # 먼저 페이지가 완전히 로드될 때까지 기다림
-            time.sleep(5)
+            self._sleep(5)
             
             # 다양한 방법으로 본문 영역 찾기
             content_area = None
@@ -1145,9 +4379,9 @@ class WordPressAutoLogin:
             if content_area:
                 # 본문 영역을 클릭하여 포커스 맞추기
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", content_area)
-                time.sleep(1)
+                self._sleep(1)
                 self.driver.execute_script("arguments[0].click();", content_area)
-                time.sleep(2)
+                self._sleep(2)
                 self.log_message("✅ 본문 영역 클릭 완료")
             else:
                 self.log_message("❌ 본문 영역을 찾을 수 없습니다.")
@@ -1188,11 +4422,11 @@ class WordPressAutoLogin:
                     # 에디터 영역에 포커스를 맞추고 Enter로 새 블록 생성
                     actions = ActionChains(self.driver)
                     actions.send_keys(Keys.ENTER).perform()
-                    time.sleep(2)
+                    self._sleep(2)
                     
                     # Ctrl+Shift+Alt+I로 블록 삽입기 열기
                     actions.key_down(Keys.CONTROL).key_down(Keys.SHIFT).key_down(Keys.ALT).send_keys('i').key_up(Keys.ALT).key_up(Keys.SHIFT).key_up(Keys.CONTROL).perform()
-                    time.sleep(2)
+                    self._sleep(2)
                     self.log_message("✅ 키보드 단축키로 블록 삽입기 열기 시도")
                 except Exception as e:
                     self.log_message(f"❌ 키보드 단축키 실패: {str(e)}")
@@ -1200,14 +4434,14 @@ class WordPressAutoLogin:
                 # + 버튼 클릭
                 try:
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", add_block_btn)
-                    time.sleep(1)
+                    self._sleep(1)
                     self.driver.execute_script("arguments[0].click();", add_block_btn)
-                    time.sleep(3)
+                    self._sleep(3)
                     self.log_message("✅ 블록 추가 버튼 클릭 완료")
                 except Exception as e:
                     self.log_message(f"❌ 블록 추가 버튼 클릭 실패: {str(e)}")
             
-            time.sleep(3)
+            self._sleep(3)
             
             # 4. 검색 입력란에 'html' 입력 (더 넓은 범위로 검색)
             self.log_message("📝 'html' 블록을 검색하고 있습니다...")
@@ -1223,7 +4457,7 @@ class WordPressAutoLogin:
             ]
             
             # 검색창이 나타날 때까지 잠시 대기
-            time.sleep(2)
+            self._sleep(2)
             
             for selector in search_selectors:
                 try:
@@ -1241,10 +4475,10 @@ class WordPressAutoLogin:
             if search_input:
                 try:
                     self.driver.execute_script("arguments[0].focus();", search_input)
-                    time.sleep(1)
+                    self._sleep(1)
                     search_input.clear()
                     search_input.send_keys("html")
-                    time.sleep(3)
+                    self._sleep(3)
                     self.log_message("✅ 'html' 검색 완료")
                 except Exception as e:
                     self.log_message(f"❌ 검색 입력 실패: {str(e)}")
@@ -1266,7 +4500,7 @@ class WordPressAutoLogin:
                 ".components-button:contains('HTML')"
             ]
             
-            time.sleep(2)
+            self._sleep(2)
             
             for selector in html_block_selectors:
                 try:
@@ -1289,9 +4523,9 @@ class WordPressAutoLogin:
             if html_block:
                 try:
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", html_block)
-                    time.sleep(1)
+                    self._sleep(1)
                     self.driver.execute_script("arguments[0].click();", html_block)
-                    time.sleep(3)
+                    self._sleep(3)
                     self.log_message("✅ HTML 블록 선택 완료")
                 except Exception as e:
                     self.log_message(f"❌ HTML 블록 클릭 실패: {str(e)}")
@@ -1304,7 +4538,7 @@ class WordPressAutoLogin:
             self.log_message("📝 HTML 블록의 입력 영역을 찾고 있습니다...")
             
             # HTML 블록이 완전히 로드될 때까지 충분히 대기
-            time.sleep(5)
+            self._sleep(5)
             
             # 현재 페이지의 모든 textarea 확인
             all_textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
@@ -1379,7 +4613,7 @@ class WordPressAutoLogin:
                 try:
                     # HTML 입력 영역으로 스크롤하고 포커스
                     self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", html_input)
-                    time.sleep(3)
+                    self._sleep(3)
                     
                     # 현재 입력 영역의 정보 로깅
                     element_info = self.driver.execute_script("""
@@ -1425,12 +4659,12 @@ class WordPressAutoLogin:
                             # 포커스 맞추기
                             self.driver.execute_script("arguments[0].focus();", html_input)
                             self.driver.execute_script("arguments[0].click();", html_input)
-                            time.sleep(1)
+                            self._sleep(1)
                             
                             if method == "selenium_send_keys":
                                 # 방법 1: Selenium send_keys
                                 html_input.clear()
-                                time.sleep(0.5)
+                                self._sleep(0.5)
                                 html_input.send_keys(content)
                                 
                             elif method == "javascript_value":
@@ -1456,7 +4690,7 @@ class WordPressAutoLogin:
                                 import subprocess
                                 try:
                                     subprocess.run(['clip'], input=content, text=True, check=True)
-                                    time.sleep(0.5)
+                                    self._sleep(0.5)
                                     
                                     # Ctrl+V로 붙여넣기
                                     actions = ActionChains(self.driver)
@@ -1464,7 +4698,7 @@ class WordPressAutoLogin:
                                 except:
                                     continue
                             
-                            time.sleep(2)
+                            self._sleep(2)
                             
                             # 입력 완료 확인
                             new_value = html_input.get_attribute('value') or html_input.get_attribute('innerHTML') or ''
@@ -1545,7 +4779,7 @@ class WordPressAutoLogin:
                                 try:
                                     # 버튼으로 스크롤하고 클릭
                                     self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", html_button)
-                                    time.sleep(1)
+                                    self._sleep(1)
                                     
                                     # 클릭 시도 (여러 방법)
                                     click_methods = [
@@ -1585,7 +4819,7 @@ class WordPressAutoLogin:
                                     if not clicked:
                                         self.log_message("❌ 모든 클릭 방법이 실패했습니다.")
                                     
-                                    time.sleep(2)
+                                    self._sleep(2)
                                     
                                 except Exception as e:
                                     self.log_message(f"❌ HTML 버튼 클릭 실패: {str(e)}")
@@ -1600,7 +4834,7 @@ class WordPressAutoLogin:
                                     actions = ActionChains(self.driver)
                                     actions.send_keys(Keys.ESCAPE).perform()
                                     self.log_message("✅ 대안으로 Escape 키 사용")
-                                    time.sleep(1)
+                                    self._sleep(1)
                                 except:
                                     pass
                                 
@@ -1657,7 +4891,7 @@ class WordPressAutoLogin:
                 from selenium.webdriver.common.keys import Keys
                 body = self.driver.find_element(By.TAG_NAME, "body")
                 body.send_keys(Keys.ENTER)
-                time.sleep(2)
+                self._sleep(2)
                 
                 # 새로 생성된 블록에 내용 입력
                 new_blocks = self.driver.find_elements(By.CSS_SELECTOR, "p[data-empty='true'], .wp-block-paragraph")
@@ -1678,11 +4912,15 @@ class WordPressAutoLogin:
     
     def on_closing(self):
         """프로그램 종료 시 정리 작업"""
+        self.watch_stop_event.set()
         if self.driver:
             try:
                 self.driver.quit()
             except:
                 pass
+        if self.ledger:
+            self.ledger.close()
+        self.run_log.close()
         self.root.destroy()
 
 
@@ -0,0 +1,778 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WordPress 모의(mock) 서버
+네트워크 없이 wordpress_auto_login.py의 로그인부터 글 발행까지 전체 흐름을 실행하고 시간을 재기 위한 로컬 서버입니다.
+
+- wp-login.php 로그인 폼 (#user_login, #user_pass, #rememberme, #wp-submit, #login_error)
+- wp-admin 대시보드와 '글' 메뉴, 글 목록(edit.php), 블록 에디터 모양의 post-new.php
+  (wp.data / wp.blocks 스토어를 흉내 내는 스크립트 포함, 저장하면 REST API로 글을 만듦)
+- /wp-json/wp/v2/posts, /wp-json/wp/v2/media, /wp-json/wp/v2/categories, /wp-json/wp/v2/tags
+  (애플리케이션 비밀번호 Basic 인증 또는 로그인 쿠키 + nonce. 실제 WordPress처럼 로그인 비밀번호는 받지 않음)
+- /xmlrpc.php (wp.newPost, system.multicall. 로그인 비밀번호와 애플리케이션 비밀번호 모두 허용)
+- --disable rest / application_passwords: REST API나 애플리케이션 비밀번호를 꺼 둔 사이트 흉내
+
+모든 요청에 인위적인 지연(--latency, --api-latency, --jitter)을 줄 수 있습니다.
+
+사용법:
+    python wordpress_mock_server.py --port 8080 --latency 0.05
+    → 프로그램에서 도메인 http://127.0.0.1:8080, 아이디 admin, 비밀번호 password 로 로그인
+"""
+
+import argparse
+import base64
+import html
+import json
+import random
+import re
+import secrets
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, quote, unquote
+from xmlrpc.server import SimpleXMLRPCDispatcher
+import xmlrpc.client
+
+
+# --disable로 끌 수 있는 기능 -> (HTTP 상태, WordPress 오류 코드, 메시지)
+DISABLED_FEATURE_ERRORS = {
+    "rest": (403, "rest_disabled", "이 사이트에서는 REST API를 사용할 수 없습니다."),
+    "application_passwords": (401, "application_passwords_disabled",
+                              "이 사이트에서는 애플리케이션 비밀번호를 사용할 수 없습니다."),
+}
+
+# 로그인 쿠키 이름 (실제 WordPress는 wordpress_logged_in_<해시>)
+LOGIN_COOKIE = "wordpress_logged_in_mock"
+
+# 블록 에디터의 wp.data / wp.blocks 중 wordpress_auto_login.py가 쓰는 부분만 흉내 내는 스크립트
+# 저장(savePost)하면 로그인 쿠키와 nonce로 REST API에 글을 만들거나 수정합니다.
+EDITOR_SCRIPT = """
+(function () {
+    var state = {
+        postId: 0,
+        saved: {status: 'auto-draft', title: '', date: null},
+        edits: {},
+        saving: false,
+        dirty: false,
+        blocks: [{name: 'core/paragraph', clientId: 'block-0', attributes: {content: ''}, isDefault: true}]
+    };
+    var nextClientId = 1;
+
+    function createBlock(name, attributes) {
+        return {name: name, clientId: 'block-' + (nextClientId++), attributes: attributes || {}};
+    }
+
+    function changed(rerender) {
+        state.dirty = true;
+        if (rerender) { renderBlocks(); }
+    }
+
+    function serialize() {
+        return state.blocks.map(function (block) {
+            var content = block.attributes.content || '';
+            if (block.name === 'core/html') {
+                return '<!-- wp:html -->\\n' + content + '\\n<!-- /wp:html -->';
+            }
+            return content ? '<!-- wp:paragraph -->\\n<p>' + content + '</p>\\n<!-- /wp:paragraph -->' : '';
+        }).filter(Boolean).join('\\n\\n');
+    }
+
+    function apiFetch(options) {
+        return fetch('/wp-json' + options.path, {
+            method: options.method || 'GET',
+            credentials: 'same-origin',
+            headers: {'Content-Type': 'application/json', 'X-WP-Nonce': window.MOCK_WP_NONCE},
+            body: options.data ? JSON.stringify(options.data) : undefined
+        }).then(function (response) {
+            if (!response.ok) { throw new Error('HTTP ' + response.status); }
+            return response.json();
+        });
+    }
+
+    function savePost() {
+        var attributes = Object.assign({}, state.saved, state.edits);
+        var payload = {title: attributes.title || '', content: serialize(), status: attributes.status || 'draft'};
+        ['date', 'slug', 'categories', 'tags'].forEach(function (key) {
+            if (attributes[key]) { payload[key] = attributes[key]; }
+        });
+        state.saving = true;
+        fetch('/wp-json/wp/v2/posts' + (state.postId ? '/' + state.postId : ''), {
+            method: 'POST',
+            credentials: 'same-origin',
+            headers: {'Content-Type': 'application/json', 'X-WP-Nonce': window.MOCK_WP_NONCE},
+            body: JSON.stringify(payload)
+        }).then(function (response) {
+            if (!response.ok) { throw new Error('HTTP ' + response.status); }
+            return response.json();
+        }).then(function (post) {
+            state.postId = post.id;
+            state.saved = {status: post.status, title: post.title.raw, date: post.date};
+            state.edits = {};
+            state.dirty = false;
+            state.saving = false;
+        }).catch(function (error) {
+            console.error(error);
+            state.saving = false;
+        });
+    }
+
+    var stores = {
+        'core/editor': {
+            select: {
+                getEditedPostAttribute: function (key) {
+                    return key in state.edits ? state.edits[key] : state.saved[key];
+                },
+                getCurrentPostAttribute: function (key) { return state.saved[key]; },
+                getCurrentPostId: function () { return state.postId || null; },
+                isSavingPost: function () { return state.saving; },
+                isEditedPostDirty: function () { return state.dirty; }
+            },
+            dispatch: {
+                editPost: function (edits) {
+                    Object.assign(state.edits, edits);
+                    if ('title' in edits) { renderTitle(); }
+                    changed(false);
+                },
+                savePost: savePost
+            }
+        },
+        'core/block-editor': {
+            select: {
+                getBlocks: function () { return state.blocks.slice(); }
+            },
+            dispatch: {
+                replaceBlock: function (clientId, block) {
+                    state.blocks = state.blocks.map(function (b) { return b.clientId === clientId ? block : b; });
+                    changed(true);
+                },
+                removeBlocks: function (clientIds) {
+                    clientIds = Array.isArray(clientIds) ? clientIds : [clientIds];
+                    state.blocks = state.blocks.filter(function (b) { return clientIds.indexOf(b.clientId) < 0; });
+                    changed(true);
+                },
+                insertBlocks: function (blocks) {
+                    state.blocks = state.blocks.concat(Array.isArray(blocks) ? blocks : [blocks]);
+                    changed(true);
+                }
+            }
+        }
+    };
+
+    window.wp = {
+        apiFetch: apiFetch,
+        data: {
+            select: function (name) { return stores[name] && stores[name].select; },
+            dispatch: function (name) { return stores[name] && stores[name].dispatch; }
+        },
+        blocks: {
+            createBlock: createBlock,
+            getBlockType: function (name) {
+                return (name === 'core/html' || name === 'core/paragraph') ? {name: name} : undefined;
+            },
+            isUnmodifiedDefaultBlock: function (block) {
+                return !!block.isDefault && !block.attributes.content;
+            }
+        }
+    };
+
+    function renderTitle() {
+        var title = document.querySelector('.editor-post-title__input');
+        var value = stores['core/editor'].select.getEditedPostAttribute('title') || '';
+        if (title && title.textContent !== value) { title.textContent = value; }
+    }
+
+    function renderBlocks() {
+        var layout = document.querySelector('.block-editor-block-list__layout.is-root-container');
+        layout.innerHTML = '';
+        state.blocks.forEach(function (block) {
+            var wrapper = document.createElement('div');
+            wrapper.setAttribute('data-type', block.name);
+            if (block.name === 'core/html') {
+                wrapper.className = 'wp-block wp-block-html block-editor-block-list__block';
+                var textarea = document.createElement('textarea');
+                textarea.className = 'block-editor-plain-text';
+                textarea.setAttribute('aria-label', 'HTML');
+                textarea.value = block.attributes.content || '';
+                textarea.addEventListener('input', function () {
+                    block.attributes.content = textarea.value;
+                    changed(false);
+                });
+                wrapper.appendChild(textarea);
+            } else {
+                wrapper.className = 'wp-block wp-block-paragraph block-editor-rich-text__editable';
+                wrapper.contentEditable = 'true';
+                wrapper.setAttribute('aria-label', '블록 추가: 단락');
+                wrapper.textContent = block.attributes.content || '';
+                wrapper.addEventListener('input', function () {
+                    block.attributes.content = wrapper.textContent;
+                    block.isDefault = false;
+                    changed(false);
+                });
+            }
+            layout.appendChild(wrapper);
+        });
+    }
+
+    document.addEventListener('DOMContentLoaded', function () {
+        var title = document.querySelector('.editor-post-title__input');
+        title.addEventListener('input', function () {
+            state.edits.title = title.textContent;
+            changed(false);
+        });
+
+        var menu = document.querySelector('.block-editor-inserter__menu');
+        document.querySelector('.block-editor-inserter__toggle').addEventListener('click', function () {
+            menu.hidden = !menu.hidden;
+        });
+        document.querySelector('.editor-block-list-item-html').addEventListener('click', function () {
+            menu.hidden = true;
+            var block = createBlock('core/html', {content: ''});
+            var blocks = state.blocks;
+            if (blocks.length === 1 && wp.blocks.isUnmodifiedDefaultBlock(blocks[0])) {
+                stores['core/block-editor'].dispatch.replaceBlock(blocks[0].clientId, block);
+            } else {
+                stores['core/block-editor'].dispatch.insertBlocks(block);
+            }
+            var textareas = document.querySelectorAll('.wp-block-html textarea');
+            if (textareas.length) { textareas[textareas.length - 1].focus(); }
+        });
+
+        renderTitle();
+        renderBlocks();
+    });
+})();
+"""
+
+ADMIN_MENU_HTML = """
+<div id="adminmenuwrap"><ul id="adminmenu">
+  <li class="menu-top menu-icon-dashboard"><a href="/wp-admin/index.php" class="menu-top"><div class="wp-menu-name">알림판</div></a></li>
+  <li class="menu-top menu-icon-post"><a href="/wp-admin/edit.php" class="menu-top"><div class="wp-menu-name">글</div></a>
+    <ul class="wp-submenu"><li><a href="/wp-admin/edit.php">모든 글</a></li><li><a href="/wp-admin/post-new.php">새 글 추가</a></li></ul>
+  </li>
+  <li class="menu-top menu-icon-media"><a href="/wp-admin/upload.php" class="menu-top"><div class="wp-menu-name">미디어</div></a></li>
+</ul></div>
+"""
+
+
+class MockWordPressState:
+    """모의 서버의 글, 미디어, 로그인 세션을 메모리에 보관합니다. (요청 스레드가 함께 쓰므로 잠금 사용)"""
+
+    def __init__(self, username, password, app_password):
+        self.username = username
+        self.password = password
+        self.app_password = app_password.replace(' ', '')
+        self.nonce = secrets.token_hex(5)
+        self.lock = threading.Lock()
+        self.sessions = set()
+        self.posts = {}
+        self.media = {}
+        self.terms = {"categories": {}, "tags": {}}  # 분류 -> {ID: 이름}
+        self.next_id = 1
+        self.request_counts = {}
+        self.connections = 0
+
+    def count(self, key):
+        with self.lock:
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+    def check_password(self, username, password, app_password_only=False):
+        """비밀번호 또는 애플리케이션 비밀번호가 맞는지 확인합니다.
+
+        app_password_only이면 애플리케이션 비밀번호만 받습니다. (REST API Basic 인증)
+        """
+        if username != self.username:
+            return False
+        return password.replace(' ', '') == self.app_password or (not app_password_only and password == self.password)
+
+    def new_session(self):
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.sessions.add(token)
+        return token
+
+    def _allocate_id(self):
+        post_id = self.next_id
+        self.next_id += 1
+        return post_id
+
+    def save_post(self, base_url, fields, post_id=None):
+        """글을 만들거나 수정하고 REST 응답 형식의 글 정보를 반환합니다.
+
+        발행 시각이 미래이면 WordPress처럼 'publish'를 'future'로 바꿉니다.
+        """
+        with self.lock:
+            if post_id is None:
+                post_id = self._allocate_id()
+                post = self.posts[post_id] = {"id": post_id, "title": "", "content": "", "status": "draft",
+                                              "date_gmt": None, "slug": "", "categories": [], "tags": []}
+            else:
+                post = self.posts.get(post_id)
+                if post is None:
+                    return None
+            for key in ("title", "content", "status", "slug", "categories", "tags"):
+                if key in fields:
+                    post[key] = fields[key]
+            date_gmt = fields.get("date_gmt") or fields.get("date")
+            post["date_gmt"] = parse_date(date_gmt) if date_gmt else (post["date_gmt"] or datetime.now(timezone.utc))
+            if post["status"] == "publish" and post["date_gmt"] > datetime.now(timezone.utc):
+                post["status"] = "future"
+            return self.post_response(base_url, post)
+
+    @staticmethod
+    def post_response(base_url, post):
+        date = post["date_gmt"].strftime('%Y-%m-%dT%H:%M:%S')
+        return {
+            "id": post["id"],
+            "date": date,
+            "date_gmt": date,
+            "status": post["status"],
+            "link": f"{base_url}/?p={post['id']}",
+            "slug": post["slug"],
+            "categories": post["categories"],
+            "tags": post["tags"],
+            "title": {"raw": post["title"], "rendered": html.escape(post["title"])},
+            "content": {"raw": post["content"], "rendered": post["content"]},
+        }
+
+    def search_terms(self, taxonomy, search):
+        """이름에 search가 들어간 분류 목록을 REST 응답 형식(이름은 HTML 이스케이프)으로 반환합니다."""
+        with self.lock:
+            return [{"id": term_id, "name": html.escape(name), "taxonomy": taxonomy}
+                    for term_id, name in self.terms[taxonomy].items() if search.lower() in name.lower()]
+
+    def term_id(self, taxonomy, name, create=True):
+        """이름이 같은 분류의 ID를 반환하고, 없으면 새로 만듭니다. (create=False이면 None)"""
+        with self.lock:
+            for term_id, existing in self.terms[taxonomy].items():
+                if existing.lower() == name.lower():
+                    return term_id
+            if not create:
+                return None
+            term_id = self._allocate_id()
+            self.terms[taxonomy][term_id] = name
+            return term_id
+
+    def add_media(self, base_url, file_name, mime_type, data):
+        with self.lock:
+            media_id = self._allocate_id()
+            path = f"/wp-content/uploads/mock/{media_id}-{quote(file_name)}"
+            self.media[path] = (mime_type, data)
+        return {"id": media_id, "source_url": base_url + path, "media_type": "image", "mime_type": mime_type}
+
+
+def parse_date(value):
+    """REST/XML-RPC 날짜(시간대가 없으면 UTC로 간주)를 UTC datetime으로 바꿉니다."""
+    if isinstance(value, xmlrpc.client.DateTime):
+        value = datetime.strptime(value.value, "%Y%m%dT%H:%M:%S")
+    elif isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class MockWordPressHandler(BaseHTTPRequestHandler):
+    """모의 WordPress 요청 처리기 (HTTP/1.1 keep-alive)"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "MockWordPress/1.0"
+
+    @property
+    def state(self):
+        return self.server.state
+
+    @property
+    def base_url(self):
+        return f"http://{self.headers.get('Host') or '%s:%d' % self.server.server_address[:2]}"
+
+    def setup(self):
+        super().setup()
+        with self.server.state.lock:
+            self.server.state.connections += 1
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # --- 공통 ---
+
+    def delay(self, api=False):
+        latency = self.server.api_latency if api else self.server.latency
+        if latency > 0:
+            jitter = self.server.jitter
+            time.sleep(max(0.0, latency * (1 + random.uniform(-jitter, jitter))))
+
+    def send_body(self, status, body, content_type="text/html; charset=UTF-8", headers=None):
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or []):
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_json(self, status, payload):
+        self.send_body(status, json.dumps(payload, ensure_ascii=False), "application/json; charset=UTF-8")
+
+    def send_rest_error(self, status, code, message):
+        self.send_json(status, {"code": code, "message": message, "data": {"status": status}})
+
+    def redirect(self, location, headers=None):
+        self.send_body(302, "", headers=[("Location", location)] + (headers or []))
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def is_logged_in(self):
+        cookies = self.headers.get("Cookie", "")
+        match = re.search(rf"{LOGIN_COOKIE}=([0-9a-f]+)", cookies)
+        return bool(match) and match.group(1) in self.state.sessions
+
+    def rest_access_error(self):
+        """--disable로 꺼 둔 기능에 해당하는 요청이면 (상태, 코드, 메시지)를, 아니면 None을 반환합니다.
+
+        REST API를 꺼 둔 사이트도 로그인한 사용자(쿠키)의 요청은 받습니다. (블록 에디터가 쓰므로)
+        """
+        disabled = self.server.disabled
+        if disabled == "rest" and not self.is_logged_in():
+            return DISABLED_FEATURE_ERRORS["rest"]
+        if disabled == "application_passwords" and self.headers.get("Authorization", "").startswith("Basic "):
+            return DISABLED_FEATURE_ERRORS["application_passwords"]
+        return None
+
+    def is_api_authorized(self):
+        """Basic 인증(애플리케이션 비밀번호) 또는 로그인 쿠키 + nonce를 확인합니다."""
+        auth = self.headers.get("Authorization", "")
+        if auth.startswith("Basic "):
+            try:
+                username, _, password = base64.b64decode(auth[6:]).decode('utf-8').partition(':')
+            except Exception:
+                return False
+            return self.state.check_password(username, password, app_password_only=True)
+        return self.is_logged_in() and self.headers.get("X-WP-Nonce") == self.state.nonce
+
+    # --- 요청 분배 ---
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path
+        query = parse_qs(parsed.query)
+        if path.startswith("/wp-json"):
+            self.delay(api=True)
+            self.state.count("GET " + path)
+            error = self.rest_access_error()
+            if error:
+                return self.send_rest_error(*error)
+            return self.handle_rest_get(path, query)
+
+        self.delay()
+        self.state.count("GET " + path)
+        if path in ("/", "/index.php"):
+            return self.send_body(200, "<!DOCTYPE html><html><body><h1>Mock WordPress</h1></body></html>")
+        if path == "/wp-login.php":
+            redirect_to = query.get("redirect_to", ["/wp-admin/"])[0]
+            return self.send_body(200, self.login_page(redirect_to))
+        if path.startswith("/wp-admin"):
+            if not self.is_logged_in():
+                return self.redirect(f"/wp-login.php?redirect_to={quote(self.base_url + self.path, safe='')}&reauth=1")
+            if path in ("/wp-admin", "/wp-admin/", "/wp-admin/index.php"):
+                return self.send_body(200, self.admin_page("알림판", "<p>WordPress에 오신 것을 환영합니다!</p>"))
+            if path == "/wp-admin/edit.php":
+                return self.send_body(200, self.posts_list_page())
+            if path == "/wp-admin/post-new.php":
+                return self.send_body(200, self.editor_page())
+            return self.send_body(404, self.admin_page("오류", "<p>페이지를 찾을 수 없습니다.</p>"))
+        if path in self.state.media:
+            mime_type, data = self.state.media[path]
+            return self.send_body(200, data, mime_type)
+        return self.send_body(404, "<!DOCTYPE html><html><body>Not Found</body></html>")
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        body = self.read_body()
+        if path.startswith("/wp-json") or path == "/xmlrpc.php":
+            self.delay(api=True)
+            self.state.count("POST " + path)
+            if path == "/xmlrpc.php":
+                return self.handle_xmlrpc(body)
+            error = self.rest_access_error()
+            if error:
+                return self.send_rest_error(*error)
+            return self.handle_rest_post(path, body)
+
+        self.delay()
+        self.state.count("POST " + path)
+        if path == "/wp-login.php":
+            return self.handle_login(body)
+        return self.send_body(404, "<!DOCTYPE html><html><body>Not Found</body></html>")
+
+    # --- 로그인 / 관리자 화면 ---
+
+    def handle_login(self, body):
+        form = parse_qs(body.decode('utf-8'))
+        username = form.get("log", [""])[0]
+        password = form.get("pwd", [""])[0]
+        redirect_to = form.get("redirect_to", ["/wp-admin/"])[0] or "/wp-admin/"
+        if username != self.state.username or password != self.state.password:
+            error = "<strong>오류</strong>: 사용자명 또는 비밀번호가 올바르지 않습니다."
+            return self.send_body(200, self.login_page(redirect_to, error))
+
+        cookie = f"{LOGIN_COOKIE}={self.state.new_session()}; Path=/; HttpOnly"
+        if form.get("rememberme"):
+            cookie += "; Max-Age=1209600"
+        self.redirect(redirect_to, [("Set-Cookie", cookie)])
+
+    def login_page(self, redirect_to, error=None):
+        error_html = f'<div id="login_error" class="notice notice-error">{error}</div>' if error else ""
+        return f"""<!DOCTYPE html>
+<html lang="ko-KR"><head><meta charset="UTF-8"><title>로그인 &lsaquo; Mock WordPress</title></head>
+<body class="login no-js login-action-login wp-core-ui">
+<div id="login">
+  <h1><a href="/">Mock WordPress</a></h1>
+  {error_html}
+  <form name="loginform" id="loginform" action="/wp-login.php" method="post">
+    <p><label for="user_login">사용자명 또는 이메일 주소</label>
+      <input type="text" name="log" id="user_login" class="input" value="" size="20" autocapitalize="off" autocomplete="username" required></p>
+    <div class="user-pass-wrap"><label for="user_pass">비밀번호</label>
+      <input type="password" name="pwd" id="user_pass" class="input password-input" value="" size="20" autocomplete="current-password" required></div>
+    <p class="forgetmenot"><input name="rememberme" type="checkbox" id="rememberme" value="forever"> <label for="rememberme">기억하기</label></p>
+    <p class="submit">
+      <input type="submit" name="wp-submit" id="wp-submit" class="button button-primary button-large" value="로그인">
+      <input type="hidden" name="redirect_to" value="{html.escape(redirect_to)}">
+    </p>
+  </form>
+</div>
+</body></html>"""
+
+    def admin_page(self, title, content, body_class="index-php", head=""):
+        version_class = "version-" + self.server.wp_version.replace('.', '-')
+        return f"""<!DOCTYPE html>
+<html lang="ko-KR"><head><meta charset="UTF-8"><title>{title} &lsaquo; Mock WordPress</title>{head}</head>
+<body class="wp-admin wp-core-ui {body_class} {version_class} admin-color-fresh locale-ko-kr">
+<div id="wpwrap">
+{ADMIN_MENU_HTML}
+<div id="wpcontent"><div id="wpbody"><div id="wpbody-content"><div class="wrap">
+<h1 class="wp-heading-inline">{title}</h1>
+{content}
+</div></div></div></div>
+</div>
+</body></html>"""
+
+    def posts_list_page(self):
+        with self.state.lock:
+            posts = list(self.state.posts.values())
+        rows = "".join(
+            f'<tr id="post-{post["id"]}"><td class="title column-title">{html.escape(post["title"])}</td>'
+            f'<td class="status">{post["status"]}</td></tr>'
+            for post in reversed(posts[-50:])
+        )
+        content = ('<a href="/wp-admin/post-new.php" class="page-title-action">새로 추가</a>'
+                   f'<table class="wp-list-table widefat fixed striped posts"><tbody id="the-list">{rows}</tbody></table>')
+        return self.admin_page("글", content, body_class="edit-php")
+
+    def editor_page(self):
+        head = (f"<script>window.MOCK_WP_NONCE = {json.dumps(self.state.nonce)};</script>"
+                f"<script>{EDITOR_SCRIPT}</script>")
+        content = """
+<div class="edit-post-layout block-editor-editor-skeleton">
+  <div class="edit-post-header">
+    <button type="button" class="components-button block-editor-inserter__toggle has-icon" aria-label="블록 삽입기 전환">+</button>
+    <button type="button" class="components-button editor-post-publish-button" aria-label="발행">발행</button>
+  </div>
+  <div class="block-editor-inserter__menu" hidden>
+    <div class="block-editor-inserter__search components-search-control">
+      <input class="components-search-control__input" type="search" placeholder="검색" aria-label="검색">
+    </div>
+    <div class="block-editor-block-types-list">
+      <button type="button" class="components-button block-editor-block-types-list__item editor-block-list-item-html" aria-label="사용자 정의 HTML">사용자 정의 HTML</button>
+    </div>
+  </div>
+  <div class="editor-styles-wrapper block-editor-writing-flow" tabindex="0">
+    <div class="edit-post-visual-editor__post-title-wrapper">
+      <h1 class="wp-block wp-block-post-title editor-post-title editor-post-title__input block-editor-rich-text__editable"
+          contenteditable="true" role="textbox" aria-label="제목 추가"></h1>
+    </div>
+    <div class="block-editor-block-list__layout is-root-container"></div>
+  </div>
+</div>"""
+        return self.admin_page("새 글 추가", content, body_class="post-new-php block-editor-page", head=head)
+
+    # --- REST API ---
+
+    def handle_rest_get(self, path, query):
+        if path in ("/wp-json", "/wp-json/"):
+            return self.send_json(200, {"name": "Mock WordPress", "url": self.base_url, "namespaces": ["wp/v2"]})
+        match = re.fullmatch(r"/wp-json/wp/v2/(categories|tags)/?", path)
+        if match:
+            return self.send_json(200, self.state.search_terms(match.group(1), query.get("search", [""])[0]))
+        match = re.fullmatch(r"/wp-json/wp/v2/posts(?:/(\d+))?/?", path)
+        if not match:
+            return self.send_rest_error(404, "rest_no_route", "요청한 URL과 일치하는 경로가 없습니다.")
+        with self.state.lock:
+            if match.group(1):
+                post = self.state.posts.get(int(match.group(1)))
+                if post is None:
+                    return self.send_rest_error(404, "rest_post_invalid_id", "잘못된 글 ID입니다.")
+                return self.send_json(200, self.state.post_response(self.base_url, post))
+            posts = [self.state.post_response(self.base_url, post) for post in self.state.posts.values()]
+        return self.send_json(200, posts[::-1][:100])
+
+    def handle_rest_post(self, path, body):
+        if not self.is_api_authorized():
+            return self.send_rest_error(401, "rest_not_logged_in", "현재 로그인 상태가 아닙니다.")
+
+        if path.rstrip('/') == "/wp-json/wp/v2/media":
+            disposition = self.headers.get("Content-Disposition", "")
+            match = re.search(r'filename="?([^";]+)"?', disposition)
+            if not match or not body:
+                return self.send_rest_error(400, "rest_upload_no_data", "데이터가 제공되지 않았습니다.")
+            media = self.state.add_media(self.base_url, unquote(match.group(1)),
+                                         self.headers.get("Content-Type", "application/octet-stream"), body)
+            return self.send_json(201, media)
+
+        match = re.fullmatch(r"/wp-json/wp/v2/(posts|categories|tags)(?:/(\d+))?/?", path)
+        if not match:
+            return self.send_rest_error(404, "rest_no_route", "요청한 URL과 일치하는 경로가 없습니다.")
+        try:
+            fields = json.loads(body.decode('utf-8') or "{}")
+        except ValueError:
+            return self.send_rest_error(400, "rest_invalid_json", "잘못된 JSON 본문입니다.")
+        if match.group(1) != "posts":
+            name = str(fields.get("name") or "").strip()
+            if not name:
+                return self.send_rest_error(400, "rest_missing_callback_param", "필수 매개변수가 없습니다: name")
+            if self.state.term_id(match.group(1), name, create=False):
+                return self.send_rest_error(400, "term_exists", "같은 이름의 항목이 이미 있습니다.")
+            term_id = self.state.term_id(match.group(1), name)
+            return self.send_json(201, {"id": term_id, "name": html.escape(name), "taxonomy": match.group(1)})
+        post_id = int(match.group(2)) if match.group(2) else None
+        post = self.state.save_post(self.base_url, fields, post_id)
+        if post is None:
+            return self.send_rest_error(404, "rest_post_invalid_id", "잘못된 글 ID입니다.")
+        self.send_json(200 if post_id else 201, post)
+
+    # --- XML-RPC ---
+
+    def handle_xmlrpc(self, body):
+        response = self.server.xmlrpc_dispatcher._marshaled_dispatch(body)
+        self.send_body(200, response, "text/xml; charset=UTF-8")
+
+
+class MockWordPressServer:
+    """모의 WordPress 서버를 백그라운드 스레드에서 실행합니다.
+
+    with 문이나 start()/stop()으로 사용하며, port=0이면 빈 포트를 골라 url에 반영합니다.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, username="admin", password="password",
+                 app_password="abcd efgh ijkl mnop qrst uvwx", latency=0.0, api_latency=None, jitter=0.0,
+                 wp_version="6.4.2", verbose=False, disabled=None):
+        if disabled is not None and disabled not in DISABLED_FEATURE_ERRORS:
+            raise ValueError(f"끌 수 있는 기능이 아닙니다: {disabled} ({', '.join(DISABLED_FEATURE_ERRORS)})")
+        self.state = MockWordPressState(username, password, app_password)
+        self.httpd = ThreadingHTTPServer((host, port), MockWordPressHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = self.state
+        self.httpd.latency = latency
+        self.httpd.api_latency = latency if api_latency is None else api_latency
+        self.httpd.jitter = jitter
+        self.httpd.wp_version = wp_version
+        self.httpd.verbose = verbose
+        self.httpd.disabled = disabled
+        self.httpd.xmlrpc_dispatcher = self._create_xmlrpc_dispatcher()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _create_xmlrpc_dispatcher(self):
+        dispatcher = SimpleXMLRPCDispatcher(allow_none=True, encoding="utf-8")
+        dispatcher.register_multicall_functions()
+
+        def new_post(blog_id, username, password, content):
+            if not self.state.check_password(username, password):
+                raise xmlrpc.client.Fault(403, "사용자명 또는 비밀번호가 올바르지 않습니다.")
+            fields = {
+                "title": content.get("post_title", ""),
+                "content": content.get("post_content", ""),
+                "status": content.get("post_status", "draft"),
+            }
+            if content.get("post_date_gmt"):
+                fields["date_gmt"] = content["post_date_gmt"]
+            if content.get("post_name"):
+                fields["slug"] = content["post_name"]
+            # terms_names의 없는 분류는 WordPress처럼 새로 만듭니다.
+            for taxonomy, key in (("category", "categories"), ("post_tag", "tags")):
+                names = (content.get("terms_names") or {}).get(taxonomy)
+                if names:
+                    fields[key] = [self.state.term_id(key, name) for name in names]
+            return str(self.state.save_post(self.url, fields)["id"])
+
+        dispatcher.register_function(new_post, "wp.newPost")
+        return dispatcher
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self):
+        """요청 수, 연결 수, 글/미디어 수를 반환합니다."""
+        with self.state.lock:
+            return {
+                "requests": dict(self.state.request_counts),
+                "connections": self.state.connections,
+                "posts": len(self.state.posts),
+                "media": len(self.state.media),
+            }
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="wordpress_auto_login.py 테스트용 모의 WordPress 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--app-password", default="abcd efgh ijkl mnop qrst uvwx",
+                        help="REST API / XML-RPC용 애플리케이션 비밀번호")
+    parser.add_argument("--latency", type=float, default=0.0, help="페이지 요청마다 더할 지연 시간(초)")
+    parser.add_argument("--api-latency", type=float, default=None,
+                        help="wp-json / xmlrpc.php 요청 지연 시간(초, 기본: --latency와 같음)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 시간 변동 비율 (예: 0.2 = ±20%%)")
+    parser.add_argument("--wp-version", default="6.4.2")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    parser.add_argument("--disable", choices=list(DISABLED_FEATURE_ERRORS), default=None,
+                        help="REST API(rest) 또는 애플리케이션 비밀번호(application_passwords)를 꺼 둔 사이트로 동작")
+    args = parser.parse_args()
+
+    server = MockWordPressServer(args.host, args.port, args.username, args.password, args.app_password,
+                                 args.latency, args.api_latency, args.jitter, args.wp_version, args.verbose,
+                                 args.disable)
+    print(f"모의 WordPress 서버: {server.url} (아이디 {args.username}, 비밀번호 {args.password}, "
+          f"앱 비밀번호 {args.app_password})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WordPress 발행 벤치마크
+모의 WordPress 서버(wordpress_mock_server.py)를 띄우고 발행 방식마다 본문 크기가 다른 글 N개를 발행합니다.
+단계별(로그인, 에디터 준비, 제목, 본문, 저장, 전체) p50/p95/p99, 분당 발행 수, 최대 메모리(RSS)를 JSON으로 저장해
+변경 전후 결과를 비교할 수 있게 합니다.
+
+발행 방식마다 별도 프로세스에서 실행하므로 최대 RSS가 서로 섞이지 않습니다.
+
+사용법:
+    python wordpress_publish_benchmark.py --posts 50
+    python wordpress_publish_benchmark.py --posts 20 --paths selenium_batch selenium_pool --latency 0.05
+    python wordpress_publish_benchmark.py --baseline benchmark-20251020-120000.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+import wordpress_auto_login as app_module
+from wordpress_mock_server import MockWordPressServer
+
+
+# 벤치마크할 발행 방식 (브라우저 방식은 Selenium과 Chrome이 필요)
+BENCHMARK_PATHS = ("rest", "rest_async", "xmlrpc", "selenium_batch", "selenium_pool")
+BROWSER_PATHS = ("selenium_batch", "selenium_pool")
+
+# 글 본문 크기(바이트, 대략): 글마다 차례로 돌아가며 사용
+DEFAULT_BODY_SIZES = (1000, 10000, 50000, 100000)
+
+# 보고 단계 -> 실행 기록의 profile_step 이름 (글 하나 안에서 합산)
+STAGE_STEPS = {
+    "login": ("브라우저 시작", "로그인"),
+    "editor_ready": ("글 작성 페이지 이동", "에디터 로드"),
+    "title": ("제목",),
+    "content": ("본문", "스토어 입력"),
+    "save": ("편집 완료", "저장"),
+}
+STAGES = tuple(STAGE_STEPS) + ("total",)
+
+# 기준 결과보다 이 비율 이상 나빠지면 회귀로 표시
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+class StepRecorder:
+    """RunLog 대신 step/post 이벤트를 스레드 이름과 함께 메모리에 모읍니다."""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def write(self, event, **fields):
+        if event in ("step", "post"):
+            with self._lock:
+                self.events.append(dict(fields, event=event, thread=threading.current_thread().name))
+
+    def close(self):
+        pass
+
+    def stage_samples(self):
+        """글 하나(또는 로그인 한 번)마다 단계별 소요 시간 합을 모아 {단계: [초, ...]}로 반환합니다.
+
+        한 스레드의 step 이벤트는 차례로 쌓이므로, 같은 스레드의 다음 post 이벤트까지를 글 하나로 봅니다.
+        """
+        samples = {stage: [] for stage in STAGES}
+        segments = {}
+
+        def flush(steps):
+            for stage, names in STAGE_STEPS.items():
+                durations = [step["duration"] for step in steps if step["step"] in names]
+                if durations:
+                    samples[stage].append(sum(durations))
+
+        for event in self.events:
+            steps = segments.setdefault(event["thread"], [])
+            if event["event"] == "step":
+                steps.append(event)
+            else:
+                flush(steps)
+                steps.clear()
+                samples["total"].append(event["duration"])
+        for steps in segments.values():
+            flush(steps)
+        return samples
+
+
+def percentile(values, q):
+    """정렬된 values의 q(0~100) 백분위수를 선형 보간으로 구합니다."""
+    if not values:
+        return None
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(values):
+    """소요 시간 목록의 개수, 평균, p50/p95/p99, 최댓값(초)을 반환합니다."""
+    if not values:
+        return None
+    values = sorted(values)
+    summary = {"count": len(values), "mean": sum(values) / len(values)}
+    for q in (50, 95, 99):
+        summary[f"p{q}"] = percentile(values, q)
+    summary["max"] = values[-1]
+    return {key: round(value, 4) if isinstance(value, float) else value for key, value in summary.items()}
+
+
+def peak_rss_mb(who):
+    """이 프로세스(또는 종료된 자식 프로세스 중 가장 큰 것)의 최대 RSS(MB)를 반환합니다."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == "self" else resource.RUSAGE_CHILDREN)
+    # macOS는 바이트, Linux는 KB 단위입니다.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(usage.ru_maxrss / divisor, 1)
+
+
+def make_posts(directory, count, sizes):
+    """본문 크기가 sizes를 돌아가며 바뀌는 txt 글 count개를 만듭니다. (제목 / 빈 줄 / 본문 형식)"""
+    os.makedirs(directory, exist_ok=True)
+    paragraph = "<p>문단 {0}: 다람쥐 헌 쳇바퀴에 타고파. The quick brown fox jumps over the lazy dog {0}.</p>\n"
+    run_id = time.strftime('%Y%m%d%H%M%S')
+    for index in range(count):
+        size = sizes[index % len(sizes)]
+        parts = []
+        length = 0
+        while length < size:
+            part = paragraph.format(len(parts) + 1)
+            parts.append(part)
+            length += len(part.encode('utf-8'))
+        with open(os.path.join(directory, f"post-{index:04d}.txt"), 'w', encoding='utf-8') as f:
+            f.write(f"벤치마크 글 {index + 1} ({size // 1000}KB, {run_id})\n\n{''.join(parts)}")
+
+
+def run_path(path, server_url, credentials, posts_dir, work_dir, concurrency, verbose=False):
+    """발행 방식 하나로 폴더의 모든 글을 발행하고 측정 결과를 반환합니다. (자식 프로세스에서 실행)"""
+    if path in BROWSER_PATHS and not app_module.SELENIUM_AVAILABLE:
+        return {"skipped": "Selenium이 설치되지 않았습니다."}
+
+    # 사용자 세션 폴더(~/.wordpress_auto_login) 대신 임시 폴더에 세션·선택자 기억을 둡니다.
+    app_module.SESSION_BASE_DIR = work_dir
+    recorder = StepRecorder()
+    app = app_module.WordPressAutoLogin.headless(
+        server_url, credentials["username"], credentials["password"], posts_dir,
+        app_password=credentials["app_password"], run_log=recorder
+    )
+    app.ledger = app_module.PublishLedger(os.path.join(work_dir, "publish_ledger.sqlite3"))
+    app.pool_size = concurrency
+    app.async_concurrency = concurrency
+
+    started = time.perf_counter()
+    try:
+        if path == "rest":
+            publisher = app_module.WordPressRestPublisher(server_url, credentials["username"],
+                                                          credentials["app_password"])
+            app.publish_entries_via_rest(app.get_pending_post_entries(), publisher, concurrency)
+        elif path == "rest_async":
+            app.perform_async_rest_publish()
+        elif path == "xmlrpc":
+            app.perform_xmlrpc_publish()
+        elif path == "selenium_batch":
+            app.perform_batch_publish()
+        elif path == "selenium_pool":
+            app.perform_pool_publish()
+    finally:
+        elapsed = time.perf_counter() - started
+        if app.driver:
+            try:
+                app.driver.quit()
+            except Exception:
+                pass
+        app.ledger.close()
+        while not app.log_queue.empty():
+            line = app.log_queue.get()
+            if verbose:
+                print(line, end='')
+
+    samples = recorder.stage_samples()
+    posts = [event for event in recorder.events if event["event"] == "post"]
+    succeeded = sum(1 for event in posts if event["ok"])
+    return {
+        "posts": len(posts),
+        "succeeded": succeeded,
+        "failed": len(posts) - succeeded,
+        "elapsed": round(elapsed, 3),
+        "posts_per_minute": round(succeeded / elapsed * 60, 1) if elapsed > 0 else None,
+        "stages": {stage: summarize(samples[stage]) for stage in STAGES},
+        "peak_rss_mb": peak_rss_mb("self"),
+        "peak_child_rss_mb": peak_rss_mb("children"),
+    }
+
+
+def run_path_in_subprocess(path, server, posts_dir, work_dir, concurrency, verbose):
+    """발행 방식 하나를 별도 프로세스에서 실행하고 결과에 서버 쪽 요청·연결 수를 더합니다."""
+    result_file = os.path.join(work_dir, "result.json")
+    before = server.stats()
+    command = [sys.executable, os.path.abspath(__file__), "--run-path", path,
+               "--server-url", server.url, "--posts-dir", posts_dir, "--work-dir", work_dir,
+               "--concurrency", str(concurrency), "--result-file", result_file]
+    if verbose:
+        command.append("--verbose")
+    credentials = {"username": server.state.username, "password": server.state.password,
+                   "app_password": server.state.app_password}
+    completed = subprocess.run(command, env=dict(os.environ, BENCHMARK_CREDENTIALS=json.dumps(credentials)),
+                               stdout=None if verbose else subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if completed.returncode != 0 or not os.path.exists(result_file):
+        return {"error": (completed.stderr or "").strip().splitlines()[-1:] or ["알 수 없는 오류"]}
+
+    with open(result_file, 'r', encoding='utf-8') as f:
+        result = json.load(f)
+    after = server.stats()
+    result["server_requests"] = sum(after["requests"].values()) - sum(before["requests"].values())
+    result["server_connections"] = after["connections"] - before["connections"]
+    return result
+
+
+def format_seconds(value):
+    return "-" if value is None else f"{value * 1000:.0f}ms"
+
+
+def print_report(results):
+    """발행 방식별 요약 표를 출력합니다."""
+    for path, result in results.items():
+        print(f"\n[{path}]")
+        if "skipped" in result or "error" in result:
+            print(f"  건너뜀: {result.get('skipped') or result.get('error')}")
+            continue
+        print(f"  성공 {result['succeeded']}/{result['posts']}개, {result['elapsed']:.2f}초, "
+              f"분당 {result['posts_per_minute']}개, 최대 RSS {result['peak_rss_mb']}MB "
+              f"(자식 {result['peak_child_rss_mb']}MB), 요청 {result.get('server_requests')}개 / "
+              f"연결 {result.get('server_connections')}개")
+        print(f"  {'단계':<14}{'p50':>10}{'p95':>10}{'p99':>10}{'개수':>8}")
+        for stage in STAGES:
+            summary = result["stages"].get(stage)
+            if summary:
+                print(f"  {stage:<14}{format_seconds(summary['p50']):>10}{format_seconds(summary['p95']):>10}"
+                      f"{format_seconds(summary['p99']):>10}{summary['count']:>8}")
+
+
+def compare_with_baseline(results, baseline, threshold):
+    """기준 결과와 비교해 단계별 p95와 분당 발행 수가 threshold 이상 나빠진 항목을 출력하고 목록으로 반환합니다."""
+    regressions = []
+    print("\n기준 결과와 비교 (p95, 분당 발행 수):")
+    for path, result in results.items():
+        old = baseline.get("results", {}).get(path)
+        if not old or "stages" not in old or "stages" not in result:
+            continue
+        for stage in STAGES:
+            new_summary, old_summary = result["stages"].get(stage), old["stages"].get(stage)
+            if not new_summary or not old_summary or not old_summary["p95"]:
+                continue
+            change = new_summary["p95"] / old_summary["p95"] - 1
+            marker = "  ⚠️ 회귀" if change > threshold else ""
+            print(f"  {path}/{stage}: {format_seconds(old_summary['p95'])} -> "
+                  f"{format_seconds(new_summary['p95'])} ({change:+.1%}){marker}")
+            if marker:
+                regressions.append(f"{path}/{stage}")
+        if old.get("posts_per_minute") and result.get("posts_per_minute"):
+            change = result["posts_per_minute"] / old["posts_per_minute"] - 1
+            marker = "  ⚠️ 회귀" if change < -threshold else ""
+            print(f"  {path}/분당 발행 수: {old['posts_per_minute']} -> {result['posts_per_minute']} "
+                  f"({change:+.1%}){marker}")
+            if marker:
+                regressions.append(f"{path}/posts_per_minute")
+    return regressions
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="모의 WordPress 서버로 발행 방식별 속도를 측정합니다.")
+    parser.add_argument("--posts", type=int, default=20, help="발행 방식마다 발행할 글 수")
+    parser.add_argument("--paths", nargs="+", choices=BENCHMARK_PATHS, default=list(BENCHMARK_PATHS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_BODY_SIZES),
+                        help="본문 크기(바이트) 목록, 글마다 차례로 사용")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 요청 수 / 병렬 브라우저 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="모의 서버 페이지 지연(초)")
+    parser.add_argument("--api-latency", type=float, default=None, help="모의 서버 API 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="지연 변동 비율")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본: benchmark-날짜-시각.json)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="회귀로 볼 악화 비율 (기본 0.1 = 10%%)")
+    parser.add_argument("--verbose", action="store_true", help="발행 로그 출력")
+    # 내부용: 발행 방식 하나를 실행하는 자식 프로세스
+    parser.add_argument("--run-path", help=argparse.SUPPRESS)
+    parser.add_argument("--server-url", help=argparse.SUPPRESS)
+    parser.add_argument("--posts-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_path:
+        credentials = json.loads(os.environ["BENCHMARK_CREDENTIALS"])
+        result = run_path(args.run_path, args.server_url, credentials, args.posts_dir, args.work_dir,
+                          args.concurrency, args.verbose)
+        with open(args.result_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        return 0
+
+    base_dir = tempfile.mkdtemp(prefix="wp-benchmark-")
+    results = {}
+    try:
+        posts_dir = os.path.join(base_dir, "posts")
+        make_posts(posts_dir, args.posts, args.sizes)
+        with MockWordPressServer(latency=args.latency, api_latency=args.api_latency, jitter=args.jitter) as server:
+            print(f"모의 서버 {server.url}에서 글 {args.posts}개로 측정합니다: {', '.join(args.paths)}")
+            for path in args.paths:
+                work_dir = os.path.join(base_dir, path)
+                os.makedirs(work_dir)
+                print(f"  {path} 실행 중...", flush=True)
+                results[path] = run_path_in_subprocess(path, server, posts_dir, work_dir,
+                                                       args.concurrency, args.verbose)
+    finally:
+        shutil.rmtree(base_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "created_at": time.strftime('%Y-%m-%dT%H:%M:%S'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "posts": args.posts,
+            "sizes": args.sizes,
+            "concurrency": args.concurrency,
+            "latency": args.latency,
+            "api_latency": args.api_latency,
+            "jitter": args.jitter,
+        },
+        "results": results,
+    }
+    print_report(results)
+
+    output = args.output or f"benchmark-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과를 저장했습니다: {output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_with_baseline(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n❌ 회귀 {len(regressions)}건: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())